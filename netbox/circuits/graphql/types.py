@@ -6,6 +6,7 @@ import strawberry_django
 from circuits import models
 from dcim.graphql.mixins import CabledObjectMixin
 from extras.graphql.mixins import ContactsMixin, CustomFieldsMixin, TagsMixin
+from netbox.graphql.loaders import GenericObjectLoader, get_loader
 from netbox.graphql.types import BaseObjectType, NetBoxObjectType, ObjectType, OrganizationalObjectType
 from tenancy.graphql.types import TenantType
 from .filters import *
@@ -77,14 +78,14 @@ class CircuitTerminationType(CustomFieldsMixin, TagsMixin, CabledObjectMixin, Ob
     circuit: Annotated["CircuitType", strawberry.lazy('circuits.graphql.types')]
 
     @strawberry_django.field
-    def termination(self) -> Annotated[Union[
+    def termination(self, info) -> Annotated[Union[
         Annotated["LocationType", strawberry.lazy('dcim.graphql.types')],
         Annotated["RegionType", strawberry.lazy('dcim.graphql.types')],
         Annotated["SiteGroupType", strawberry.lazy('dcim.graphql.types')],
         Annotated["SiteType", strawberry.lazy('dcim.graphql.types')],
         Annotated["ProviderNetworkType", strawberry.lazy('circuits.graphql.types')],
     ], strawberry.union("CircuitTerminationTerminationType")] | None:
-        return self.termination
+        return get_loader(info, GenericObjectLoader, 'termination').load(self)
 
 
 @strawberry_django.type(
@@ -1,7 +1,10 @@
+import json
 import logging
 import os
 import re
+import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
 from urllib.parse import urlparse
@@ -26,8 +29,45 @@ __all__ = (
 logger = logging.getLogger('netbox.data_backends')
 
 
+def get_manifest(root):
+    """
+    Return a dictionary mapping the path of each file beneath the root (excluding any within a top-level hidden
+    directory) to its modification time (in nanoseconds) and size.
+    """
+    manifest = {}
+    for path, dir_names, file_names in os.walk(root):
+        path = os.path.relpath(path, root)
+        if path == '.':
+            path = ''
+        elif path.startswith('.'):
+            dir_names.clear()
+            continue
+        for file_name in file_names:
+            file_path = os.path.join(path, file_name)
+            stat = os.stat(os.path.join(root, file_path))
+            manifest[file_path] = [stat.st_mtime_ns, stat.st_size]
+    return manifest
+
+
+class ManifestMixin:
+    """
+    Detect changed files by comparing the modification time and size of each file with those recorded by the
+    previous synchronization.
+    """
+    def get_changes(self, local_path, previous_state=None):
+        manifest = get_manifest(local_path)
+        if not previous_state or 'manifest' not in previous_state:
+            return {'manifest': manifest}, None
+        previous_manifest = previous_state['manifest']
+        changed_paths = {
+            path for path in manifest.keys() | previous_manifest.keys()
+            if manifest.get(path) != previous_manifest.get(path)
+        }
+        return {'manifest': manifest}, changed_paths
+
+
 @register_data_backend()
-class LocalBackend(DataBackend):
+class LocalBackend(ManifestMixin, DataBackend):
     name = 'local'
     label = _('Local')
     is_local = True
@@ -85,43 +125,138 @@ class GitBackend(DataBackend):
 
         return config
 
-    @contextmanager
-    def fetch(self):
-        from dulwich import porcelain
-
-        local_path = tempfile.TemporaryDirectory()
-
-        clone_args = {
-            "branch": self.params.get('branch'),
+    def get_client_args(self):
+        """
+        Return the keyword arguments for the git client.
+        """
+        client_args = {
             "config": self.config,
-            "errstream": porcelain.NoneStream(),
         }
 
         # check if using socks for proxy - if so need to use custom pool_manager
         if self.socks_proxy:
-            clone_args['pool_manager'] = ProxyPoolManager(self.socks_proxy)
+            client_args['pool_manager'] = ProxyPoolManager(self.socks_proxy)
 
         if self.url_scheme in ('http', 'https'):
             if self.params.get('username'):
-                clone_args.update(
+                client_args.update(
                     {
                         "username": self.params.get('username'),
                         "password": self.params.get('password'),
                     }
                 )
+
+        return client_args
+
+    def clone(self, local_path):
+        from dulwich import porcelain
+
+        clone_args = {
+            "branch": self.params.get('branch'),
+            "errstream": porcelain.NoneStream(),
+            **self.get_client_args(),
+        }
         if self.url_scheme:
             clone_args["quiet"] = True
             clone_args["depth"] = 1
 
         logger.debug(f"Cloning git repo: {self.url}")
+        porcelain.clone(self.url, local_path, **clone_args)
+
+    def pull(self, local_path):
+        """
+        Fetch the configured branch (or the remote HEAD) into an existing clone and check it out.
+        """
+        from dulwich import porcelain
+        from dulwich.client import get_transport_and_path
+        from dulwich.repo import Repo
+
+        logger.debug(f"Updating git repo: {self.url}")
+        with Repo(local_path) as repo:
+            client, path = get_transport_and_path(self.url, **self.get_client_args())
+            result = client.fetch(path, repo, depth=1 if self.url_scheme else None)
+            if branch := self.params.get('branch'):
+                ref = f'refs/heads/{branch}'.encode()
+            else:
+                ref = b'HEAD'
+            if ref not in result.refs:
+                raise SyncError(_("Reference not found: {ref}").format(ref=ref.decode()))
+            old_tree = repo[repo.head()].tree
+            new_commit = result.refs[ref]
+            porcelain.reset(repo, 'hard', new_commit)
+
+            # Remove any files which have been deleted from the working tree
+            for (old_path, new_path), _modes, _shas in repo.object_store.tree_changes(old_tree, repo[new_commit].tree):
+                if new_path is None and os.path.isfile(file_path := os.path.join(local_path, old_path.decode())):
+                    os.unlink(file_path)
+
+    def is_clone(self, local_path):
+        """
+        Return True if the local path contains a clone of the configured repository.
+        """
+        from dulwich.errors import NotGitRepository
+        from dulwich.repo import Repo
+
+        try:
+            with Repo(local_path) as repo:
+                return repo.get_config().get((b'remote', b'origin'), b'url').decode() == self.url
+        except (NotGitRepository, KeyError):
+            return False
+
+    @contextmanager
+    def fetch(self):
+        # Clone the repository to a temporary directory if no persistent cache directory has been designated
+        if self.cache_path is None:
+            local_path = tempfile.TemporaryDirectory()
+            try:
+                self.clone(local_path.name)
+            except BaseException as e:
+                raise SyncError(
+                    _("Fetching remote data failed ({name}): {error}").format(name=type(e).__name__, error=e)
+                )
+
+            yield local_path.name
+
+            local_path.cleanup()
+            return
+
+        # Update the existing clone (if any), or clone the repository anew
         try:
-            porcelain.clone(self.url, local_path.name, **clone_args)
+            if self.is_clone(self.cache_path):
+                self.pull(self.cache_path)
+            else:
+                shutil.rmtree(self.cache_path, ignore_errors=True)
+                Path(self.cache_path).mkdir(parents=True)
+                self.clone(self.cache_path)
         except BaseException as e:
             raise SyncError(_("Fetching remote data failed ({name}): {error}").format(name=type(e).__name__, error=e))
 
-        yield local_path.name
+        yield self.cache_path
+
+    def get_changes(self, local_path, previous_state=None):
+        """
+        Return the paths which differ between the trees of the previously synchronized commit and the current HEAD.
+        """
+        from dulwich.repo import Repo
 
-        local_path.cleanup()
+        with Repo(local_path) as repo:
+            head = repo.head()
+            state = {'commit': head.decode()}
+            if not previous_state or 'commit' not in previous_state:
+                return state, None
+            previous_commit = previous_state['commit'].encode()
+            if previous_commit == head:
+                return state, set()
+            if previous_commit not in repo.object_store:
+                return state, None
+
+            changed_paths = set()
+            for (old_path, new_path), _modes, _shas in repo.object_store.tree_changes(
+                repo[previous_commit].tree, repo[head].tree
+            ):
+                changed_paths.update(path.decode() for path in (old_path, new_path) if path is not None)
+
+        return state, changed_paths
 
 
 @register_data_backend()
@@ -142,19 +277,46 @@ class S3Backend(DataBackend):
 
     REGION_REGEX = r's3\.([a-z0-9-]+)\.amazonaws\.com'
 
+    # The maximum number of objects to download concurrently
+    max_workers = 10
+
+    # The file (relative to the cache directory) in which the ETag & size of each downloaded object are recorded
+    INDEX_FILE = '.netbox/objects.json'
+
     def init_config(self):
         from botocore.config import Config as Boto3Config
 
         # Initialize backend config
         return Boto3Config(
             proxies=resolve_proxies(url=self.url, context={'client': self}),
+            max_pool_connections=self.max_workers,
         )
 
+    def _read_index(self, local_path):
+        try:
+            with open(os.path.join(local_path, self.INDEX_FILE)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, local_path, index):
+        index_file = os.path.join(local_path, self.INDEX_FILE)
+        Path(os.path.dirname(index_file)).mkdir(parents=True, exist_ok=True)
+        with open(f'{index_file}.tmp', 'w') as f:
+            json.dump(index, f)
+        os.replace(f'{index_file}.tmp', index_file)
+
     @contextmanager
     def fetch(self):
         import boto3
 
-        local_path = tempfile.TemporaryDirectory()
+        if self.cache_path is None:
+            tmp_dir = tempfile.TemporaryDirectory()
+            local_path = tmp_dir.name
+        else:
+            tmp_dir = None
+            local_path = self.cache_path
+            Path(local_path).mkdir(parents=True, exist_ok=True)
 
         # Initialize the S3 resource and bucket
         aws_access_key_id = self.params.get('aws_access_key_id')
@@ -169,16 +331,59 @@ class S3Backend(DataBackend):
         )
         bucket = s3.Bucket(self._bucket_name)
 
-        # Download all files within the specified path
+        # List all objects within the specified path. Any object for which the ETag & size match those recorded when
+        # it was last downloaded is retained from the cache.
+        previous_index = self._read_index(local_path)
+        self.index = {}
+        pending_keys = []
         for obj in bucket.objects.filter(Prefix=self._remote_path):
-            local_filename = os.path.join(local_path.name, obj.key)
+            if obj.key.endswith('/'):
+                # Skip directory placeholders
+                continue
+            self.index[obj.key] = [obj.e_tag, obj.size]
+            local_filename = os.path.join(local_path, obj.key)
+            if previous_index.get(obj.key) != self.index[obj.key] or not os.path.isfile(local_filename):
+                pending_keys.append(obj.key)
+        logger.debug(f"Downloading {len(pending_keys)} of {len(self.index)} objects")
+
+        # Download all new & modified objects concurrently (the low-level client is thread-safe)
+        def download(key):
+            local_filename = os.path.join(local_path, key)
             # Build local path
             Path(os.path.dirname(local_filename)).mkdir(parents=True, exist_ok=True)
-            bucket.download_file(obj.key, local_filename)
+            s3.meta.client.download_file(self._bucket_name, key, local_filename)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Consume the results to propagate any exceptions
+            list(executor.map(download, pending_keys))
 
-        yield local_path.name
+        if tmp_dir is None:
+            # Remove any previously downloaded files which no longer exist in the bucket. If no index has been recorded,
+            # check all files within the cache directory.
+            cached_keys = previous_index.keys() if previous_index else get_manifest(local_path).keys()
+            for key in cached_keys - self.index.keys():
+                if os.path.isfile(local_filename := os.path.join(local_path, key)):
+                    os.unlink(local_filename)
+            self._write_index(local_path, self.index)
 
-        local_path.cleanup()
+        yield local_path
+
+        if tmp_dir is not None:
+            tmp_dir.cleanup()
+
+    def get_changes(self, local_path, previous_state=None):
+        """
+        Return the keys of all objects for which the ETag or size differs from that of the previous synchronization.
+        """
+        state = {'objects': self.index}
+        if not previous_state or 'objects' not in previous_state:
+            return state, None
+        previous_index = previous_state['objects']
+        changed_paths = {
+            key for key in self.index.keys() | previous_index.keys()
+            if self.index.get(key) != previous_index.get(key)
+        }
+        return state, changed_paths
 
     @property
     def _region_name(self):
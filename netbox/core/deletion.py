@@ -0,0 +1,251 @@
+from collections import defaultdict
+from operator import attrgetter
+
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
+from django.db import router, transaction
+from django.db.models import Model, prefetch_related_objects
+from django.db.models.fields.reverse_related import ManyToManyRel
+from django.utils.translation import gettext_lazy as _
+from django_prometheus.models import model_deletes, model_updates
+
+from core.choices import ObjectChangeActionChoices
+from core.events import *
+from extras.events import enqueue_event
+from extras.utils import is_taggable, run_validators
+from netbox.config import get_config
+from netbox.context import current_request, events_queue, pending_deletions
+from netbox.models.deletion import CustomCollector, DeleteMixin
+from netbox.models.features import ChangeLoggingMixin
+from utilities.counters import batch_counter_updates
+from utilities.exceptions import AbortRequest
+from .models import ObjectChange
+
+__all__ = (
+    'delete_objects',
+)
+
+
+def _get_key(instance):
+    return instance._meta.label_lower, instance.pk
+
+
+def _has_custom_delete(model):
+    """
+    Return True if the model overrides delete() to apply its own logic (e.g. deleting uploaded files), in which case
+    its instances must be deleted individually.
+    """
+    return model.delete not in (Model.delete, DeleteMixin.delete)
+
+
+def _prefetch_related_objects(instances):
+    """
+    Prefetch the objects referenced by a homogeneous list of instances (along with any assigned tags), so that they can
+    be serialized for change records and events without querying for each instance individually.
+    """
+    if len(instances) < 2:
+        return
+    model = instances[0]._meta.model
+    lookups = [
+        field.name for field in model._meta.get_fields()
+        if (field.many_to_one or field.one_to_one) and field.concrete or isinstance(field, GenericForeignKey)
+    ]
+    if is_taggable(model):
+        lookups.append('tags')
+    prefetch_related_objects(instances, *lookups)
+
+
+def _record_deletions(instances, request):
+    """
+    Create change records for the deletion of the given objects.
+    """
+    objectchanges = []
+    for instance in instances:
+        objectchange = instance.to_objectchange(ObjectChangeActionChoices.ACTION_DELETE)
+        objectchange.user = request.user
+        objectchange.user_name = request.user.username
+        objectchange.request_id = request.id
+        objectchanges.append(objectchange)
+    ObjectChange.objects.bulk_create(objectchanges, batch_size=1000)
+
+
+def _record_updates(instances, request):
+    """
+    Create change records for the modification of the given objects. If a change has already been recorded for an
+    object by this request (e.g. by a signal handler which saved the object during the deletion), that record is
+    updated instead.
+    """
+    if not instances:
+        return
+    prev_changes = {
+        (objectchange.changed_object_type_id, objectchange.changed_object_id): objectchange
+        for objectchange in ObjectChange.objects.filter(
+            request_id=request.id,
+            changed_object_id__in={instance.pk for instance in instances}
+        ).exclude(
+            action=ObjectChangeActionChoices.ACTION_DELETE
+        )
+    }
+    new_changes = []
+    updated_changes = []
+    for instance in instances:
+        objectchange = instance.to_objectchange(ObjectChangeActionChoices.ACTION_UPDATE)
+        key = (ContentType.objects.get_for_model(instance).pk, instance.pk)
+        if prev_change := prev_changes.get(key):
+            prev_change.postchange_data = objectchange.postchange_data
+            updated_changes.append(prev_change)
+        elif objectchange.has_changes:
+            objectchange.user = request.user
+            objectchange.user_name = request.user.username
+            objectchange.request_id = request.id
+            new_changes.append(objectchange)
+    ObjectChange.objects.bulk_update(updated_changes, ['postchange_data'], batch_size=1000)
+    ObjectChange.objects.bulk_create(new_changes, batch_size=1000)
+
+
+def delete_objects(objects, using=None):
+    """
+    Delete the given objects along with all of their dependents, returning the number of objects deleted (as
+    Model.delete() does). This yields the same result as deleting each object individually, but is far more efficient
+    for large deletions (e.g. a site with thousands of devices):
+
+    * The complete set of dependent objects is collected once, in batches, rather than once per object.
+    * Change records for all deleted objects, and for all objects whose references to them are nullified, are created
+      in bulk. Related objects are retrieved with one query per relationship rather than one query per object.
+    * References to deleted objects are nullified with a single UPDATE query per relationship, rather than by saving
+      each related object individually.
+    * Cached counters on surviving parent objects are updated with a single query per model.
+
+    Objects whose model overrides delete() are deleted individually.
+
+    Args:
+        objects: A QuerySet or list of objects of a single model
+        using: The database alias (defaults to the database used for writing the objects' model)
+    """
+    objects = list(objects)
+    if not objects:
+        return 0
+    model = objects[0]._meta.model
+    using = using or router.db_for_write(model)
+
+    if _has_custom_delete(model):
+        with transaction.atomic(using=using), batch_counter_updates():
+            for obj in objects:
+                if hasattr(obj, 'snapshot'):
+                    obj.snapshot()
+                obj.delete()
+        return len(objects)
+
+    request = current_request.get()
+    with transaction.atomic(using=using), batch_counter_updates():
+
+        # Collect all dependent objects. Raises ProtectedError or RestrictedError if any are protected from deletion.
+        collector = CustomCollector(using=using, origin=objects)
+        collector.collect(objects)
+        deleted_objects = {_get_key(instance): instance for _, instance in collector.instances_with_model()}
+
+        # Run any deletion protection rules for the collected objects
+        protection_rules = get_config().PROTECTION_RULES
+        for deleted_model, instances in collector.data.items():
+            if validators := protection_rules.get(deleted_model._meta.label_lower, []):
+                for instance in instances:
+                    try:
+                        run_validators(instance, validators)
+                    except ValidationError as e:
+                        raise AbortRequest(
+                            _("Deletion is prevented by a protection rule: {message}").format(message=e)
+                        )
+
+        # Objects which will be modified by the deletion, keyed by model label & PK
+        updated_objects = {}
+        # Field values to be set on each updated object once the deletion is complete
+        updated_fields = {}
+
+        if request is not None:
+
+            # Record the deletion of all collected change-logged objects, in the order in which they will be deleted
+            collector.sort()
+            changelogged_objects = []
+            for deleted_model, instances in collector.data.items():
+                if issubclass(deleted_model, ChangeLoggingMixin):
+                    instances = sorted(instances, key=attrgetter('pk'))
+                    _prefetch_related_objects(instances)
+                    for instance in instances:
+                        if not getattr(instance, '_prechange_snapshot', None):
+                            instance.snapshot()
+                    changelogged_objects.extend(instances)
+            _record_deletions(changelogged_objects, request)
+
+            # Snapshot all surviving change-logged objects which reference deleted objects via nullable foreign keys.
+            # Evaluating the collector's querysets here also means that the collector will update these objects by PK.
+            for (field, value), instances_list in collector.field_updates.items():
+                if not issubclass(field.model, ChangeLoggingMixin):
+                    continue
+                for instances in instances_list:
+                    for instance in instances:
+                        key = _get_key(instance)
+                        if key in deleted_objects:
+                            continue
+                        updated_objects.setdefault(key, instance)
+                        updated_fields.setdefault(key, {})[field.attname] = value
+
+            # Snapshot all surviving change-logged objects which reference deleted objects via many-to-many
+            # relationships. (Django deletes these assignments without sending the m2m_changed signal.)
+            for deleted_model, instances in collector.data.items():
+                pk_list = [instance.pk for instance in instances]
+                for relation in deleted_model._meta.related_objects:
+                    if type(relation) is not ManyToManyRel:
+                        continue
+                    related_model = relation.related_model
+                    if not issubclass(related_model, ChangeLoggingMixin):
+                        continue
+                    related_field_name = relation.remote_field.name
+                    for instance in related_model.objects.filter(**{f'{related_field_name}__in': pk_list}).distinct():
+                        key = _get_key(instance)
+                        if key not in deleted_objects:
+                            updated_objects.setdefault(key, instance)
+
+            updated_by_model = defaultdict(list)
+            for instance in updated_objects.values():
+                updated_by_model[instance._meta.model].append(instance)
+            for instances in updated_by_model.values():
+                _prefetch_related_objects(instances)
+                for instance in instances:
+                    instance.snapshot()
+
+            # Enqueue the deleted objects for event processing
+            queue = events_queue.get()
+            for instance in deleted_objects.values():
+                enqueue_event(queue, instance, request.user, request.id, OBJECT_DELETED)
+            events_queue.set(queue)
+
+        # Delete the collected objects. The per-object change logging performed by handle_deleted_object() is skipped
+        # for these, as it has been handled above.
+        token = pending_deletions.set(set(deleted_objects))
+        try:
+            deleted_count, _counts = collector.delete()
+        finally:
+            pending_deletions.reset(token)
+
+        if request is not None:
+
+            # Record the changes to all modified objects
+            for key, instance in updated_objects.items():
+                for attname, value in updated_fields.get(key, {}).items():
+                    setattr(instance, attname, value)
+            _record_updates(list(updated_objects.values()), request)
+
+            # Enqueue the modified objects for event processing
+            queue = events_queue.get()
+            for instance in updated_objects.values():
+                enqueue_event(queue, instance, request.user, request.id, OBJECT_UPDATED)
+            events_queue.set(queue)
+
+            # Increment metric counters
+            for deleted_model, instances in collector.data.items():
+                model_deletes.labels(deleted_model._meta.model_name).inc(len(instances))
+            for instance in updated_objects.values():
+                model_updates.labels(instance._meta.model_name).inc()
+
+    return deleted_count
@@ -1,14 +1,29 @@
 import logging
+import os
 import requests
+import re
 import sys
+import tempfile
+from contextlib import ExitStack
 
 from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import router, transaction
+from django.db.models import ProtectedError, RestrictedError
+
 from netbox.jobs import JobRunner, system_job
+from netbox.registry import registry
 from netbox.search.backends import search_backend
+from utilities.counters import batch_counter_updates
+from utilities.exceptions import AbortRequest, PermissionsViolation
 from utilities.proxy import resolve_proxies
 from .choices import DataSourceStatusChoices, JobIntervalChoices
-from .exceptions import SyncError
+from .deletion import delete_objects
+from .exceptions import JobFailed, SyncError
 from .models import DataSource
+from .signals import clear_events
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +52,184 @@ class SyncDataSourceJob(JobRunner):
             raise e
 
 
+class BulkImportJob(JobRunner):
+    """
+    Import objects in bulk on behalf of a BulkImportView.
+
+    Records are processed in chunks, each of which is committed within its own transaction. Progress is recorded on
+    the Job as each chunk completes. If a chunk fails validation, its changes are reverted and the job fails; any
+    previously committed chunks are retained.
+    """
+    chunk_size = 1000
+
+    class Meta:
+        name = 'Bulk Import'
+
+    def run(self, view_cls, records, request, headers=None, chunk_size=None, **kwargs):
+        """
+        Args:
+            view_cls: The BulkImportView subclass which handles the import
+            records: A list of dictionaries, each mapping field names to values for a single object
+            request: A copy of the request which initiated the import
+            headers: A dictionary mapping CSV column headers to related object accessors (if any)
+            chunk_size: The maximum number of records to commit in a single transaction
+        """
+        chunk_size = chunk_size or self.chunk_size
+
+        # Initialize the view and restrict its queryset per the user's permissions
+        view = view_cls()
+        view.setup(request)
+        view.queryset = view.get_queryset(request)
+        if not view.has_permission():
+            raise PermissionsViolation
+        model = view.queryset.model
+
+        self.job.data = {
+            'total': len(records),
+            'completed': 0,
+            'created': 0,
+            'updated': 0,
+            'errors': [],
+        }
+
+        for offset in range(0, len(records), chunk_size):
+            chunk = records[offset:offset + chunk_size]
+            updated = len([record for record in chunk if record.get('id')])
+
+            try:
+                with ExitStack() as stack:
+                    for request_processor in registry['request_processors']:
+                        stack.enter_context(request_processor(request))
+                    with transaction.atomic(using=router.db_for_write(model)), batch_counter_updates():
+                        view.import_records(chunk, request, headers=headers, start=offset + 1)
+            except ValidationError as e:
+                clear_events.send(sender=self)
+                self.job.data['errors'] = e.messages
+                raise JobFailed()
+            except (AbortRequest, PermissionsViolation) as e:
+                clear_events.send(sender=self)
+                self.job.data['errors'] = [str(e.message)]
+                raise JobFailed()
+
+            # Record the job's progress
+            self.job.data['completed'] += len(chunk)
+            self.job.data['created'] += len(chunk) - updated
+            self.job.data['updated'] += updated
+            self.job.save(update_fields=['data'])
+            logger.info(f"Imported {self.job.data['completed']}/{len(records)} {model._meta.verbose_name_plural}")
+
+
+class BulkDeleteJob(JobRunner):
+    """
+    Delete objects in bulk on behalf of a BulkDeleteView.
+
+    Objects are deleted in chunks, each of which is committed within its own transaction. Progress is recorded on the
+    Job as each chunk completes. If any object in a chunk is protected from deletion, the chunk is reverted and the job
+    fails; any previously committed chunks are retained.
+    """
+    chunk_size = 1000
+
+    class Meta:
+        name = 'Bulk Delete'
+
+    def run(self, view_cls, pk_list, request, chunk_size=None, **kwargs):
+        """
+        Args:
+            view_cls: The BulkDeleteView subclass which handles the deletion
+            pk_list: A list of the primary keys of the objects to be deleted
+            request: A copy of the request which initiated the deletion
+            chunk_size: The maximum number of objects to delete in a single transaction
+        """
+        chunk_size = chunk_size or self.chunk_size
+
+        # Initialize the view and restrict its queryset per the user's permissions
+        view = view_cls()
+        view.setup(request)
+        view.queryset = view.get_queryset(request)
+        if not view.has_permission():
+            raise PermissionsViolation
+        model = view.queryset.model
+
+        self.job.data = {
+            'total': len(pk_list),
+            'completed': 0,
+            'deleted': 0,
+            'errors': [],
+        }
+
+        for offset in range(0, len(pk_list), chunk_size):
+            chunk = pk_list[offset:offset + chunk_size]
+
+            try:
+                with ExitStack() as stack:
+                    for request_processor in registry['request_processors']:
+                        stack.enter_context(request_processor(request))
+                    # Objects which have already been deleted along with an earlier chunk are omitted
+                    deleted_count = delete_objects(view.queryset.filter(pk__in=chunk))
+            except (ProtectedError, RestrictedError) as e:
+                clear_events.send(sender=self)
+                self.job.data['errors'] = [str(e.args[0])]
+                raise JobFailed()
+            except (AbortRequest, PermissionsViolation) as e:
+                clear_events.send(sender=self)
+                self.job.data['errors'] = [str(e.message)]
+                raise JobFailed()
+
+            # Record the job's progress. The count of deleted objects includes any dependent objects.
+            self.job.data['completed'] += len(chunk)
+            self.job.data['deleted'] += deleted_count
+            self.job.save(update_fields=['data'])
+            logger.info(f"Deleted {self.job.data['completed']}/{len(pk_list)} {model._meta.verbose_name_plural}")
+
+
+class ExportJob(JobRunner):
+    """
+    Render an export on behalf of an ObjectListView and save it to a file which can be downloaded once the job has
+    completed.
+    """
+    class Meta:
+        name = 'Export'
+
+    def run(self, view_cls, request, **kwargs):
+        """
+        Args:
+            view_cls: The ObjectListView subclass which handles the export
+            request: A copy of the request which initiated the export
+        """
+        # Initialize the view and restrict its queryset per the user's permissions
+        view = view_cls()
+        view.setup(request)
+        view.queryset = view.get_queryset(request)
+        if not view.has_permission():
+            raise PermissionsViolation
+        response = view.get(request)
+        if response.status_code != 200:
+            raise JobFailed()
+
+        # Determine the name of the exported file
+        if match := re.search(r'filename="(.+)"', response.get('Content-Disposition', '')):
+            filename = os.path.basename(match.group(1))
+        else:
+            filename = 'export'
+
+        # Write the rendered export to a temporary file before saving it to storage
+        content = response.streaming_content if response.streaming else [response.content]
+        with tempfile.TemporaryFile() as f:
+            for chunk in content:
+                f.write(chunk)
+            size = f.tell()
+            f.seek(0)
+            path = default_storage.save(f'export-files/{self.job.job_id}/{filename}', File(f))
+
+        self.job.data = {
+            'file': path,
+            'filename': filename,
+            'content_type': response['Content-Type'],
+            'size': size,
+        }
+        logger.info(f"Saved export to {path} ({size} bytes)")
+
+
 @system_job(interval=JobIntervalChoices.INTERVAL_DAILY)
 class SystemHousekeepingJob(JobRunner):
     """
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.partitioning import get_partitions, is_partitioned, partition_table, unpartition_table
+
+
+class Command(BaseCommand):
+    help = "Convert the changelog (ObjectChange) table to a table partitioned by month"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--revert", action='store_true',
+            help="Convert a partitioned changelog table back to an ordinary table"
+        )
+
+    def handle(self, *args, **options):
+        partitioned = is_partitioned()
+
+        if options['revert']:
+            if not partitioned:
+                raise CommandError("The changelog table is not partitioned.")
+            self.stdout.write("Converting the changelog table to an ordinary table... ", ending='')
+            self.stdout.flush()
+            unpartition_table()
+            self.stdout.write("Done.", self.style.SUCCESS)
+            return
+
+        if partitioned:
+            raise CommandError("The changelog table is already partitioned.")
+        self.stdout.write("Converting the changelog table to a partitioned table... ", ending='')
+        self.stdout.flush()
+        partition_table()
+        self.stdout.write(f"Done. Created {len(get_partitions())} monthly partitions.", self.style.SUCCESS)
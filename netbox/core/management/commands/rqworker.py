@@ -1,5 +1,7 @@
 import logging
+import time
 
+from django.db import connections
 from django_rq.management.commands.rqworker import Command as _Command
 
 from netbox.registry import registry
@@ -15,6 +17,39 @@ class Command(_Command):
     Subclass django_rq's built-in rqworker to listen on all configured queues if none are specified (instead
     of only the 'default' queue).
     """
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            '--preload-scripts',
+            action='store_true',
+            help="Load all script modules before starting the worker, so that each job need not load them again"
+        )
+
+    def preload_scripts(self):
+        """
+        Load all script modules into the module cache. Work horses forked by the worker inherit the cached modules, and
+        thus reload only those modules which have since been modified.
+        """
+        from extras.models import ScriptModule
+
+        start_time = time.perf_counter()
+        count = 0
+        for script_module in ScriptModule.objects.all():
+            module_start_time = time.perf_counter()
+            try:
+                script_module.get_module()
+            except Exception as e:
+                logger.warning(f"Failed to preload script module {script_module}: {e}")
+                continue
+            count += 1
+            logger.debug(
+                f"Preloaded script module {script_module} in {(time.perf_counter() - module_start_time) * 1000:.1f}ms"
+            )
+        logger.info(f"Preloaded {count} script modules in {time.perf_counter() - start_time:.2f}s")
+
+        # Don't share database connections with forked work horses
+        connections.close_all()
+
     def handle(self, *args, **options):
         # Setup system jobs.
         for job, kwargs in registry['system_jobs'].items():
@@ -25,6 +60,9 @@ class Command(_Command):
             logger.debug(f"Scheduling system job {job.name} (interval={interval})")
             job.enqueue_once(**kwargs)
 
+        if options['preload_scripts']:
+            self.preload_scripts()
+
         # Run the worker with scheduler functionality
         options['with_scheduler'] = True
 
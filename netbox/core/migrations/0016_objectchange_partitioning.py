@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.db import migrations
+
+from core.partitioning import is_partitioned, partition_table, unpartition_table
+
+
+def partition_objectchange(apps, schema_editor):
+    """
+    Convert the ObjectChange table to a partitioned table if CHANGELOG_PARTITIONING is enabled.
+    """
+    if settings.CHANGELOG_PARTITIONING and not is_partitioned(schema_editor.connection):
+        partition_table(schema_editor.connection)
+
+
+def unpartition_objectchange(apps, schema_editor):
+    if is_partitioned(schema_editor.connection):
+        unpartition_table(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_remove_redundant_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            code=partition_objectchange,
+            reverse_code=unpartition_objectchange
+        ),
+    ]
@@ -1,6 +1,9 @@
 import hashlib
+import json
 import logging
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from fnmatch import fnmatchcase
 from urllib.parse import urlparse
 
@@ -9,7 +12,7 @@ from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
-from django.db import models
+from django.db import models, transaction
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.translation import gettext as _
@@ -153,9 +156,74 @@ class DataSource(JobsMixin, PrimaryModel):
 
         return objectchange
 
+    @property
+    def cache_path(self):
+        """
+        The persistent local directory in which the backend may retain data between synchronizations (if
+        DATA_SOURCE_CACHE_PATH has been set).
+        """
+        if settings.DATA_SOURCE_CACHE_PATH and self.pk:
+            return os.path.join(settings.DATA_SOURCE_CACHE_PATH, str(self.pk))
+
     def get_backend(self):
         backend_params = self.parameters or {}
-        return self.backend_class(self.source_url, **backend_params)
+        backend = self.backend_class(self.source_url, **backend_params)
+        backend.cache_path = self.cache_path
+        return backend
+
+    def _get_sync_key(self):
+        """
+        Return a digest of the attributes which determine the set of synchronized files. If any of these change, the
+        state recorded by the previous synchronization is disregarded.
+        """
+        attrs = [self.type, self.source_url, self.parameters, self.ignore_rules]
+        return hashlib.sha256(json.dumps(attrs, sort_keys=True, default=str).encode()).hexdigest()
+
+    def get_sync_state(self):
+        """
+        Return the backend state recorded by the previous synchronization, or None if it is unavailable or no longer
+        applicable.
+        """
+        if not self.cache_path:
+            return None
+        try:
+            with open(f'{self.cache_path}.json') as f:
+                sync_state = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # Disregard the recorded state if the source's configuration or its set of DataFiles has since changed
+        if sync_state.get('key') != self._get_sync_key() or sync_state.get('files') != self.datafiles.count():
+            return None
+
+        return sync_state.get('state')
+
+    def save_sync_state(self, state):
+        """
+        Record the backend state following a successful synchronization.
+        """
+        if not self.cache_path or state is None:
+            return
+        sync_state = {
+            'key': self._get_sync_key(),
+            'files': self.datafiles.count(),
+            'state': state,
+        }
+        os.makedirs(settings.DATA_SOURCE_CACHE_PATH, exist_ok=True)
+        with open(f'{self.cache_path}.json.tmp', 'w') as f:
+            json.dump(sync_state, f)
+        os.replace(f'{self.cache_path}.json.tmp', f'{self.cache_path}.json')
+
+    def clear_cache(self):
+        """
+        Delete any locally cached data & synchronization state.
+        """
+        if not self.cache_path:
+            return
+        shutil.rmtree(self.cache_path, ignore_errors=True)
+        for path in (f'{self.cache_path}.json', f'{self.cache_path}.json.tmp'):
+            if os.path.exists(path):
+                os.unlink(path)
 
     def sync(self):
         """
@@ -182,44 +250,67 @@ class DataSource(JobsMixin, PrimaryModel):
         with backend.fetch() as local_path:
 
             logger.debug(f'Syncing files from source root {local_path}')
-            data_files = self.datafiles.all()
+            state, changed_paths = backend.get_changes(local_path, self.get_sync_state())
+
+            if changed_paths is None:
+                # Check all files
+                data_files = list(self.datafiles.all())
+                candidate_paths = self._walk(local_path)
+            else:
+                # Check only those files which have changed since the previous sync
+                logger.debug(f'Found {len(changed_paths)} changed paths')
+                data_files = list(self.datafiles.filter(path__in=changed_paths))
+                candidate_paths = {
+                    path for path in changed_paths
+                    if not self._ignore_path(path) and os.path.isfile(os.path.join(local_path, path))
+                }
             known_paths = {df.path for df in data_files}
             logger.debug(f'Starting with {len(known_paths)} known files')
 
+            def refresh(datafile):
+                try:
+                    return datafile.refresh_from_disk(source_root=local_path)
+                except FileNotFoundError:
+                    return None
+
+            # Read & hash files concurrently
+            new_datafiles = [DataFile(source=self, path=path) for path in candidate_paths - known_paths]
+            with ThreadPoolExecutor() as executor:
+                results = list(executor.map(refresh, [*data_files, *new_datafiles]))
+
             # Check for any updated/deleted files
             updated_files = []
             deleted_file_ids = []
-            for datafile in data_files:
-
-                try:
-                    if datafile.refresh_from_disk(source_root=local_path):
-                        updated_files.append(datafile)
-                except FileNotFoundError:
+            for datafile, is_modified in zip(data_files, results):
+                if is_modified is None:
                     # File no longer exists
                     deleted_file_ids.append(datafile.pk)
-                    continue
+                elif is_modified:
+                    updated_files.append(datafile)
 
             # Bulk update modified files
-            updated_count = DataFile.objects.bulk_update(updated_files, ('last_updated', 'size', 'hash', 'data'))
+            updated_count = DataFile.objects.bulk_update(
+                updated_files, ('last_updated', 'size', 'hash', 'data'), batch_size=100
+            )
             logger.debug(f"Updated {updated_count} files")
 
             # Bulk delete deleted files
             deleted_count, __ = DataFile.objects.filter(pk__in=deleted_file_ids).delete()
             logger.debug(f"Deleted {deleted_count} files")
 
-            # Walk the local replication to find new files
-            new_paths = self._walk(local_path) - known_paths
-
-            # Bulk create new files
-            new_datafiles = []
-            for path in new_paths:
-                datafile = DataFile(source=self, path=path)
-                datafile.refresh_from_disk(source_root=local_path)
-                datafile.full_clean()
-                new_datafiles.append(datafile)
+            # Bulk create new files (uniqueness is assured, as their paths are not known)
+            new_datafiles = [
+                datafile for datafile, is_modified in zip(new_datafiles, results[len(data_files):])
+                if is_modified is not None
+            ]
+            for datafile in new_datafiles:
+                datafile.full_clean(validate_unique=False, validate_constraints=False)
             created_count = len(DataFile.objects.bulk_create(new_datafiles, batch_size=100))
             logger.debug(f"Created {created_count} data files")
 
+            # Record the backend's state for the next sync
+            transaction.on_commit(lambda: self.save_sync_state(state))
+
         # Update status & last_synced time
         self.status = DataSourceStatusChoices.COMPLETED
         self.last_synced = timezone.now()
@@ -247,6 +338,12 @@ class DataSource(JobsMixin, PrimaryModel):
         logger.debug(f"Found {len(paths)} files")
         return paths
 
+    def _ignore_path(self, path):
+        """
+        Returns a boolean indicating whether the file at the given relative path would be excluded by _walk().
+        """
+        return os.path.dirname(path).startswith('.') or self._ignore(os.path.basename(path))
+
     def _ignore(self, filename):
         """
         Returns a boolean indicating whether the file should be ignored per the DataSource's configured
@@ -342,15 +439,15 @@ class DataFile(models.Model):
         """
         file_path = os.path.join(source_root, self.path)
         with open(file_path, 'rb') as f:
-            file_hash = hashlib.sha256(f.read()).hexdigest()
+            data = f.read()
+        file_hash = hashlib.sha256(data).hexdigest()
 
         # Update instance file attributes & data
         if is_modified := file_hash != self.hash:
             self.last_updated = timezone.now()
-            self.size = os.path.getsize(file_path)
+            self.size = len(data)
             self.hash = file_hash
-            with open(file_path, 'rb') as f:
-                self.data = f.read()
+            self.data = data
 
         return is_modified
 
@@ -5,6 +5,7 @@ import django_rq
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.core.exceptions import ValidationError
+from django.core.files.storage import default_storage
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import MinValueValidator
 from django.db import models, transaction
@@ -139,6 +140,14 @@ class Job(models.Model):
                 _("Jobs cannot be assigned to this object type ({type}).").format(type=self.object_type)
             )
 
+    @property
+    def output_file(self):
+        """
+        Return the storage path of the file produced by the job (if any).
+        """
+        if type(self.data) is dict:
+            return self.data.get('file')
+
     @property
     def duration(self):
         if not self.completed:
@@ -157,6 +166,10 @@ class Job(models.Model):
     def delete(self, *args, **kwargs):
         super().delete(*args, **kwargs)
 
+        # Delete any file produced by the job
+        if self.output_file:
+            default_storage.delete(self.output_file)
+
         rq_queue_name = get_queue_for_model(self.object_type.model if self.object_type else None)
         queue = django_rq.get_queue(rq_queue_name)
         job = queue.fetch_job(str(self.job_id))
@@ -0,0 +1,238 @@
+import re
+from datetime import date, datetime, timezone
+
+from django.db import connection as default_connection, transaction
+
+__all__ = (
+    'PARTITIONS_AHEAD',
+    'create_partitions',
+    'drop_expired_partitions',
+    'get_partitions',
+    'is_partitioned',
+    'partition_table',
+    'unpartition_table',
+)
+
+# The table in which ObjectChanges are stored
+TABLE = 'core_objectchange'
+
+# The partitioning column
+PARTITION_KEY = 'time'
+
+# The number of monthly partitions to maintain in advance of the current month
+PARTITIONS_AHEAD = 3
+
+PARTITION_NAME_PATTERN = re.compile(rf'^{TABLE}_p(\d{{4}})(\d{{2}})$')
+
+
+def _month(value):
+    """
+    Return the first day of the month in which the given date or datetime falls.
+    """
+    return date(value.year, value.month, 1)
+
+
+def _next_month(month):
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _get_partition_name(month):
+    return f'{TABLE}_p{month:%Y%m}'
+
+
+def _get_bound(month):
+    return f"'{month.isoformat()} 00:00:00+00'"
+
+
+def is_partitioned(connection=default_connection):
+    """
+    Return True if the ObjectChange table has been partitioned.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = %s AND pg_table_is_visible(c.oid)",
+            [TABLE]
+        )
+        return cursor.fetchone() is not None
+
+
+def get_partitions(connection=default_connection):
+    """
+    Return a dictionary mapping the first day of each month for which a partition exists to the partition's name.
+    The default partition (which receives any rows not covered by a monthly partition) is omitted.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname FROM pg_inherits i "
+            "JOIN pg_class parent ON parent.oid = i.inhparent "
+            "JOIN pg_class child ON child.oid = i.inhrelid "
+            "WHERE parent.relname = %s AND pg_table_is_visible(parent.oid)",
+            [TABLE]
+        )
+        partitions = {}
+        for name, in cursor.fetchall():
+            if match := PARTITION_NAME_PATTERN.match(name):
+                partitions[date(int(match.group(1)), int(match.group(2)), 1)] = name
+        return partitions
+
+
+def create_partitions(start, end, connection=default_connection):
+    """
+    Create monthly partitions for all months from that containing `start` through that containing `end`, along with
+    the default partition. Returns a list of the names of the partitions created.
+
+    PostgreSQL will not create a partition while the default partition holds rows which fall within its bounds. Where
+    this is the case, the default partition is detached while the new partition is created, and the affected rows are
+    moved into the new partition before the default partition is reattached.
+    """
+    quote_name = connection.ops.quote_name
+    table = quote_name(TABLE)
+    default_table = quote_name(f'{TABLE}_default')
+    partition_key = quote_name(PARTITION_KEY)
+    existing_partitions = get_partitions(connection)
+    created = []
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"CREATE TABLE IF NOT EXISTS {default_table} PARTITION OF {table} DEFAULT")
+        month = _month(start)
+        while month <= _month(end):
+            if month not in existing_partitions:
+                name = quote_name(_get_partition_name(month))
+                lower_bound = _get_bound(month)
+                upper_bound = _get_bound(_next_month(month))
+                range_clause = f"{partition_key} >= {lower_bound} AND {partition_key} < {upper_bound}"
+                cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {default_table} WHERE {range_clause})")
+                conflicting_rows = cursor.fetchone()[0]
+                with transaction.atomic(using=connection.alias):
+                    if conflicting_rows:
+                        cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {default_table}")
+                    cursor.execute(
+                        f"CREATE TABLE {name} PARTITION OF {table} "
+                        f"FOR VALUES FROM ({lower_bound}) TO ({upper_bound})"
+                    )
+                    if conflicting_rows:
+                        cursor.execute(f"INSERT INTO {name} SELECT * FROM {default_table} WHERE {range_clause}")
+                        cursor.execute(f"DELETE FROM {default_table} WHERE {range_clause}")
+                        cursor.execute(f"ALTER TABLE {table} ATTACH PARTITION {default_table} DEFAULT")
+                created.append(_get_partition_name(month))
+            month = _next_month(month)
+
+    return created
+
+
+def drop_expired_partitions(cutoff, connection=default_connection, callback=None):
+    """
+    Drop all monthly partitions which contain only records older than the given cutoff time. Returns a list of the
+    names of the partitions dropped.
+
+    Args:
+        cutoff: The time before which records have expired
+        connection: The database connection
+        callback: A callable to be invoked with the lower and upper time bounds of each partition prior to dropping it
+            (e.g. to archive its records)
+    """
+    quote_name = connection.ops.quote_name
+    dropped = []
+
+    with connection.cursor() as cursor:
+        for month, name in sorted(get_partitions(connection).items()):
+            lower_bound = datetime.combine(month, datetime.min.time(), tzinfo=timezone.utc)
+            upper_bound = datetime.combine(_next_month(month), datetime.min.time(), tzinfo=timezone.utc)
+            if upper_bound <= cutoff:
+                if callback is not None:
+                    callback(lower_bound, upper_bound)
+                cursor.execute(f"DROP TABLE {quote_name(name)}")
+                dropped.append(name)
+
+    return dropped
+
+
+def _rebuild_table(connection, partitioned, months_ahead=PARTITIONS_AHEAD):
+    """
+    Rebuild the ObjectChange table as either a partitioned or an ordinary table. The existing table is renamed, and
+    its rows are copied into a new table before it is dropped. Indexes and foreign key constraints are recreated with
+    their original names. The primary key of a partitioned table must include the partition key; it is thus extended
+    to (id, time).
+    """
+    quote_name = connection.ops.quote_name
+    table = quote_name(TABLE)
+    old_name = f'{TABLE}_old'
+    old_table = quote_name(old_name)
+
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        # Check any deferred constraints now, as the table cannot be altered while trigger events are pending
+        cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+        cursor.execute(f"ALTER TABLE {table} RENAME TO {old_table}")
+
+        # Record the table's indexes & constraints
+        cursor.execute(
+            "SELECT conname, contype, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype IN ('p', 'f')",
+            [old_name]
+        )
+        constraints = cursor.fetchall()
+        pk_name = next(name for name, contype, _ in constraints if contype == 'p')
+        foreign_keys = [(name, definition) for name, contype, definition in constraints if contype == 'f']
+        cursor.execute(
+            "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = %s AND indexname <> %s",
+            [old_name, pk_name]
+        )
+        indexes = cursor.fetchall()
+
+        # Determine the sequence used to assign IDs (if not an identity column)
+        cursor.execute(
+            "SELECT attidentity, pg_get_serial_sequence(%s, 'id') FROM pg_attribute "
+            "WHERE attrelid = %s::regclass AND attname = 'id'",
+            [old_name, old_name]
+        )
+        identity, sequence = cursor.fetchone()
+
+        # Create the new table
+        partition_clause = f"PARTITION BY RANGE ({quote_name(PARTITION_KEY)})" if partitioned else ""
+        cursor.execute(
+            f"CREATE TABLE {table} (LIKE {old_table} INCLUDING DEFAULTS INCLUDING IDENTITY) {partition_clause}"
+        )
+        if partitioned:
+            cursor.execute(f"SELECT MIN({quote_name(PARTITION_KEY)}) FROM {old_table}")
+            earliest = cursor.fetchone()[0] or datetime.now(timezone.utc)
+            latest = datetime.now(timezone.utc).date()
+            for _ in range(months_ahead):
+                latest = _next_month(_month(latest))
+            create_partitions(earliest, latest, connection=connection)
+
+        # Copy all rows to the new table & carry over the ID sequence
+        cursor.execute(f"INSERT INTO {table} SELECT * FROM {old_table}")
+        if identity:
+            cursor.execute(
+                f"SELECT setval(pg_get_serial_sequence(%s, 'id'), COALESCE(MAX(id), 0) + 1, false) FROM {table}",
+                [TABLE]
+            )
+        elif sequence:
+            cursor.execute(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id")
+
+        cursor.execute(f"DROP TABLE {old_table}")
+
+        # Recreate the primary key, indexes, and foreign key constraints
+        pk_columns = f"id, {quote_name(PARTITION_KEY)}" if partitioned else "id"
+        cursor.execute(f"ALTER TABLE {table} ADD CONSTRAINT {quote_name(pk_name)} PRIMARY KEY ({pk_columns})")
+        for name, definition in indexes:
+            definition = re.sub(rf' ON (ONLY )?\S*\b{old_name}\b ', f' ON {table} ', definition)
+            cursor.execute(definition)
+        for name, definition in foreign_keys:
+            cursor.execute(f"ALTER TABLE {table} ADD CONSTRAINT {quote_name(name)} {definition}")
+
+
+def partition_table(connection=default_connection, months_ahead=PARTITIONS_AHEAD):
+    """
+    Convert the ObjectChange table to a table partitioned by month. A partition is created for each month from that of
+    the earliest existing record through `months_ahead` months in the future.
+    """
+    _rebuild_table(connection, partitioned=True, months_ahead=months_ahead)
+
+
+def unpartition_table(connection=default_connection):
+    """
+    Convert a partitioned ObjectChange table back to an ordinary table.
+    """
+    _rebuild_table(connection, partitioned=False)
@@ -1,9 +1,11 @@
 import logging
+from collections import defaultdict
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.db.models import F, Q
 from django.db.models.fields.reverse_related import ManyToManyRel, ManyToOneRel
-from django.db.models.signals import m2m_changed, post_save, pre_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver, Signal
 from django.utils.translation import gettext_lazy as _
 from django_prometheus.models import model_deletes, model_inserts, model_updates
@@ -13,8 +15,8 @@ from core.events import *
 from extras.events import enqueue_event
 from extras.utils import run_validators
 from netbox.config import get_config
-from netbox.context import current_request, events_queue
-from netbox.models.features import ChangeLoggingMixin
+from netbox.context import current_request, events_queue, pending_deletions
+from netbox.models.features import ChangeLoggingMixin, TagsMixin
 from utilities.exceptions import AbortRequest
 from .models import ConfigRevision, DataSource, ObjectChange
 
@@ -113,6 +115,10 @@ def handle_deleted_object(sender, instance, **kwargs):
     """
     Fires when an object is deleted.
     """
+    # Skip objects being deleted by delete_objects(), which has already handled them in bulk
+    if (instance._meta.label_lower, instance.pk) in (pending_deletions.get() or ()):
+        return
+
     # Run any deletion protection rules for the object. Note that this must occur prior
     # to queueing any events for the object being deleted, in case a validation error is
     # raised, causing the deletion to fail.
@@ -212,6 +218,14 @@ def enqueue_sync_job(instance, created, **kwargs):
             job.delete()
 
 
+@receiver(post_delete, sender=DataSource)
+def clear_datasource_cache(instance, **kwargs):
+    """
+    Delete any locally cached data when a DataSource is deleted.
+    """
+    instance.clear_cache()
+
+
 @receiver(post_sync)
 def auto_sync(instance, **kwargs):
     """
@@ -219,8 +233,24 @@ def auto_sync(instance, **kwargs):
     """
     from .models import AutoSyncRecord
 
-    for autosync in AutoSyncRecord.objects.filter(datafile__source=instance).prefetch_related('object'):
-        autosync.object.sync(save=True)
+    # Group the IDs of automatically synchronized objects by type
+    object_ids = defaultdict(list)
+    for object_type_id, object_id in AutoSyncRecord.objects.filter(
+        datafile__source=instance
+    ).values_list('object_type', 'object_id'):
+        object_ids[object_type_id].append(object_id)
+
+    for object_type_id, pks in object_ids.items():
+        if (model := ContentType.objects.get_for_id(object_type_id).model_class()) is None:
+            continue
+        # Synchronize only those objects for which the DataFile has changed (i.e. its hash has been updated) since
+        # they were last synced
+        queryset = model.objects.filter(pk__in=pks).filter(
+            Q(data_synced__isnull=True) | Q(data_file__last_updated__gt=F('data_synced'))
+        ).select_related('data_file')
+        if issubclass(model, TagsMixin):
+            queryset = queryset.prefetch_related('tags')
+        model.bulk_sync(queryset)
 
 
 @receiver(post_save, sender=ConfigRevision)
@@ -1,14 +1,20 @@
+import uuid
+
 from django.contrib.contenttypes.models import ContentType
 from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
 
-from core.choices import ObjectChangeActionChoices
+from core.choices import JobStatusChoices, ObjectChangeActionChoices
+from core.jobs import BulkDeleteJob
 from core.models import ObjectChange, ObjectType
-from dcim.choices import SiteStatusChoices
+from dcim.choices import InterfaceModeChoices, SiteStatusChoices
 from dcim.models import Site, CableTermination, Device, DeviceType, DeviceRole, Interface, Cable
+from dcim.views import SiteBulkDeleteView
 from extras.choices import *
 from extras.models import CustomField, CustomFieldChoiceSet, Tag
+from ipam.models import VLAN
+from utilities.request import NetBoxFakeRequest
 from utilities.testing import APITestCase
 from utilities.testing.utils import create_tags, post_data
 from utilities.testing.views import ModelViewTestCase
@@ -338,7 +344,7 @@ class ChangeLogViewTest(ModelViewTestCase):
         # Get the ObjectChange records for delete actions ordered by time
         changes = ObjectChange.objects.filter(
             action=ObjectChangeActionChoices.ACTION_DELETE
-        ).order_by('time')[:3]
+        ).order_by('time', 'pk')[:3]
 
         # Verify the order of deletion
         self.assertEqual(len(changes), 3)
@@ -346,6 +352,102 @@ class ChangeLogViewTest(ModelViewTestCase):
         self.assertEqual(changes[1].changed_object_type, ContentType.objects.get_for_model(Interface))
         self.assertEqual(changes[2].changed_object_type, ContentType.objects.get_for_model(Device))
 
+    def test_delete_object_dependents(self):
+        manufacturer = Manufacturer.objects.create(name='Manufacturer 1')
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model='Model 1', slug='model-1')
+        device_role = DeviceRole.objects.create(name='Role 1', slug='role-1')
+        site = Site.objects.create(name='Site 1', slug='site-1')
+        device = Device.objects.create(name='Device 1', device_type=device_type, role=device_role, site=site)
+        vlan = VLAN.objects.create(vid=100, name='VLAN 100')
+        interface1 = Interface.objects.create(
+            device=device,
+            name='eth0',
+            type='1000base-t',
+            mode=InterfaceModeChoices.MODE_ACCESS,
+            untagged_vlan=vlan
+        )
+        interface2 = Interface.objects.create(
+            device=device,
+            name='eth1',
+            type='1000base-t',
+            mode=InterfaceModeChoices.MODE_TAGGED
+        )
+        interface2.tagged_vlans.add(vlan)
+
+        request = {
+            'path': reverse('ipam:vlan_delete', kwargs={'pk': vlan.pk}),
+            'data': post_data({'confirm': True}),
+        }
+        self.add_permissions('ipam.delete_vlan')
+        response = self.client.post(**request)
+        self.assertHttpStatus(response, 302)
+        self.assertFalse(VLAN.objects.exists())
+
+        objectchange = ObjectChange.objects.get(changed_object_type=ContentType.objects.get_for_model(VLAN))
+        self.assertEqual(objectchange.action, ObjectChangeActionChoices.ACTION_DELETE)
+        self.assertEqual(objectchange.object_repr, str(vlan))
+        self.assertEqual(objectchange.user_name, self.user.username)
+
+        # Interface 1 had its untagged VLAN nullified
+        interface1.refresh_from_db()
+        self.assertIsNone(interface1.untagged_vlan)
+        objectchange = ObjectChange.objects.get(
+            changed_object_type=ContentType.objects.get_for_model(Interface),
+            changed_object_id=interface1.pk
+        )
+        self.assertEqual(objectchange.action, ObjectChangeActionChoices.ACTION_UPDATE)
+        self.assertEqual(objectchange.related_object, device)
+        self.assertEqual(objectchange.prechange_data['untagged_vlan'], vlan.pk)
+        self.assertIsNone(objectchange.postchange_data['untagged_vlan'])
+
+        # Interface 2 had the VLAN removed from its tagged VLANs
+        objectchange = ObjectChange.objects.get(
+            changed_object_type=ContentType.objects.get_for_model(Interface),
+            changed_object_id=interface2.pk
+        )
+        self.assertEqual(objectchange.action, ObjectChangeActionChoices.ACTION_UPDATE)
+        self.assertEqual(objectchange.prechange_data['tagged_vlans'], [vlan.pk])
+        self.assertEqual(objectchange.postchange_data['tagged_vlans'], [])
+
+    def test_bulk_delete_job(self):
+        sites = (
+            Site(name='Site 1', slug='site-1'),
+            Site(name='Site 2', slug='site-2'),
+            Site(name='Site 3', slug='site-3'),
+        )
+        Site.objects.bulk_create(sites)
+        self.add_permissions('dcim.delete_site')
+        request = NetBoxFakeRequest({
+            'META': {},
+            'COOKIES': {},
+            'POST': {},
+            'GET': {},
+            'FILES': {},
+            'user': self.user,
+            'path': '',
+            'id': uuid.uuid4(),
+        })
+
+        job = BulkDeleteJob.enqueue(
+            immediate=True,
+            view_cls=SiteBulkDeleteView,
+            pk_list=[site.pk for site in sites],
+            request=request,
+            chunk_size=2
+        )
+
+        self.assertEqual(job.status, JobStatusChoices.STATUS_COMPLETED)
+        self.assertEqual(job.data['completed'], 3)
+        self.assertEqual(job.data['deleted'], 3)
+        self.assertFalse(Site.objects.exists())
+        self.assertEqual(
+            ObjectChange.objects.filter(
+                action=ObjectChangeActionChoices.ACTION_DELETE,
+                request_id=request.id
+            ).count(),
+            3
+        )
+
 
 class ChangeLogAPITest(APITestCase):
 
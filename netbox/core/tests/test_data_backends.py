@@ -0,0 +1,75 @@
+import os
+import tempfile
+from unittest import mock, skipIf
+
+from django.test import TestCase
+
+from core.data_backends import S3Backend
+
+try:
+    import boto3
+    from moto import mock_aws
+except ImportError:
+    boto3 = None
+
+
+@skipIf(boto3 is None, "boto3 and moto are required to test the S3 backend")
+class S3BackendTestCase(TestCase):
+    url = 'https://s3.us-east-1.amazonaws.com/bucket1/data'
+
+    def setUp(self):
+        self.mock_aws = mock_aws()
+        self.mock_aws.start()
+        self.addCleanup(self.mock_aws.stop)
+
+        self.client = boto3.client('s3', region_name='us-east-1')
+        self.client.create_bucket(Bucket='bucket1')
+        self.client.put_object(Bucket='bucket1', Key='data/file1.txt', Body=b'foo')
+        self.client.put_object(Bucket='bucket1', Key='data/dir/file2.txt', Body=b'bar')
+
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+
+    def get_backend(self):
+        backend = S3Backend(self.url, aws_access_key_id='foo', aws_secret_access_key='bar')
+        backend.cache_path = self.cache_dir.name
+        return backend
+
+    def fetch(self, previous_state=None):
+        """
+        Fetch the bucket's contents, returning the keys of all downloaded objects along with the result of
+        get_changes().
+        """
+        backend = self.get_backend()
+        with mock.patch('botocore.client.BaseClient._make_api_call', autospec=True,
+                        side_effect=self.client._make_api_call.__func__) as api_call:
+            with backend.fetch() as local_path:
+                changes = backend.get_changes(local_path, previous_state)
+        downloaded_keys = {
+            call.args[2]['Key'] for call in api_call.call_args_list if call.args[1] == 'GetObject'
+        }
+        return downloaded_keys, changes
+
+    def test_fetch_changed_objects(self):
+        downloaded_keys, (state, changed_paths) = self.fetch()
+        self.assertEqual(downloaded_keys, {'data/file1.txt', 'data/dir/file2.txt'})
+        self.assertIsNone(changed_paths)
+        with open(os.path.join(self.cache_dir.name, 'data/dir/file2.txt'), 'rb') as f:
+            self.assertEqual(f.read(), b'bar')
+
+        # Nothing is downloaded if no objects have changed
+        downloaded_keys, (state, changed_paths) = self.fetch(state)
+        self.assertEqual(downloaded_keys, set())
+        self.assertEqual(changed_paths, set())
+
+        # Modify, create, and delete an object
+        self.client.put_object(Bucket='bucket1', Key='data/file1.txt', Body=b'foo2')
+        self.client.put_object(Bucket='bucket1', Key='data/file3.txt', Body=b'baz')
+        self.client.delete_object(Bucket='bucket1', Key='data/dir/file2.txt')
+
+        downloaded_keys, (state, changed_paths) = self.fetch(state)
+        self.assertEqual(downloaded_keys, {'data/file1.txt', 'data/file3.txt'})
+        self.assertEqual(changed_paths, {'data/file1.txt', 'data/file3.txt', 'data/dir/file2.txt'})
+        self.assertFalse(os.path.exists(os.path.join(self.cache_dir.name, 'data/dir/file2.txt')))
+        with open(os.path.join(self.cache_dir.name, 'data/file1.txt'), 'rb') as f:
+            self.assertEqual(f.read(), b'foo2')
@@ -1,8 +1,18 @@
-from django.test import TestCase
+import os
+import tempfile
+import uuid
+from unittest import mock
 
-from core.models import DataSource
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase, override_settings
+
+from core.models import DataFile, DataSource, ObjectChange
 from core.choices import ObjectChangeActionChoices
+from extras.models import ConfigContext
 from netbox.constants import CENSOR_TOKEN, CENSOR_TOKEN_CHANGED
+from netbox.context_managers import event_tracking
+from users.models import User
+from utilities.request import NetBoxFakeRequest
 
 
 class DataSourceChangeLoggingTestCase(TestCase):
@@ -120,3 +130,132 @@ class DataSourceChangeLoggingTestCase(TestCase):
         self.assertEqual(objectchange.prechange_data['parameters']['password'], CENSOR_TOKEN)
         self.assertEqual(objectchange.postchange_data['parameters']['username'], 'username2')
         self.assertEqual(objectchange.postchange_data['parameters']['password'], CENSOR_TOKEN)
+
+
+class DataSourceSyncTestCase(TestCase):
+
+    def setUp(self):
+        self.source_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.source_dir.cleanup)
+        self.addCleanup(self.cache_dir.cleanup)
+
+    def write_file(self, path, content, mtime=None):
+        file_path = os.path.join(self.source_dir.name, path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, 'w') as f:
+            f.write(content)
+        if mtime is not None:
+            os.utime(file_path, (mtime, mtime))
+
+    def sync(self, datasource):
+        with self.captureOnCommitCallbacks(execute=True):
+            datasource.sync()
+
+    def test_incremental_sync(self):
+        self.write_file('file1.txt', 'foo', mtime=1000)
+        self.write_file('dir/file2.txt', 'bar', mtime=1000)
+        self.write_file('file3.txt', 'baz', mtime=1000)
+
+        with override_settings(DATA_SOURCE_CACHE_PATH=self.cache_dir.name):
+            datasource = DataSource.objects.create(
+                name='Data Source 1',
+                type='local',
+                source_url=f'file://{self.source_dir.name}'
+            )
+            self.sync(datasource)
+            self.assertEqual(
+                set(datasource.datafiles.values_list('path', flat=True)),
+                {'file1.txt', 'dir/file2.txt', 'file3.txt'}
+            )
+            self.assertTrue(os.path.exists(f'{datasource.cache_path}.json'))
+
+            # Modify, create, and delete a file
+            self.write_file('file1.txt', 'foo2', mtime=2000)
+            self.write_file('file4.txt', 'qux', mtime=2000)
+            os.unlink(os.path.join(self.source_dir.name, 'file3.txt'))
+
+            # Only changed files should be read
+            with mock.patch.object(DataFile, 'refresh_from_disk', autospec=True,
+                                   side_effect=DataFile.refresh_from_disk) as refresh_from_disk:
+                self.sync(datasource)
+            refreshed_paths = {call.args[0].path for call in refresh_from_disk.call_args_list}
+            self.assertEqual(refreshed_paths, {'file1.txt', 'file3.txt', 'file4.txt'})
+
+            self.assertEqual(
+                set(datasource.datafiles.values_list('path', flat=True)),
+                {'file1.txt', 'dir/file2.txt', 'file4.txt'}
+            )
+            self.assertEqual(datasource.datafiles.get(path='file1.txt').data_as_string, 'foo2')
+
+            # Changing the ignore rules should force a full sync
+            datasource.ignore_rules = 'file4.txt'
+            self.assertIsNone(datasource.get_sync_state())
+
+            # Deleting the DataSource should delete its cached state
+            cache_path = datasource.cache_path
+            datasource.delete()
+            self.assertFalse(os.path.exists(f'{cache_path}.json'))
+
+    def test_sync_without_cache(self):
+        self.write_file('file1.txt', 'foo')
+        datasource = DataSource.objects.create(
+            name='Data Source 1',
+            type='local',
+            source_url=f'file://{self.source_dir.name}'
+        )
+        self.assertIsNone(datasource.cache_path)
+        self.sync(datasource)
+        self.assertEqual(list(datasource.datafiles.values_list('path', flat=True)), ['file1.txt'])
+        self.assertIsNone(datasource.get_sync_state())
+
+    def test_auto_sync(self):
+        for i in range(1, 4):
+            self.write_file(f'context{i}.json', f'{{"foo": {i}}}')
+        datasource = DataSource.objects.create(
+            name='Data Source 1',
+            type='local',
+            source_url=f'file://{self.source_dir.name}'
+        )
+        self.sync(datasource)
+        config_contexts = [
+            ConfigContext(
+                name=f'Config Context {i}',
+                data_file=datasource.datafiles.get(path=f'context{i}.json'),
+                auto_sync_enabled=True
+            ) for i in range(1, 4)
+        ]
+        for config_context in config_contexts:
+            config_context.full_clean()
+            config_context.save()
+
+        # Modify one file & "touch" another without changing its content
+        self.write_file('context1.json', '{"foo": "bar"}')
+        DataFile.objects.filter(path='context2.json').update(hash='0' * 64)
+
+        request = NetBoxFakeRequest({
+            'META': {},
+            'POST': {},
+            'GET': {},
+            'FILES': {},
+            'user': User.objects.create_user(username='user1'),
+            'path': '',
+            'id': uuid.uuid4(),
+        })
+        with event_tracking(request):
+            self.sync(datasource)
+
+        config_contexts = {cc.name: cc for cc in ConfigContext.objects.all()}
+        self.assertEqual(config_contexts['Config Context 1'].data, {'foo': 'bar'})
+        self.assertEqual(config_contexts['Config Context 2'].data, {'foo': 2})
+        self.assertTrue(config_contexts['Config Context 2'].is_synced)
+
+        # Only the modified ConfigContext should have been logged
+        objectchanges = ObjectChange.objects.filter(
+            changed_object_type=ContentType.objects.get_for_model(ConfigContext),
+            request_id=request.id
+        )
+        self.assertEqual(len(objectchanges), 1)
+        self.assertEqual(objectchanges[0].changed_object_id, config_contexts['Config Context 1'].pk)
+        self.assertEqual(objectchanges[0].prechange_data['data'], {'foo': 1})
+        self.assertEqual(objectchanges[0].postchange_data['data'], {'foo': 'bar'})
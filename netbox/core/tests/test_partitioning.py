@@ -0,0 +1,98 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from django.db import connection
+from django.test import TestCase
+
+from core.choices import ObjectChangeActionChoices
+from core.models import ObjectChange, ObjectType
+from core.partitioning import (
+    create_partitions, drop_expired_partitions, get_partitions, is_partitioned, partition_table, unpartition_table,
+)
+from dcim.models import Site
+
+
+class ObjectChangePartitioningTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        object_type = ObjectType.objects.get_for_model(Site)
+        for month in (1, 2, 3):
+            object_change = ObjectChange.objects.create(
+                user_name='admin',
+                request_id=uuid.uuid4(),
+                action=ObjectChangeActionChoices.ACTION_CREATE,
+                changed_object_type=object_type,
+                changed_object_id=month,
+                object_repr=f'Site {month}'
+            )
+            # Override the auto-populated time
+            ObjectChange.objects.filter(pk=object_change.pk).update(
+                time=datetime(2020, month, 15, tzinfo=timezone.utc)
+            )
+
+    def test_partition_table(self):
+        self.assertFalse(is_partitioned())
+        partition_table()
+        self.assertTrue(is_partitioned())
+
+        # Existing records have been retained in monthly partitions
+        self.assertEqual(ObjectChange.objects.count(), 3)
+        partitions = get_partitions()
+        self.assertIn(datetime(2020, 1, 1).date(), partitions)
+        self.assertIn(datetime(2020, 3, 1).date(), partitions)
+        self.assertIn(datetime.now(timezone.utc).date().replace(day=1), partitions)
+
+        # New records can be created
+        ObjectChange.objects.create(
+            user_name='admin',
+            request_id=uuid.uuid4(),
+            action=ObjectChangeActionChoices.ACTION_CREATE,
+            changed_object_type=ObjectType.objects.get_for_model(Site),
+            changed_object_id=4,
+            object_repr='Site 4'
+        )
+        self.assertEqual(ObjectChange.objects.count(), 4)
+
+        # Partitions containing only expired records are dropped
+        dropped = drop_expired_partitions(datetime(2020, 3, 1, tzinfo=timezone.utc))
+        self.assertEqual(dropped, ['core_objectchange_p202001', 'core_objectchange_p202002'])
+        self.assertEqual(ObjectChange.objects.count(), 2)
+
+        # Additional partitions are created on demand
+        now = datetime.now(timezone.utc)
+        create_partitions(now, now + timedelta(days=366))
+        self.assertGreaterEqual(len(get_partitions()), 13)
+
+        unpartition_table()
+        self.assertFalse(is_partitioned())
+        self.assertEqual(ObjectChange.objects.count(), 2)
+
+    def test_create_partition_with_default_rows(self):
+        partition_table()
+        drop_expired_partitions(datetime(2020, 2, 1, tzinfo=timezone.utc))
+        self.assertNotIn(datetime(2020, 1, 1).date(), get_partitions())
+
+        # Records for months without a partition are stored in the default partition
+        object_change = ObjectChange.objects.create(
+            user_name='admin',
+            request_id=uuid.uuid4(),
+            action=ObjectChangeActionChoices.ACTION_CREATE,
+            changed_object_type=ObjectType.objects.get_for_model(Site),
+            changed_object_id=4,
+            object_repr='Site 4'
+        )
+        january = datetime(2020, 1, 20, tzinfo=timezone.utc)
+        ObjectChange.objects.filter(pk=object_change.pk).update(time=january)
+
+        # Creating a partition moves any matching records out of the default partition
+        created = create_partitions(january, january)
+        self.assertEqual(created, ['core_objectchange_p202001'])
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM core_objectchange_default")
+            self.assertEqual(cursor.fetchone()[0], 0)
+            cursor.execute("SELECT COUNT(*) FROM core_objectchange_p202001")
+            self.assertEqual(cursor.fetchone()[0], 1)
+        self.assertEqual(ObjectChange.objects.count(), 3)
+
+        unpartition_table()
@@ -6,8 +6,9 @@ from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import UserPassesTestMixin
 from django.core.cache import cache
+from django.core.files.storage import default_storage
 from django.db import connection, ProgrammingError
-from django.http import HttpResponse, HttpResponseForbidden, Http404
+from django.http import FileResponse, HttpResponse, HttpResponseForbidden, Http404
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
@@ -181,6 +182,31 @@ class JobView(generic.ObjectView):
     queryset = Job.objects.all()
 
 
+@register_model_view(Job, 'download')
+class JobDownloadView(BaseObjectView):
+    queryset = Job.objects.all()
+
+    def get_required_permission(self):
+        return 'core.view_job'
+
+    def get(self, request, pk):
+        job = get_object_or_404(self.queryset, pk=pk)
+
+        # A job's output may be downloaded only by the user who ran it (or by a superuser)
+        if job.user != request.user and not request.user.is_superuser:
+            return HttpResponseForbidden(_("You do not have permission to download the output of this job."))
+
+        if not job.output_file or not default_storage.exists(job.output_file):
+            raise Http404
+
+        return FileResponse(
+            default_storage.open(job.output_file),
+            as_attachment=True,
+            filename=job.data.get('filename'),
+            content_type=job.data.get('content_type')
+        )
+
+
 @register_model_view(Job, 'delete')
 class JobDeleteView(generic.ObjectDeleteView):
     queryset = Job.objects.defer('data')
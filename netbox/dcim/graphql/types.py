@@ -13,6 +13,7 @@ from extras.graphql.mixins import (
     TagsMixin,
 )
 from ipam.graphql.mixins import IPAddressesMixin, VLANGroupsMixin
+from netbox.graphql.loaders import GenericObjectLoader, get_loader
 from netbox.graphql.scalars import BigInt
 from netbox.graphql.types import BaseObjectType, NetBoxObjectType, OrganizationalObjectType
 from .filters import *
@@ -415,11 +416,11 @@ class MACAddressType(NetBoxObjectType):
     mac_address: str
 
     @strawberry_django.field
-    def assigned_object(self) -> Annotated[Union[
+    def assigned_object(self, info) -> Annotated[Union[
         Annotated["InterfaceType", strawberry.lazy('dcim.graphql.types')],
         Annotated["VMInterfaceType", strawberry.lazy('virtualization.graphql.types')],
     ], strawberry.union("MACAddressAssignmentType")] | None:
-        return self.assigned_object
+        return get_loader(info, GenericObjectLoader, 'assigned_object').load(self)
 
 
 @strawberry_django.type(
@@ -27,6 +27,7 @@ from netbox.config import ConfigItem
 from netbox.models import NestedGroupModel, OrganizationalModel, PrimaryModel
 from netbox.models.mixins import WeightMixin
 from netbox.models.features import ContactsMixin, ImageAttachmentsMixin
+from utilities.counters import batch_counter_updates
 from utilities.fields import ColorField, CounterCacheField
 from utilities.tracking import TrackingModelMixin
 from .device_components import *
@@ -940,20 +941,22 @@ class Device(
 
         # If this is a new Device, instantiate all the related components per the DeviceType definition
         if is_new:
-            self._instantiate_components(self.device_type.consoleporttemplates.all())
-            self._instantiate_components(self.device_type.consoleserverporttemplates.all())
-            self._instantiate_components(self.device_type.powerporttemplates.all())
-            self._instantiate_components(self.device_type.poweroutlettemplates.all())
-            self._instantiate_components(self.device_type.interfacetemplates.all())
-            self._instantiate_components(self.device_type.rearporttemplates.all())
-            self._instantiate_components(self.device_type.frontporttemplates.all())
-            # Disable bulk_create to accommodate MPTT
-            self._instantiate_components(self.device_type.modulebaytemplates.all(), bulk_create=False)
-            self._instantiate_components(self.device_type.devicebaytemplates.all())
-            # Disable bulk_create to accommodate MPTT
-            self._instantiate_components(self.device_type.inventoryitemtemplates.all(), bulk_create=False)
-            # Interface bridges have to be set after interface instantiation
-            update_interface_bridges(self, self.device_type.interfacetemplates.all())
+            # Apply the resulting changes to the Device's component counters collectively
+            with batch_counter_updates():
+                self._instantiate_components(self.device_type.consoleporttemplates.all())
+                self._instantiate_components(self.device_type.consoleserverporttemplates.all())
+                self._instantiate_components(self.device_type.powerporttemplates.all())
+                self._instantiate_components(self.device_type.poweroutlettemplates.all())
+                self._instantiate_components(self.device_type.interfacetemplates.all())
+                self._instantiate_components(self.device_type.rearporttemplates.all())
+                self._instantiate_components(self.device_type.frontporttemplates.all())
+                # Disable bulk_create to accommodate MPTT
+                self._instantiate_components(self.device_type.modulebaytemplates.all(), bulk_create=False)
+                self._instantiate_components(self.device_type.devicebaytemplates.all())
+                # Disable bulk_create to accommodate MPTT
+                self._instantiate_components(self.device_type.inventoryitemtemplates.all(), bulk_create=False)
+                # Interface bridges have to be set after interface instantiation
+                update_interface_bridges(self, self.device_type.interfacetemplates.all())
 
         # Update Site and Rack assignment for any child Devices
         devices = Device.objects.filter(parent_bay__device=self)
@@ -13,6 +13,7 @@ from extras.models import ConfigContextModel, CustomField
 from netbox.models import PrimaryModel
 from netbox.models.features import ImageAttachmentsMixin
 from netbox.models.mixins import WeightMixin
+from utilities.counters import batch_counter_updates
 from utilities.jsonschema import validate_schema
 from utilities.string import title
 from .device_components import *
@@ -271,19 +272,16 @@ class Module(PrimaryModel, ConfigContextModel):
             module_bays.append(module.module_bay.pk)
             module = module.module_bay.module if module.module_bay else None
 
-    def save(self, *args, **kwargs):
-        is_new = self.pk is None
-
-        super().save(*args, **kwargs)
-
-        adopt_components = getattr(self, '_adopt_components', False)
-        disable_replication = getattr(self, '_disable_replication', False)
-
-        # We skip adding components if the module is being edited or
-        # both replication and component adoption is disabled
-        if not is_new or (disable_replication and not adopt_components):
-            return
+    def _instantiate_components(self, adopt_components=False, disable_replication=False):
+        """
+        Instantiate components for the module from its module type's component templates, optionally adopting any
+        matching components already installed on the device.
 
+        Args:
+            adopt_components: If True, existing unassigned device components matching a template will be assigned to
+                              the module
+            disable_replication: If True, no new components will be created
+        """
         # Iterate all component types
         for templates, component_attribute, component_model in [
             ("consoleporttemplates", "consoleports", ConsolePort),
@@ -358,5 +356,22 @@ class Module(PrimaryModel, ConfigContextModel):
                     update_fields=update_fields
                 )
 
+    def save(self, *args, **kwargs):
+        is_new = self.pk is None
+
+        super().save(*args, **kwargs)
+
+        adopt_components = getattr(self, '_adopt_components', False)
+        disable_replication = getattr(self, '_disable_replication', False)
+
+        # We skip adding components if the module is being edited or
+        # both replication and component adoption is disabled
+        if not is_new or (disable_replication and not adopt_components):
+            return
+
+        # Apply the resulting changes to the Device's component counters collectively
+        with batch_counter_updates():
+            self._instantiate_components(adopt_components, disable_replication)
+
         # Interface bridges have to be set after interface instantiation
         update_interface_bridges(self.device, self.module_type.interfacetemplates, self)
@@ -3,12 +3,15 @@ from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
 from core.api.serializers_.jobs import JobSerializer
-from extras.models import Script
-from netbox.api.serializers import ValidatedModelSerializer
+from extras.choices import LogLevelChoices
+from extras.models import Script, ScriptLogEntry
+from netbox.api.fields import ChoiceField
+from netbox.api.serializers import BaseModelSerializer, ValidatedModelSerializer
 
 __all__ = (
     'ScriptDetailSerializer',
     'ScriptInputSerializer',
+    'ScriptLogEntrySerializer',
     'ScriptSerializer',
 )
 
@@ -74,3 +77,15 @@ class ScriptInputSerializer(serializers.Serializer):
         if value and not self.context['script'].python_class.scheduling_enabled:
             raise serializers.ValidationError(_("Scheduling is not enabled for this script."))
         return value
+
+
+class ScriptLogEntrySerializer(BaseModelSerializer):
+    status = ChoiceField(choices=LogLevelChoices, read_only=True)
+    object_url = serializers.CharField(source='url', read_only=True)
+
+    class Meta:
+        model = ScriptLogEntry
+        fields = [
+            'id', 'url', 'display', 'job', 'index', 'time', 'status', 'message', 'object_repr', 'object_url',
+        ]
+        brief_fields = ('id', 'url', 'display', 'index', 'status', 'message')
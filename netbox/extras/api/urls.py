@@ -26,6 +26,7 @@ router.register('journal-entries', views.JournalEntryViewSet)
 router.register('config-contexts', views.ConfigContextViewSet)
 router.register('config-templates', views.ConfigTemplateViewSet)
 router.register('scripts', views.ScriptViewSet, basename='script')
+router.register('script-log-entries', views.ScriptLogEntryViewSet)
 router.register('object-types', views.ObjectTypeViewSet)
 
 app_name = 'extras-api'
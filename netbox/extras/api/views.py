@@ -314,6 +314,22 @@ class ScriptViewSet(ModelViewSet):
         return Response(input_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+class ScriptLogEntryViewSet(ReadOnlyModelViewSet):
+    """
+    Read-only list of the log entries recorded by scripts. Access is governed by the permission to view scripts (as
+    for script results in the UI).
+    """
+    permission_classes = [IsAuthenticatedOrLoginNotRequired]
+    queryset = ScriptLogEntry.objects.all()
+    serializer_class = serializers.ScriptLogEntrySerializer
+    filterset_class = filtersets.ScriptLogEntryFilterSet
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if not request.user.has_perm('extras.view_script'):
+            raise PermissionDenied("This user does not have permission to view script results.")
+
+
 #
 # Object types
 #
@@ -1,9 +1,34 @@
 from core.events import *
-from extras.choices import LogLevelChoices
+from extras.choices import CustomFieldTypeChoices, LogLevelChoices
 
 # Custom fields
 CUSTOMFIELD_EMPTY_VALUES = (None, '', [])
 
+# Map each indexable custom field type to the type of database index which matches the lookups employed by its filter.
+# All indexes are built on the expression (custom_field_data -> '<name>').
+CUSTOMFIELD_INDEX_METHODS = {
+    # Exact & range lookups
+    CustomFieldTypeChoices.TYPE_INTEGER: 'btree',
+    CustomFieldTypeChoices.TYPE_DECIMAL: 'btree',
+    CustomFieldTypeChoices.TYPE_BOOLEAN: 'btree',
+    CustomFieldTypeChoices.TYPE_DATE: 'btree',
+    CustomFieldTypeChoices.TYPE_DATETIME: 'btree',
+    CustomFieldTypeChoices.TYPE_SELECT: 'btree',
+    CustomFieldTypeChoices.TYPE_OBJECT: 'btree',
+    # Exact lookups only (values may be too large for a btree index)
+    CustomFieldTypeChoices.TYPE_TEXT: 'hash',
+    CustomFieldTypeChoices.TYPE_LONGTEXT: 'hash',
+    CustomFieldTypeChoices.TYPE_URL: 'hash',
+    # Containment lookups
+    CustomFieldTypeChoices.TYPE_MULTISELECT: 'gin',
+    CustomFieldTypeChoices.TYPE_MULTIOBJECT: 'gin',
+}
+CUSTOMFIELD_INDEX_PREFIX = 'netbox_cf_'
+
+# Scripts
+# The number of log messages spooled & saved per batch
+SCRIPT_LOG_BATCH_SIZE = 1000
+
 # Template Export
 DEFAULT_MIME_TYPE = 'text/plain; charset=utf-8'
 
@@ -250,11 +250,22 @@ class ObjectListWidget(DashboardWidget):
         )
 
         def clean_url_params(self):
+            from extras.models import SavedFilter
+
             if data := self.cleaned_data['url_params']:
                 try:
                     urlencode(data)
                 except (TypeError, ValueError):
                     raise forms.ValidationError(_("Invalid format. URL parameters must be passed as a dictionary."))
+
+                # Validate any referenced SavedFilters
+                if isinstance(data, dict) and ('filter' in data or 'filter_id' in data):
+                    __, errors = SavedFilter.objects.resolve(
+                        slugs=data.get('filter', []),
+                        pks=data.get('filter_id', [])
+                    )
+                    if errors:
+                        raise forms.ValidationError(errors)
             return data
 
         def clean_model(self):
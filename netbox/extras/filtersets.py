@@ -3,7 +3,7 @@ from django.contrib.contenttypes.models import ContentType
 from django.db.models import Q
 from django.utils.translation import gettext as _
 
-from core.models import DataSource, ObjectType
+from core.models import DataSource, Job, ObjectType
 from dcim.models import DeviceRole, DeviceType, Location, Platform, Region, Site, SiteGroup
 from netbox.filtersets import BaseFilterSet, ChangeLoggedModelFilterSet, NetBoxModelFilterSet
 from tenancy.models import Tenant, TenantGroup
@@ -13,6 +13,7 @@ from utilities.filters import (
 )
 from virtualization.models import Cluster, ClusterGroup, ClusterType
 from .choices import *
+from .constants import LOG_LEVEL_RANK
 from .filters import TagFilter, TagIDFilter
 from .models import *
 
@@ -32,6 +33,7 @@ __all__ = (
     'ObjectTypeFilterSet',
     'SavedFilterFilterSet',
     'ScriptFilterSet',
+    'ScriptLogEntryFilterSet',
     'TableConfigFilterSet',
     'TagFilterSet',
     'TaggedItemFilterSet',
@@ -61,6 +63,42 @@ class ScriptFilterSet(BaseFilterSet):
         )
 
 
+class ScriptLogEntryFilterSet(BaseFilterSet):
+    q = django_filters.CharFilter(
+        method='search',
+        label=_('Search'),
+    )
+    job_id = django_filters.ModelMultipleChoiceFilter(
+        queryset=Job.objects.all(),
+        label=_('Job (ID)'),
+    )
+    status = django_filters.MultipleChoiceFilter(
+        choices=LogLevelChoices
+    )
+    log_threshold = django_filters.ChoiceFilter(
+        choices=LogLevelChoices,
+        method='filter_log_threshold',
+        label=_('Minimum level'),
+    )
+
+    class Meta:
+        model = ScriptLogEntry
+        fields = ('id', 'index', 'time')
+
+    def search(self, queryset, name, value):
+        if not value.strip():
+            return queryset
+        return queryset.filter(
+            Q(message__icontains=value) |
+            Q(object_repr__icontains=value)
+        )
+
+    def filter_log_threshold(self, queryset, name, value):
+        return queryset.filter(
+            status__in=[level for level, rank in LOG_LEVEL_RANK.items() if rank >= LOG_LEVEL_RANK[value]]
+        )
+
+
 class WebhookFilterSet(NetBoxModelFilterSet):
     q = django_filters.CharFilter(
         method='search',
@@ -162,9 +200,9 @@ class CustomFieldFilterSet(ChangeLoggedModelFilterSet):
     class Meta:
         model = CustomField
         fields = (
-            'id', 'name', 'label', 'group_name', 'required', 'unique', 'search_weight', 'filter_logic', 'ui_visible',
-            'ui_editable', 'weight', 'is_cloneable', 'description', 'validation_minimum', 'validation_maximum',
-            'validation_regex',
+            'id', 'name', 'label', 'group_name', 'required', 'unique', 'search_weight', 'filter_logic', 'indexed',
+            'ui_visible', 'ui_editable', 'weight', 'is_cloneable', 'description', 'validation_minimum',
+            'validation_maximum', 'validation_regex',
         )
 
     def search(self, queryset, name, value):
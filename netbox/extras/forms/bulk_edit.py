@@ -73,6 +73,11 @@ class CustomFieldBulkEditForm(BulkEditForm):
         required=False,
         widget=BulkEditNullBooleanSelect()
     )
+    indexed = forms.NullBooleanField(
+        label=_('Indexed'),
+        required=False,
+        widget=BulkEditNullBooleanSelect()
+    )
     validation_minimum = forms.IntegerField(
         label=_('Minimum value'),
         required=False,
@@ -89,7 +94,7 @@ class CustomFieldBulkEditForm(BulkEditForm):
 
     fieldsets = (
         FieldSet('group_name', 'description', 'weight', 'required', 'unique', 'choice_set', name=_('Attributes')),
-        FieldSet('ui_visible', 'ui_editable', 'is_cloneable', name=_('Behavior')),
+        FieldSet('ui_visible', 'ui_editable', 'is_cloneable', 'indexed', name=_('Behavior')),
         FieldSet('validation_minimum', 'validation_maximum', 'validation_regex', name=_('Validation')),
     )
     nullable_fields = ('group_name', 'description', 'choice_set')
@@ -45,7 +45,7 @@ class CustomFieldFilterForm(SavedFiltersMixin, FilterForm):
             'type', 'related_object_type_id', 'group_name', 'weight', 'required', 'unique', 'choice_set_id',
             name=_('Attributes')
         ),
-        FieldSet('ui_visible', 'ui_editable', 'is_cloneable', name=_('Behavior')),
+        FieldSet('ui_visible', 'ui_editable', 'is_cloneable', 'indexed', name=_('Behavior')),
         FieldSet('validation_minimum', 'validation_maximum', 'validation_regex', name=_('Validation')),
     )
     related_object_type_id = ContentTypeMultipleChoiceField(
@@ -102,6 +102,13 @@ class CustomFieldFilterForm(SavedFiltersMixin, FilterForm):
             choices=BOOLEAN_WITH_BLANK_CHOICES
         )
     )
+    indexed = forms.NullBooleanField(
+        label=_('Indexed'),
+        required=False,
+        widget=forms.Select(
+            choices=BOOLEAN_WITH_BLANK_CHOICES
+        )
+    )
     validation_minimum = forms.IntegerField(
         label=_('Minimum value'),
         required=False
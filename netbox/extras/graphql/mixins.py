@@ -3,6 +3,8 @@ from typing import TYPE_CHECKING, Annotated, List
 import strawberry
 import strawberry_django
 
+from netbox.graphql.loaders import ConfigContextLoader, RelatedObjectsLoader, get_loader
+
 __all__ = (
     'ConfigContextMixin',
     'ContactsMixin',
@@ -21,8 +23,8 @@ if TYPE_CHECKING:
 class ConfigContextMixin:
 
     @strawberry_django.field
-    def config_context(self) -> strawberry.scalars.JSON:
-        return self.get_config_context()
+    def config_context(self, info) -> strawberry.scalars.JSON:
+        return get_loader(info, ConfigContextLoader).load(self)
 
 
 @strawberry.type
@@ -38,7 +40,7 @@ class ImageAttachmentsMixin:
 
     @strawberry_django.field
     def image_attachments(self, info) -> List[Annotated["ImageAttachmentType", strawberry.lazy('.types')]]:
-        return self.images.restrict(info.context.request.user, 'view')
+        return get_loader(info, RelatedObjectsLoader, 'images').load(self)
 
 
 @strawberry.type
@@ -46,7 +48,7 @@ class JournalEntriesMixin:
 
     @strawberry_django.field
     def journal_entries(self, info) -> List[Annotated["JournalEntryType", strawberry.lazy('.types')]]:
-        return self.journal_entries.all()
+        return get_loader(info, RelatedObjectsLoader, 'journal_entries').load(self)
 
 
 @strawberry.type
@@ -2,14 +2,16 @@ import logging
 import traceback
 from contextlib import ExitStack
 
-from django.db import transaction
+from django.db import connection, transaction
 from django.utils.translation import gettext as _
 
 from core.signals import clear_events
-from extras.models import Script as ScriptModel
+from extras.constants import CUSTOMFIELD_INDEX_PREFIX
+from extras.models import CustomField, Script as ScriptModel
 from netbox.jobs import JobRunner
 from netbox.registry import registry
 from utilities.exceptions import AbortScript, AbortTransaction
+from .scripts import ScriptLogWriter
 from .utils import is_report
 
 
@@ -36,6 +38,7 @@ class ScriptJob(JobRunner):
         """
         logger = logging.getLogger(f"netbox.scripts.{script.full_name}")
         logger.info(f"Running script (commit={commit})")
+        script.log_writer = ScriptLogWriter(self.job)
 
         try:
             try:
@@ -75,10 +78,11 @@ class ScriptJob(JobRunner):
                 clear_events.send(request)
             raise
 
-        # Update the job data regardless of the execution status of the job. Successes should be reported as well as
-        # failures.
+        # Update the job data and save the script's log regardless of the execution status of the job. Successes
+        # should be reported as well as failures.
         finally:
             self.job.data = script.get_job_data()
+            script.log_writer.save()
 
     def run(self, data, request=None, commit=True, **kwargs):
         """
@@ -110,3 +114,73 @@ class ScriptJob(JobRunner):
                 self.run_script(script, request, data, commit)
         else:
             self.run_script(script, request, data, commit)
+
+
+class CustomFieldIndexJob(JobRunner):
+    """
+    Create and drop the database indexes for a CustomField to reflect its current configuration. An index is
+    maintained on the table of each assigned object type while the field is marked as indexed; any other indexes
+    belonging to the field (e.g. those for object types which have since been unassigned, or reflecting a prior name)
+    are dropped. Indexes are built concurrently to avoid blocking writes to the affected tables.
+    """
+
+    class Meta:
+        name = 'Custom Field Indexing'
+
+    def get_existing_indexes(self, custom_field_id):
+        """
+        Return a dictionary mapping the name of each existing index for the CustomField to its validity.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT c.relname, i.indisvalid FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                "WHERE starts_with(c.relname, %s)",
+                [f'{CUSTOMFIELD_INDEX_PREFIX}{custom_field_id}_']
+            )
+            return dict(cursor.fetchall())
+
+    def get_desired_indexes(self, custom_field):
+        """
+        Return a dictionary mapping the name of each index required by the CustomField to its CREATE INDEX statement
+        and parameters.
+        """
+        if custom_field is None or not custom_field.indexed or custom_field.index_method is None:
+            return {}
+
+        quote_name = connection.ops.quote_name
+        opclass = ' jsonb_path_ops' if custom_field.index_method == 'gin' else ''
+        indexes = {}
+        for object_type in custom_field.object_types.all():
+            if (model := object_type.model_class()) is None:
+                continue
+            name = custom_field.get_index_name(object_type)
+            sql = (
+                f"CREATE INDEX {{concurrently}} IF NOT EXISTS {quote_name(name)} "
+                f"ON {quote_name(model._meta.db_table)} USING {custom_field.index_method} "
+                f"(({quote_name('custom_field_data')} -> %s){opclass})"
+            )
+            indexes[name] = (sql, [custom_field.name])
+        return indexes
+
+    def run(self, custom_field_id, *args, **kwargs):
+        custom_field = CustomField.objects.filter(pk=custom_field_id).first()
+        existing_indexes = self.get_existing_indexes(custom_field_id)
+        desired_indexes = self.get_desired_indexes(custom_field)
+
+        # Indexes cannot be created or dropped concurrently within a transaction
+        concurrently = 'CONCURRENTLY' if not connection.in_atomic_block else ''
+        logger = logging.getLogger('netbox.jobs.custom_field_index')
+
+        with connection.cursor() as cursor:
+
+            # Drop any unneeded indexes, along with any left invalid by a failed build
+            for name, valid in existing_indexes.items():
+                if name not in desired_indexes or not valid:
+                    logger.info(f"Dropping index {name}")
+                    cursor.execute(f"DROP INDEX {concurrently} IF EXISTS {connection.ops.quote_name(name)}")
+
+            # Create any missing indexes
+            for name, (sql, params) in desired_indexes.items():
+                if existing_indexes.get(name) is not True:
+                    logger.info(f"Creating index {name}")
+                    cursor.execute(sql.format(concurrently=concurrently), params)
@@ -1,23 +1,122 @@
+import gzip
+import os
+from contextlib import ExitStack
 from datetime import timedelta
 from importlib import import_module
 
 import requests
 from django.conf import settings
 from django.core.cache import cache
-from django.core.management.base import BaseCommand
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
 from packaging import version
 
 from core.models import Job, ObjectChange
+from core.partitioning import PARTITIONS_AHEAD, create_partitions, drop_expired_partitions, is_partitioned
+from extras.models import ScriptLogEntry
 from netbox.config import Config
 from utilities.proxy import resolve_proxies
+from utilities.purge import PURGE_BATCH_SIZE, archive_queryset, purge_queryset
 
 
 class Command(BaseCommand):
     help = "Perform nightly housekeeping tasks. (This command can be run at any time.)"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=PURGE_BATCH_SIZE,
+            help=f"Number of expired records to delete per transaction (default: {PURGE_BATCH_SIZE})"
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=0,
+            help="Number of seconds to pause between batches of deletions (default: 0)"
+        )
+        parser.add_argument(
+            '--archive-dir',
+            help="Archive expired changelog records to a compressed JSON Lines file in this directory prior to "
+                 "deleting them"
+        )
+
+    def open_archive(self, stack, name, options):
+        """
+        Open a gzip-compressed JSON Lines file to which expired records will be archived, if an archive directory has
+        been specified. Returns None otherwise.
+        """
+        if not options['archive_dir']:
+            return None
+        filename = f"{name}-{timezone.now():%Y%m%dT%H%M%S}.jsonl.gz"
+        path = os.path.join(options['archive_dir'], filename)
+        if options['verbosity']:
+            self.stdout.write(f"\tArchiving expired records to {path}")
+        return stack.enter_context(gzip.open(path, 'wt', encoding='utf-8'))
+
+    def drop_partitions(self, cutoff, options, archive=None):
+        """
+        Drop all changelog partitions which contain only expired records, archiving their records first (if an
+        archive has been specified).
+        """
+        def archive_partition(lower_bound, upper_bound):
+            if archive is not None:
+                archive_queryset(
+                    ObjectChange.objects.filter(time__gte=lower_bound, time__lt=upper_bound),
+                    archive,
+                    batch_size=options['batch_size']
+                )
+
+        dropped = drop_expired_partitions(cutoff, callback=archive_partition)
+        if options['verbosity'] and dropped:
+            self.stdout.write(f"\tDropped {len(dropped)} expired partitions: {', '.join(dropped)}", self.style.SUCCESS)
+
+    def purge(self, queryset, options, archive=None):
+        """
+        Delete the objects matching a QuerySet in batches, reporting progress. If an archive has been specified, the
+        objects are first written to it.
+        """
+        verbosity = options['verbosity']
+        model_name = queryset.model._meta.verbose_name_plural
+
+        def report_progress(deleted):
+            if verbosity >= 2:
+                self.stdout.write(f"\tDeleted {deleted} {model_name}...")
+
+        deleted = purge_queryset(
+            queryset,
+            batch_size=options['batch_size'],
+            delay=options['sleep'],
+            archive=archive,
+            callback=report_progress
+        )
+
+        if not verbosity:
+            return
+        if deleted:
+            self.stdout.write(f"\tDeleted {deleted} expired records.", self.style.SUCCESS)
+        else:
+            self.stdout.write("\tNo expired records found.", self.style.SUCCESS)
+
+    def delete_files(self, paths, options):
+        """
+        Delete the given files from storage (if they exist).
+        """
+        deleted = 0
+        for path in paths:
+            if default_storage.exists(path):
+                default_storage.delete(path)
+                deleted += 1
+        if options['verbosity'] and deleted:
+            self.stdout.write(f"\tDeleted {deleted} job output files.", self.style.SUCCESS)
+
     def handle(self, *args, **options):
         config = Config()
+        if options['batch_size'] < 1:
+            raise CommandError("Batch size must be a positive integer.")
+        if options['archive_dir'] and not os.path.isdir(options['archive_dir']):
+            raise CommandError(f"Archive directory does not exist: {options['archive_dir']}")
 
         # Clear expired authentication sessions (essentially replicating the `clearsessions` command)
         if options['verbosity']:
@@ -36,6 +135,15 @@ class Command(BaseCommand):
                     f"clearing sessions; skipping."
                 )
 
+        # Create partitions for upcoming changelog records
+        if is_partitioned():
+            if options['verbosity']:
+                self.stdout.write("[*] Creating changelog partitions")
+            now = timezone.now()
+            created = create_partitions(now, now + timedelta(days=31 * PARTITIONS_AHEAD))
+            if options['verbosity']:
+                self.stdout.write(f"\tCreated {len(created)} partitions.", self.style.SUCCESS)
+
         # Delete expired ObjectChanges
         if options['verbosity']:
             self.stdout.write("[*] Checking for expired changelog records")
@@ -44,20 +152,11 @@ class Command(BaseCommand):
             if options['verbosity'] >= 2:
                 self.stdout.write(f"\tRetention period: {config.CHANGELOG_RETENTION} days")
                 self.stdout.write(f"\tCut-off time: {cutoff}")
-            expired_records = ObjectChange.objects.filter(time__lt=cutoff).count()
-            if expired_records:
-                if options['verbosity']:
-                    self.stdout.write(
-                        f"\tDeleting {expired_records} expired records... ",
-                        self.style.WARNING,
-                        ending=""
-                    )
-                    self.stdout.flush()
-                ObjectChange.objects.filter(time__lt=cutoff).delete()
-                if options['verbosity']:
-                    self.stdout.write("Done.", self.style.SUCCESS)
-            elif options['verbosity']:
-                self.stdout.write("\tNo expired records found.", self.style.SUCCESS)
+            with ExitStack() as stack:
+                archive = self.open_archive(stack, 'changelog', options)
+                if is_partitioned():
+                    self.drop_partitions(cutoff, options, archive=archive)
+                self.purge(ObjectChange.objects.filter(time__lt=cutoff), options, archive=archive)
         elif options['verbosity']:
             self.stdout.write(
                 f"\tSkipping: No retention period specified (CHANGELOG_RETENTION = {config.CHANGELOG_RETENTION})"
@@ -71,20 +170,15 @@ class Command(BaseCommand):
             if options['verbosity'] >= 2:
                 self.stdout.write(f"\tRetention period: {config.JOB_RETENTION} days")
                 self.stdout.write(f"\tCut-off time: {cutoff}")
-            expired_records = Job.objects.filter(created__lt=cutoff).count()
-            if expired_records:
-                if options['verbosity']:
-                    self.stdout.write(
-                        f"\tDeleting {expired_records} expired records... ",
-                        self.style.WARNING,
-                        ending=""
-                    )
-                    self.stdout.flush()
-                Job.objects.filter(created__lt=cutoff).delete()
-                if options['verbosity']:
-                    self.stdout.write("Done.", self.style.SUCCESS)
-            elif options['verbosity']:
-                self.stdout.write("\tNo expired records found.", self.style.SUCCESS)
+            # Script log entries are purged first, as they reference the expired Jobs
+            self.purge(ScriptLogEntry.objects.filter(job__created__lt=cutoff), options)
+            # Expired Jobs are deleted without calling Job.delete(), so any files they produced are deleted here
+            output_files = Job.objects.filter(created__lt=cutoff, data__has_key='file').values_list(
+                'data__file', flat=True
+            )
+            output_files = [path for path in output_files if isinstance(path, str)]
+            self.purge(Job.objects.filter(created__lt=cutoff), options)
+            self.delete_files(output_files, options)
         elif options['verbosity']:
             self.stdout.write(
                 f"\tSkipping: No retention period specified (JOB_RETENTION = {config.JOB_RETENTION})"
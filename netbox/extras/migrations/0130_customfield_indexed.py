@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('extras', '0129_fix_script_paths'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customfield',
+            name='indexed',
+            field=models.BooleanField(default=False),
+        ),
+    ]
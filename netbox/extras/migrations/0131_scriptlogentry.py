@@ -0,0 +1,42 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_objectchange_partitioning'),
+        ('extras', '0130_customfield_indexed'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScriptLogEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False)),
+                ('index', models.PositiveIntegerField()),
+                ('time', models.DateTimeField()),
+                ('status', models.CharField(max_length=30)),
+                ('message', models.TextField()),
+                ('object_repr', models.CharField(blank=True, max_length=200, null=True)),
+                ('url', models.CharField(blank=True, max_length=200, null=True)),
+                (
+                    'job',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='script_log_entries',
+                        to='core.job'
+                    )
+                ),
+            ],
+            options={
+                'verbose_name': 'script log entry',
+                'verbose_name_plural': 'script log entries',
+                'ordering': ('job', 'index'),
+                'indexes': [models.Index(fields=['job', 'status', 'index'], name='extras_scri_job_id_83601e_idx')],
+                'constraints': [
+                    models.UniqueConstraint(fields=('job', 'index'), name='extras_scriptlogentry_unique_job_index')
+                ],
+            },
+        ),
+    ]
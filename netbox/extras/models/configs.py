@@ -122,6 +122,8 @@ class ConfigContext(SyncedDataMixin, CloningMixin, CustomLinksMixin, ChangeLogge
         'tenants', 'tags', 'data',
     )
 
+    sync_fields = ('data',)
+
     class Meta:
         ordering = ['weight', 'name']
         verbose_name = _('config context')
@@ -220,6 +222,8 @@ class ConfigTemplate(
         blank=True
     )
 
+    sync_fields = ('template_code',)
+
     class Meta:
         ordering = ('name',)
         verbose_name = _('config template')
@@ -1,14 +1,17 @@
 import decimal
+import hashlib
 import json
 import re
+import uuid
 from datetime import datetime, date
 
 import django_filters
 from django import forms
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
+from django.core.cache import cache
 from django.core.validators import RegexValidator, ValidationError
-from django.db import models
+from django.db import connection, models, transaction
 from django.db.models import F, Func, Value
 from django.db.models.expressions import RawSQL
 from django.urls import reverse
@@ -18,6 +21,7 @@ from django.utils.translation import gettext_lazy as _
 
 from core.models import ObjectType
 from extras.choices import *
+from extras.constants import CUSTOMFIELD_INDEX_METHODS, CUSTOMFIELD_INDEX_PREFIX
 from extras.data import CHOICE_SETS
 from netbox.models import ChangeLoggedModel
 from netbox.models.features import CloningMixin, ExportTemplatesMixin
@@ -38,6 +42,8 @@ __all__ = (
     'CustomField',
     'CustomFieldChoiceSet',
     'CustomFieldManager',
+    'CustomFieldRegistry',
+    'custom_field_registry',
 )
 
 SEARCH_TYPES = {
@@ -50,6 +56,66 @@ SEARCH_TYPES = {
 }
 
 
+class CustomFieldRegistry:
+    """
+    A process-wide, in-memory registry of the CustomFields assigned to each object type. The registry is stamped with
+    a version which is shared among all processes via the cache: Any change to a CustomField or CustomFieldChoiceSet
+    assigns a new version, and each process discards its registry upon detecting a new version. The version is checked
+    at the start of each request (see refresh()). The registry is not populated from within a transaction.
+    """
+    cache_key = 'custom_fields_version'
+
+    def __init__(self):
+        self._version = None
+        self._custom_fields = {}
+
+    def refresh(self):
+        """
+        Discard the registry if its version is no longer current.
+        """
+        version = cache.get(self.cache_key)
+        if version is None:
+            cache.add(self.cache_key, uuid.uuid4().hex, None)
+            version = cache.get(self.cache_key)
+        if version != self._version:
+            self._custom_fields = {}
+            self._version = version
+
+    def invalidate(self):
+        """
+        Discard the registry and assign a new version, such that all other processes discard their registries as well.
+        This is repeated once the current transaction has been committed, in case another process has repopulated its
+        registry with the prior (committed) data in the interim.
+        """
+        def _invalidate():
+            self._custom_fields = {}
+            self._version = None
+            cache.set(self.cache_key, uuid.uuid4().hex, None)
+
+        _invalidate()
+        transaction.on_commit(_invalidate)
+
+    def get_for_model(self, model):
+        """
+        Return a tuple of all CustomFields assigned to the given model.
+        """
+        if self._version is None:
+            self.refresh()
+        object_type = ObjectType.objects.get_for_model(model._meta.concrete_model)
+        custom_fields = self._custom_fields.get(object_type.pk)
+        if custom_fields is None:
+            custom_fields = tuple(
+                CustomField.objects.filter(object_types=object_type).select_related('choice_set', 'related_object_type')
+            )
+            # Avoid populating the registry from within a transaction, which may yet be rolled back
+            if not connection.in_atomic_block:
+                self._custom_fields[object_type.pk] = custom_fields
+        return custom_fields
+
+
+custom_field_registry = CustomFieldRegistry()
+
+
 class CustomFieldManager(models.Manager.from_queryset(RestrictedQuerySet)):
     use_in_migrations = True
 
@@ -60,13 +126,20 @@ class CustomFieldManager(models.Manager.from_queryset(RestrictedQuerySet)):
         content_type = ObjectType.objects.get_for_model(model._meta.concrete_model)
         return self.get_queryset().filter(object_types=content_type)
 
+    def get_cached_for_model(self, model):
+        """
+        Return a tuple of all CustomFields assigned to the given model from the process-wide registry. Unlike
+        get_for_model(), this does not query the database once the registry has been populated. The returned
+        CustomFields are shared and must not be modified.
+        """
+        return custom_field_registry.get_for_model(model)
+
     def get_defaults_for_model(self, model):
         """
         Return a dictionary of serialized default values for all CustomFields applicable to the given model.
         """
-        custom_fields = self.get_for_model(model).filter(default__isnull=False)
         return {
-            cf.name: cf.default for cf in custom_fields
+            cf.name: cf.default for cf in self.get_cached_for_model(model) if cf.default is not None
         }
 
 
@@ -153,6 +226,11 @@ class CustomField(CloningMixin, ExportTemplatesMixin, ChangeLoggedModel):
         default=CustomFieldFilterLogicChoices.FILTER_LOOSE,
         help_text=_("Loose matches any instance of a given string; exact matches the entire field.")
     )
+    indexed = models.BooleanField(
+        verbose_name=_('indexed'),
+        default=False,
+        help_text=_("Maintain a database index to accelerate filtering on this field")
+    )
     default = models.JSONField(
         verbose_name=_('default'),
         blank=True,
@@ -232,7 +310,7 @@ class CustomField(CloningMixin, ExportTemplatesMixin, ChangeLoggedModel):
 
     clone_fields = (
         'object_types', 'type', 'related_object_type', 'group_name', 'description', 'required', 'unique',
-        'search_weight', 'filter_logic', 'default', 'weight', 'validation_minimum', 'validation_maximum',
+        'search_weight', 'filter_logic', 'indexed', 'default', 'weight', 'validation_minimum', 'validation_maximum',
         'validation_regex', 'choice_set', 'ui_visible', 'ui_editable', 'is_cloneable',
     )
 
@@ -256,11 +334,28 @@ class CustomField(CloningMixin, ExportTemplatesMixin, ChangeLoggedModel):
 
         # Cache instance's original name so we can check later whether it has changed
         self._name = self.__dict__.get('name')
+        # Cache the attributes which determine the field's database indexes, so we can check whether they have changed
+        self._index_attrs = (self.__dict__.get('name'), self.__dict__.get('type'), self.__dict__.get('indexed'))
 
     @property
     def search_type(self):
         return SEARCH_TYPES.get(self.type)
 
+    @property
+    def index_method(self):
+        """
+        Return the type of database index to be built for this field (if indexed).
+        """
+        return CUSTOMFIELD_INDEX_METHODS.get(self.type)
+
+    def get_index_name(self, object_type):
+        """
+        Return the name of the database index for this field on the given object type's table. The name incorporates
+        a digest of the field's name and type, such that changing either replaces the index.
+        """
+        digest = hashlib.sha256(f'{self.name}:{self.type}'.encode()).hexdigest()[:8]
+        return f'{CUSTOMFIELD_INDEX_PREFIX}{self.pk}_{object_type.pk}_{digest}'
+
     @property
     def choices(self):
         if self.choice_set:
@@ -363,6 +458,20 @@ class CustomField(CloningMixin, ExportTemplatesMixin, ChangeLoggedModel):
                 'validation_regex': _("Regular expression validation is supported only for text and URL fields")
             })
 
+        # Indexing is supported only for certain field types, and only for exact matching of text values
+        if self.indexed:
+            if self.index_method is None:
+                raise ValidationError({
+                    'indexed': _("{type} fields cannot be indexed.").format(type=self.get_type_display())
+                })
+            if (
+                self.index_method == 'hash' and
+                self.filter_logic == CustomFieldFilterLogicChoices.FILTER_LOOSE
+            ):
+                raise ValidationError({
+                    'indexed': _("Indexed text fields must employ exact filter logic.")
+                })
+
         # Uniqueness can not be enforced for boolean fields
         if self.unique and self.type == CustomFieldTypeChoices.TYPE_BOOLEAN:
             raise ValidationError({
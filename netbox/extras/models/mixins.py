@@ -1,15 +1,20 @@
+import hashlib
 import importlib.abc
 import importlib.util
+import logging
 import os
 import sys
+import time
+from itertools import chain
 from django.core.files.storage import storages
 from django.db import models
 from django.utils.translation import gettext_lazy as _
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 
 from extras.constants import DEFAULT_MIME_TYPE
 from extras.utils import filename_from_model, filename_from_object
-from utilities.jinja2 import render_jinja2
+from utilities.export import buffer_content
+from utilities.jinja2 import render_jinja2, stream_jinja2
 
 
 __all__ = (
@@ -17,21 +22,65 @@ __all__ = (
     'RenderTemplateMixin',
 )
 
+logger = logging.getLogger('netbox.scripts')
+
+# Loaded Python modules (per process), mapping each module's file root & path to the SHA256 hash of its source code,
+# the module itself, and the modification times of any local modules upon which it depends
+_module_cache = {}
+
+
+def _get_dependencies(root_path, exclude=None):
+    """
+    Return a dictionary mapping the name of each loaded module located beneath `root_path` (e.g. a helper module
+    imported by a script) to its file path and modification time.
+    """
+    dependencies = {}
+    if not root_path:
+        return dependencies
+    root_path = os.path.join(os.path.abspath(root_path), '')
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, '__file__', None)
+        if name == exclude or not path or not os.path.abspath(path).startswith(root_path):
+            continue
+        try:
+            dependencies[name] = (path, os.path.getmtime(path))
+        except OSError:
+            continue
+    return dependencies
+
+
+def _dependencies_changed(dependencies):
+    """
+    Return the names of any dependencies whose files have been modified or removed since they were loaded.
+    """
+    changed = []
+    for name, (path, mtime) in dependencies.items():
+        try:
+            if os.path.getmtime(path) != mtime:
+                changed.append(name)
+        except OSError:
+            changed.append(name)
+    return changed
+
 
 class CustomStoragesLoader(importlib.abc.Loader):
     """
     Custom loader for exec_module to use django-storages instead of the file system.
     """
-    def __init__(self, filename):
+    def __init__(self, filename, code=None):
         self.filename = filename
+        self.code = code
 
     def create_module(self, spec):
         return None  # Use default module creation
 
-    def exec_module(self, module):
+    def read(self):
         storage = storages.create_storage(storages.backends["scripts"])
         with storage.open(self.filename, 'rb') as f:
-            code = f.read()
+            return f.read()
+
+    def exec_module(self, module):
+        code = self.code if self.code is not None else self.read()
         exec(code, module.__dict__)
 
 
@@ -61,18 +110,46 @@ class PythonModuleMixin:
         else:
             return name
 
+    @property
+    def module_cache_key(self):
+        return self.file_root, self.file_path
+
+    def clear_module_cache(self):
+        """
+        Discard the cached module (if any), along with any modules it imported from the file root.
+        """
+        _, _, dependencies = _module_cache.pop(self.module_cache_key, (None, None, {}))
+        for name in dependencies:
+            sys.modules.pop(name, None)
+        sys.modules.pop(self.python_name, None)
+
     def get_module(self):
         """
         Load the module using importlib, but use a custom loader to use django-storages
-        instead of the file system.
+        instead of the file system. Loaded modules are cached by the hash of their source
+        code, and reused until the file or any local module it imports has changed.
         """
         spec = importlib.util.spec_from_file_location(self.python_name, self.name)
         if spec is None:
             raise ModuleNotFoundError(f"Could not find module: {self.python_name}")
         loader = CustomStoragesLoader(self.name)
-        module = importlib.util.module_from_spec(spec)
+        loader.code = loader.read()
+        code_hash = hashlib.sha256(loader.code).hexdigest()
+
+        cached_hash, module, dependencies = _module_cache.get(self.module_cache_key, (None, None, {}))
+        changed_dependencies = _dependencies_changed(dependencies)
+        if cached_hash != code_hash or changed_dependencies:
+            start_time = time.perf_counter()
+            # Discard any modified dependencies so that they are imported anew
+            for name in changed_dependencies:
+                sys.modules.pop(name, None)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[self.python_name] = module
+            loader.exec_module(module)
+            dependencies = _get_dependencies(self._resolve_root_path(), exclude=self.python_name)
+            _module_cache[self.module_cache_key] = (code_hash, module, dependencies)
+            logger.debug(f"Loaded module {self.python_name} in {(time.perf_counter() - start_time) * 1000:.1f}ms")
         sys.modules[self.python_name] = module
-        loader.exec_module(module)
 
         return module
 
@@ -138,12 +215,40 @@ class RenderTemplateMixin(models.Model):
 
         return output
 
-    def render_to_response(self, context=None, queryset=None):
-        output = self.render(context=context, queryset=queryset)
+    def render_stream(self, context=None, queryset=None):
+        """
+        Render the template with the provided context, returning a generator which yields the rendered output in
+        chunks. This avoids holding the entire rendered output in memory.
+        """
+        context = self.get_context(context=context, queryset=queryset)
+        env_params = self.environment_params or {}
+        stream = stream_jinja2(self.template_code, context, env_params, getattr(self, 'data_file', None))
+
+        # Replace CRLF-style line terminators (retaining any trailing CR until the next chunk has been rendered)
+        remainder = ''
+        for chunk in buffer_content(stream):
+            chunk = (remainder + chunk).replace('\r\n', '\n')
+            chunk, remainder = (chunk[:-1], '\r') if chunk.endswith('\r') else (chunk, '')
+            yield chunk
+        if remainder:
+            yield remainder
+
+    def render_to_response(self, context=None, queryset=None, stream=False):
+        """
+        Render the template and return it as an HTTP response. If `stream` is True, the rendered output is sent to
+        the client incrementally using a StreamingHttpResponse.
+        """
         mime_type = self.mime_type or DEFAULT_MIME_TYPE
 
         # Build the response
-        response = HttpResponse(output, content_type=mime_type)
+        if stream:
+            # Render the first chunk immediately so that any errors are raised before the response is returned
+            output = self.render_stream(context=context, queryset=queryset)
+            first_chunk = next(output, '')
+            response = StreamingHttpResponse(chain((first_chunk,), output), content_type=mime_type)
+        else:
+            output = self.render(context=context, queryset=queryset)
+            response = HttpResponse(output, content_type=mime_type)
 
         if self.as_attachment:
             extension = f'.{self.file_extension}' if self.file_extension else ''
@@ -1,11 +1,13 @@
 import json
 import urllib.parse
+import weakref
 
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.postgres.fields import ArrayField
+from django.core.cache import cache
 from django.core.validators import ValidationError
-from django.db import models
+from django.db import connection, models, transaction
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -18,11 +20,13 @@ from extras.constants import *
 from extras.utils import image_upload
 from extras.models.mixins import RenderTemplateMixin
 from netbox.config import get_config
+from netbox.context import current_request
 from netbox.events import get_event_type_choices
 from netbox.models import ChangeLoggedModel
 from netbox.models.features import (
     CloningMixin, CustomFieldsMixin, CustomLinksMixin, ExportTemplatesMixin, SyncedDataMixin, TagsMixin
 )
+from utilities.export import StreamingQuerySet
 from utilities.html import clean_html
 from utilities.jinja2 import render_jinja2
 from utilities.querydict import dict_to_querydict
@@ -404,6 +408,8 @@ class ExportTemplate(SyncedDataMixin, CloningMixin, ExportTemplatesMixin, Change
         'object_types', 'template_code', 'mime_type', 'file_name', 'file_extension', 'as_attachment',
     )
 
+    sync_fields = ('template_code',)
+
     class Meta:
         ordering = ('name',)
         verbose_name = _('export template')
@@ -435,6 +441,9 @@ class ExportTemplate(SyncedDataMixin, CloningMixin, ExportTemplatesMixin, Change
     sync_data.alters_data = True
 
     def get_context(self, context=None, queryset=None):
+        # Iterate over the QuerySet in chunks, rather than loading all objects into memory
+        if isinstance(queryset, models.QuerySet):
+            queryset = StreamingQuerySet(queryset)
         _context = {
             'queryset': queryset,
         }
@@ -446,6 +455,83 @@ class ExportTemplate(SyncedDataMixin, CloningMixin, ExportTemplatesMixin, Change
         return _context
 
 
+# The SavedFilters resolved during each request
+_resolved_saved_filters = weakref.WeakKeyDictionary()
+
+
+class SavedFilterManager(models.Manager.from_queryset(RestrictedQuerySet)):
+    cache_key = 'saved_filters'
+
+    def get_cached(self):
+        """
+        Return a dictionary of the form {'slugs': {slug: id}, 'parameters': {id: parameters}} representing all
+        SavedFilters. This is retrieved from the cache if possible; otherwise, it is populated from the database
+        (except from within a transaction, which may yet be rolled back).
+        """
+        saved_filters = cache.get(self.cache_key)
+        if saved_filters is None:
+            saved_filters = {'slugs': {}, 'parameters': {}}
+            for pk, slug, parameters in self.get_queryset().values_list('pk', 'slug', 'parameters'):
+                saved_filters['slugs'][slug] = pk
+                saved_filters['parameters'][pk] = parameters
+            if not connection.in_atomic_block:
+                cache.set(self.cache_key, saved_filters, None)
+        return saved_filters
+
+    def invalidate_cache(self):
+        """
+        Discard the cached SavedFilters. This is repeated once the current transaction has been committed, in case
+        another process has repopulated the cache with the prior (committed) data in the interim.
+        """
+        cache.delete(self.cache_key)
+        transaction.on_commit(lambda: cache.delete(self.cache_key))
+
+    def resolve(self, slugs=(), pks=()):
+        """
+        Return the parameters of the SavedFilters identified by the given slugs and/or IDs as a list of (key, values)
+        tuples, along with a list of any references which could not be resolved. Each SavedFilter is applied only
+        once, even if referenced by both its slug and its ID. The result is retained for the duration of the current
+        request.
+        """
+        slugs = [slugs] if isinstance(slugs, str) else list(slugs)
+        pks = [pks] if isinstance(pks, (str, int)) else list(pks)
+
+        request = current_request.get()
+        resolved = _resolved_saved_filters.setdefault(request, {}) if request is not None else {}
+        key = (tuple(slugs), tuple(str(pk) for pk in pks))
+        if key in resolved:
+            return resolved[key]
+
+        saved_filters = self.get_cached()
+        resolved_pks = []
+        errors = []
+        for slug in slugs:
+            if (pk := saved_filters['slugs'].get(slug)) is None:
+                errors.append(_("Saved filter not found: {slug}").format(slug=slug))
+            elif pk not in resolved_pks:
+                resolved_pks.append(pk)
+        for value in pks:
+            try:
+                pk = int(value)
+            except (TypeError, ValueError):
+                pk = None
+            if pk not in saved_filters['parameters']:
+                errors.append(_("Saved filter not found: {id}").format(id=value))
+            elif pk not in resolved_pks:
+                resolved_pks.append(pk)
+
+        parameters = []
+        for pk in resolved_pks:
+            for param, value in saved_filters['parameters'][pk].items():
+                # QueryDicts are... fun
+                if type(value) not in (list, tuple):
+                    value = [value]
+                parameters.append((param, list(value)))
+
+        resolved[key] = parameters, errors
+        return resolved[key]
+
+
 class SavedFilter(CloningMixin, ExportTemplatesMixin, ChangeLoggedModel):
     """
     A set of predefined keyword parameters that can be reused to filter for specific objects.
@@ -492,6 +578,8 @@ class SavedFilter(CloningMixin, ExportTemplatesMixin, ChangeLoggedModel):
         verbose_name=_('parameters')
     )
 
+    objects = SavedFilterManager()
+
     clone_fields = (
         'object_types', 'weight', 'enabled', 'parameters',
     )
@@ -12,6 +12,7 @@ from django.utils.translation import gettext_lazy as _
 
 from core.choices import ManagedFileRootPathChoices
 from core.models import ManagedFile
+from extras.choices import LogLevelChoices
 from extras.utils import is_script
 from netbox.models.features import JobsMixin, EventRulesMixin
 from utilities.querysets import RestrictedQuerySet
@@ -19,6 +20,7 @@ from .mixins import PythonModuleMixin
 
 __all__ = (
     'Script',
+    'ScriptLogEntry',
     'ScriptModule',
 )
 
@@ -84,6 +86,63 @@ class Script(EventRulesMixin, JobsMixin):
             self.id = None
 
 
+class ScriptLogEntry(models.Model):
+    """
+    A single message logged by a script during its execution. Log entries are stored individually (rather than within
+    the Job's data) so that the logs of long-running scripts may be paginated and filtered efficiently.
+    """
+    job = models.ForeignKey(
+        to='core.Job',
+        on_delete=models.CASCADE,
+        related_name='script_log_entries'
+    )
+    index = models.PositiveIntegerField(
+        verbose_name=_('line')
+    )
+    time = models.DateTimeField(
+        verbose_name=_('time')
+    )
+    status = models.CharField(
+        verbose_name=_('level'),
+        max_length=30,
+        choices=LogLevelChoices
+    )
+    message = models.TextField(
+        verbose_name=_('message')
+    )
+    object_repr = models.CharField(
+        verbose_name=_('object'),
+        max_length=200,
+        blank=True,
+        null=True
+    )
+    url = models.CharField(
+        verbose_name=_('URL'),
+        max_length=200,
+        blank=True,
+        null=True
+    )
+
+    objects = RestrictedQuerySet.as_manager()
+
+    class Meta:
+        ordering = ('job', 'index')
+        indexes = (
+            models.Index(fields=('job', 'status', 'index')),
+        )
+        constraints = (
+            models.UniqueConstraint(
+                fields=('job', 'index'),
+                name='extras_scriptlogentry_unique_job_index'
+            ),
+        )
+        verbose_name = _('script log entry')
+        verbose_name_plural = _('script log entries')
+
+    def __str__(self):
+        return f'{self.job_id}:{self.index}'
+
+
 class ScriptModuleManager(models.Manager.from_queryset(RestrictedQuerySet)):
 
     def get_queryset(self):
@@ -180,6 +239,7 @@ class ScriptModule(PythonModuleMixin, JobsMixin, ManagedFile):
             )
 
     def sync_data(self):
+        self.clear_module_cache()
         super().sync_data()
 
     def save(self, *args, **kwargs):
@@ -187,6 +247,10 @@ class ScriptModule(PythonModuleMixin, JobsMixin, ManagedFile):
         super().save(*args, **kwargs)
         self.sync_classes()
 
+    def delete(self, *args, **kwargs):
+        self.clear_module_cache()
+        return super().delete(*args, **kwargs)
+
 
 @receiver(post_save, sender=ScriptModule)
 def script_module_post_save_handler(instance, created, **kwargs):
@@ -3,6 +3,8 @@ import json
 import logging
 import os
 import re
+import tempfile
+from itertools import islice
 
 import yaml
 from django import forms
@@ -14,7 +16,8 @@ from django.utils.functional import classproperty
 from django.utils.translation import gettext as _
 
 from extras.choices import LogLevelChoices
-from extras.models import ScriptModule
+from extras.constants import SCRIPT_LOG_BATCH_SIZE
+from extras.models import ScriptLogEntry, ScriptModule
 from ipam.formfields import IPAddressFormField, IPNetworkFormField
 from ipam.validators import MaxPrefixLengthValidator, MinPrefixLengthValidator, prefix_validator
 from utilities.forms import add_blank_choice
@@ -283,6 +286,58 @@ class IPNetworkVar(ScriptVariable):
 # Scripts
 #
 
+class ScriptLogWriter:
+    """
+    Spool the messages logged by a script to a temporary file while it runs, and save them as ScriptLogEntries once it
+    has finished. Messages are written to the spool file in batches, so memory consumption does not grow with the
+    length of the log. Log entries are saved only after the script's transaction has ended, so that they are retained
+    even if its database changes are reverted.
+    """
+    def __init__(self, job, batch_size=SCRIPT_LOG_BATCH_SIZE):
+        self.job = job
+        self.batch_size = batch_size
+        self.count = 0
+        self._buffer = []
+        self._file = tempfile.TemporaryFile(mode='w+', encoding='utf-8')
+
+    def append(self, entry):
+        self._buffer.append(entry)
+        self.count += 1
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Write all buffered messages to the spool file.
+        """
+        self._file.writelines(json.dumps(entry) + '\n' for entry in self._buffer)
+        self._buffer.clear()
+
+    def _get_log_entries(self):
+        self.flush()
+        self._file.seek(0)
+        for index, line in enumerate(self._file, start=1):
+            entry = json.loads(line)
+            yield ScriptLogEntry(
+                job=self.job,
+                index=index,
+                time=entry['time'],
+                status=entry['status'],
+                message=entry['message'],
+                object_repr=entry['obj'][:200] if entry['obj'] else None,
+                url=entry['url'][:200] if entry['url'] else None,
+            )
+
+    def save(self):
+        """
+        Save all spooled messages as ScriptLogEntries (in batches) and discard the spool file.
+        """
+        log_entries = self._get_log_entries()
+        while batch := list(islice(log_entries, self.batch_size)):
+            ScriptLogEntry.objects.bulk_create(batch)
+        self._file.close()
+
+
 class BaseScript:
     """
     Base model for custom scripts. User classes should inherit from this model if they want to extend Script
@@ -297,6 +352,7 @@ class BaseScript:
 
     def __init__(self):
         self.messages = []  # Primary script log
+        self.log_writer = None  # Streams the primary script log to the database (if set)
         self.tests = {}  # Mapping of logs for test methods
         self.output = ''
         self.failed = False
@@ -449,10 +505,12 @@ class BaseScript:
 
     def get_job_data(self):
         """
-        Return a dictionary of data to attach to the script's Job.
+        Return a dictionary of data to attach to the script's Job. Messages which have been streamed to the database
+        by the log writer are not included.
         """
         return {
             'log': self.messages,
+            'log_count': self.log_writer.count if self.log_writer is not None else len(self.messages),
             'output': self.output,
             'tests': self.tests,
         }
@@ -530,13 +588,17 @@ class BaseScript:
         elif message:
 
             # Record to the script's log
-            self.messages.append({
+            entry = {
                 'time': timezone.now().isoformat(),
                 'status': level,
                 'message': str(message),
                 'obj': str(obj) if obj else None,
                 'url': obj.get_absolute_url() if hasattr(obj, 'get_absolute_url') else None,
-            })
+            }
+            if self.log_writer is not None:
+                self.log_writer.append(entry)
+            else:
+                self.messages.append(entry)
 
             # Record to the system log
             if obj:
@@ -1,5 +1,6 @@
 from django.contrib.contenttypes.models import ContentType
-from django.db.models.signals import m2m_changed, post_save, pre_delete
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
 
 from core.events import *
@@ -8,10 +9,11 @@ from core.signals import job_end, job_start
 from extras.events import process_event_rules
 from extras.models import EventRule, Notification, Subscription
 from netbox.config import get_config
+from netbox.context import current_request
 from netbox.registry import registry
 from netbox.signals import post_clean
 from utilities.exceptions import AbortRequest
-from .models import CustomField, TaggedItem
+from .models import CustomField, CustomFieldChoiceSet, SavedFilter, TaggedItem, custom_field_registry
 from .utils import run_validators
 
 
@@ -50,10 +52,76 @@ def handle_cf_deleted(instance, **kwargs):
     instance.remove_stale_data(instance.object_types.all())
 
 
+def handle_cf_changed(**kwargs):
+    """
+    Invalidate the registry of CustomFields when a CustomField or CustomFieldChoiceSet is modified.
+    """
+    custom_field_registry.invalidate()
+
+
+def handle_cf_index_changed(instance, signal, **kwargs):
+    """
+    Enqueue a background job to create or drop the database indexes for an indexed CustomField when it is created,
+    deleted, or reassigned, or when any attribute determining its indexes (name, type, or indexed) is modified. At
+    most one job is enqueued per CustomField per transaction.
+    """
+    from extras.jobs import CustomFieldIndexJob
+
+    if not isinstance(instance, CustomField):
+        return
+    if kwargs.get('action') not in (None, 'post_add', 'post_remove', 'post_clear'):
+        return
+
+    was_indexed = instance._index_attrs[2]
+    if signal is post_save:
+        index_attrs = (instance.name, instance.type, instance.indexed)
+        changed = kwargs.get('created') or index_attrs != instance._index_attrs
+        instance._index_attrs = index_attrs
+        if not changed:
+            return
+    if not (instance.indexed or was_indexed):
+        return
+
+    # Defer the job until the transaction has been committed, so that changes to both the field and its assigned
+    # object types (e.g. by a single form submission) are handled by a single job
+    if getattr(instance, '_index_job_pending', False):
+        return
+    instance._index_job_pending = True
+    request = current_request.get()
+    user = request.user if request and request.user.is_authenticated else None
+    custom_field_id = instance.pk
+
+    def enqueue_job():
+        instance._index_job_pending = False
+        CustomFieldIndexJob.enqueue(user=user, custom_field_id=custom_field_id)
+
+    transaction.on_commit(enqueue_job)
+
+
 post_save.connect(handle_cf_renamed, sender=CustomField)
 pre_delete.connect(handle_cf_deleted, sender=CustomField)
 m2m_changed.connect(handle_cf_added_obj_types, sender=CustomField.object_types.through)
 m2m_changed.connect(handle_cf_removed_obj_types, sender=CustomField.object_types.through)
+post_save.connect(handle_cf_changed, sender=CustomField)
+post_delete.connect(handle_cf_changed, sender=CustomField)
+m2m_changed.connect(handle_cf_changed, sender=CustomField.object_types.through)
+post_save.connect(handle_cf_changed, sender=CustomFieldChoiceSet)
+post_delete.connect(handle_cf_changed, sender=CustomFieldChoiceSet)
+post_save.connect(handle_cf_index_changed, sender=CustomField)
+post_delete.connect(handle_cf_index_changed, sender=CustomField)
+m2m_changed.connect(handle_cf_index_changed, sender=CustomField.object_types.through)
+
+
+#
+# Saved filters
+#
+
+@receiver((post_save, post_delete), sender=SavedFilter)
+def handle_saved_filter_changed(**kwargs):
+    """
+    Invalidate the cached SavedFilters when a SavedFilter is modified.
+    """
+    SavedFilter.objects.invalidate_cache()
 
 
 #
@@ -27,6 +27,7 @@ __all__ = (
     'NotificationTable',
     'SavedFilterTable',
     'ReportResultsTable',
+    'ScriptLogEntryTable',
     'ScriptResultsTable',
     'ScriptJobTable',
     'SubscriptionTable',
@@ -98,6 +99,10 @@ class CustomFieldTable(NetBoxTable):
         verbose_name=_('Is Cloneable'),
         false_mark=None
     )
+    indexed = columns.BooleanColumn(
+        verbose_name=_('Indexed'),
+        false_mark=None
+    )
     validation_minimum = tables.Column(
         verbose_name=_('Minimum Value'),
     )
@@ -112,7 +117,7 @@ class CustomFieldTable(NetBoxTable):
         model = CustomField
         fields = (
             'pk', 'id', 'name', 'object_types', 'label', 'type', 'related_object_type', 'group_name', 'required',
-            'unique', 'default', 'description', 'search_weight', 'filter_logic', 'ui_visible', 'ui_editable',
+            'unique', 'default', 'description', 'search_weight', 'filter_logic', 'indexed', 'ui_visible', 'ui_editable',
             'is_cloneable', 'weight', 'choice_set', 'choices', 'validation_minimum', 'validation_maximum',
             'validation_regex', 'comments', 'created', 'last_updated',
         )
@@ -696,6 +701,41 @@ class ScriptResultsTable(BaseTable):
         return format_html("<a href='{}'>{}</a>", value, value)
 
 
+class ScriptLogEntryTable(BaseTable):
+    index = tables.Column(
+        verbose_name=_('Line')
+    )
+    time = columns.DateTimeColumn(
+        verbose_name=_('Time')
+    )
+    status = tables.TemplateColumn(
+        template_code="""{% load log_levels %}{% log_level record.status %}""",
+        verbose_name=_('Level')
+    )
+    object = tables.Column(
+        accessor='object_repr',
+        verbose_name=_('Object')
+    )
+    message = columns.MarkdownColumn(
+        verbose_name=_('Message')
+    )
+
+    class Meta(BaseTable.Meta):
+        model = ScriptLogEntry
+        empty_text = _(EMPTY_TABLE_TEXT)
+        fields = (
+            'index', 'time', 'status', 'object', 'message',
+        )
+        default_columns = (
+            'index', 'time', 'status', 'object', 'message',
+        )
+
+    def render_object(self, value, record):
+        if record.url:
+            return format_html("<a href='{}'>{}</a>", record.url, value)
+        return value
+
+
 class ScriptJobTable(JobTable):
     id = tables.TemplateColumn(
         template_code="""<a href="{% url 'extras:script_result' job_pk=record.pk %}">{{ record.id }}</a>""",
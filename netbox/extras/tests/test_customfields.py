@@ -1,7 +1,9 @@
 import datetime
 from decimal import Decimal
+from unittest.mock import patch
 
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.urls import reverse
 from rest_framework import status
 
@@ -10,7 +12,8 @@ from dcim.filtersets import SiteFilterSet
 from dcim.forms import SiteImportForm
 from dcim.models import Manufacturer, Rack, Site
 from extras.choices import *
-from extras.models import CustomField, CustomFieldChoiceSet
+from extras.jobs import CustomFieldIndexJob
+from extras.models import CustomField, CustomFieldChoiceSet, CustomFieldRegistry
 from ipam.models import VLAN
 from netbox.choices import CSVDelimiterChoices, ImportFormatChoices
 from utilities.testing import APITestCase, TestCase
@@ -613,6 +616,27 @@ class CustomFieldManagerTest(TestCase):
         self.assertEqual(CustomField.objects.get_for_model(Site).count(), 1)
         self.assertEqual(CustomField.objects.get_for_model(VirtualMachine).count(), 0)
 
+    def test_get_cached_for_model(self):
+        self.assertEqual(len(CustomField.objects.get_cached_for_model(Site)), 1)
+        self.assertEqual(len(CustomField.objects.get_cached_for_model(VirtualMachine)), 0)
+        self.assertEqual(CustomField.objects.get_defaults_for_model(Site), {'text_field': 'foo'})
+
+    def test_registry_invalidation(self):
+        registry = CustomFieldRegistry()
+        ObjectType.objects.get_for_model(Site)
+
+        # Simulate operation outside a transaction, in which case the registry is populated
+        with patch.object(connection, 'in_atomic_block', False):
+            self.assertEqual(len(registry.get_for_model(Site)), 1)
+            with self.assertNumQueries(0):
+                registry.get_for_model(Site)
+
+        # Creating a CustomField assigns a new version, causing the registry to be discarded upon refresh
+        custom_field = CustomField.objects.create(type=CustomFieldTypeChoices.TYPE_TEXT, name='text_field2')
+        custom_field.object_types.set([ObjectType.objects.get_for_model(Site)])
+        registry.refresh()
+        self.assertEqual(len(registry.get_for_model(Site)), 2)
+
 
 class CustomFieldAPITest(APITestCase):
 
@@ -1460,6 +1484,81 @@ class CustomFieldModelTest(TestCase):
         site.clean()
 
 
+class CustomFieldIndexTest(TestCase):
+
+    def test_indexed_field_validation(self):
+        cf = CustomField(type=CustomFieldTypeChoices.TYPE_JSON, name='json_field', indexed=True)
+        with self.assertRaises(ValidationError):
+            cf.full_clean()
+
+        cf = CustomField(
+            type=CustomFieldTypeChoices.TYPE_TEXT,
+            name='text_field',
+            filter_logic=CustomFieldFilterLogicChoices.FILTER_LOOSE,
+            indexed=True
+        )
+        with self.assertRaises(ValidationError):
+            cf.full_clean()
+
+        cf.filter_logic = CustomFieldFilterLogicChoices.FILTER_EXACT
+        cf.full_clean()
+
+    def test_index_job(self):
+        cf = CustomField.objects.create(type=CustomFieldTypeChoices.TYPE_INTEGER, name='integer_field', indexed=True)
+        cf.object_types.set([ObjectType.objects.get_for_model(Site)])
+        index_name = cf.get_index_name(ObjectType.objects.get_for_model(Site))
+        job = CustomFieldIndexJob(job=None)
+
+        # Create the index
+        job.run(custom_field_id=cf.pk)
+        self.assertEqual(job.get_existing_indexes(cf.pk), {index_name: True})
+
+        # Renaming the field replaces the index
+        cf.name = 'integer_field2'
+        cf.save()
+        job.run(custom_field_id=cf.pk)
+        new_index_name = cf.get_index_name(ObjectType.objects.get_for_model(Site))
+        self.assertNotEqual(new_index_name, index_name)
+        self.assertEqual(job.get_existing_indexes(cf.pk), {new_index_name: True})
+
+        # Disabling indexing drops the index
+        cf.indexed = False
+        cf.save()
+        job.run(custom_field_id=cf.pk)
+        self.assertEqual(job.get_existing_indexes(cf.pk), {})
+
+    @patch.object(CustomFieldIndexJob, 'enqueue')
+    def test_index_job_enqueued(self, mock_enqueue):
+        with self.captureOnCommitCallbacks(execute=True):
+            cf = CustomField.objects.create(
+                type=CustomFieldTypeChoices.TYPE_INTEGER,
+                name='integer_field',
+                indexed=True
+            )
+            cf.object_types.set([ObjectType.objects.get_for_model(Site)])
+        self.assertEqual(mock_enqueue.call_count, 1)
+
+        # Modifying attributes which do not affect the index does not enqueue a job
+        mock_enqueue.reset_mock()
+        with self.captureOnCommitCallbacks(execute=True):
+            cf.description = 'Foo'
+            cf.weight = 200
+            cf.save()
+        mock_enqueue.assert_not_called()
+
+        # Renaming the field enqueues a job
+        with self.captureOnCommitCallbacks(execute=True):
+            cf.name = 'integer_field2'
+            cf.save()
+        mock_enqueue.assert_called_once_with(user=None, custom_field_id=cf.pk)
+
+        # Reassigning object types enqueues a job
+        mock_enqueue.reset_mock()
+        with self.captureOnCommitCallbacks(execute=True):
+            cf.object_types.add(ObjectType.objects.get_for_model(Rack))
+        self.assertEqual(mock_enqueue.call_count, 1)
+
+
 class CustomFieldModelFilterTest(TestCase):
     queryset = Site.objects.all()
     filterset = SiteFilterSet
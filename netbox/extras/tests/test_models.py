@@ -1,12 +1,15 @@
 import tempfile
 from pathlib import Path
 
+from django.core.cache import cache
 from django.forms import ValidationError
+from django.http import QueryDict
 from django.test import tag, TestCase
 
 from core.models import DataSource, ObjectType
+from dcim.filtersets import SiteFilterSet
 from dcim.models import Device, DeviceRole, DeviceType, Location, Manufacturer, Platform, Region, Site, SiteGroup
-from extras.models import ConfigContext, ConfigTemplate, Tag
+from extras.models import ConfigContext, ConfigTemplate, SavedFilter, Tag
 from tenancy.models import Tenant, TenantGroup
 from utilities.exceptions import AbortRequest
 from virtualization.models import Cluster, ClusterGroup, ClusterType, VirtualMachine
@@ -606,3 +609,62 @@ class ConfigTemplateTest(TestCase):
     @tag('regression')
     def test_config_template_with_data_source_nested_templates(self):
         self.assertEqual(self.BASE_TEMPLATE, self.main_config_template.render({}))
+
+
+class SavedFilterTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        sites = (
+            Site(name='Site 1', slug='site-1', status='active'),
+            Site(name='Site 2', slug='site-2', status='planned'),
+            Site(name='Site 3', slug='site-3', status='retired'),
+        )
+        Site.objects.bulk_create(sites)
+        saved_filters = (
+            SavedFilter(name='Saved Filter 1', slug='saved-filter-1', parameters={'status': ['active']}),
+            SavedFilter(name='Saved Filter 2', slug='saved-filter-2', parameters={'status': 'planned'}),
+        )
+        SavedFilter.objects.bulk_create(saved_filters)
+
+    def test_resolve(self):
+        saved_filter = SavedFilter.objects.get(slug='saved-filter-1')
+
+        # A SavedFilter referenced by both its slug and its ID is applied only once
+        parameters, errors = SavedFilter.objects.resolve(slugs=['saved-filter-1'], pks=[str(saved_filter.pk)])
+        self.assertEqual(parameters, [('status', ['active'])])
+        self.assertEqual(errors, [])
+
+        parameters, errors = SavedFilter.objects.resolve(slugs=['saved-filter-2', 'invalid'], pks=['0', 'foo'])
+        self.assertEqual(parameters, [('status', ['planned'])])
+        self.assertEqual(len(errors), 3)
+
+    def test_filterset(self):
+        filterset = SiteFilterSet(QueryDict('filter=saved-filter-1&filter=saved-filter-2'), Site.objects.all())
+        self.assertTrue(filterset.is_valid())
+        self.assertEqual(filterset.qs.count(), 2)
+
+        filterset = SiteFilterSet(QueryDict('filter=saved-filter-1&filter=invalid'), Site.objects.all())
+        self.assertFalse(filterset.is_valid())
+        self.assertIn('filter', filterset.errors)
+
+    def test_cache_invalidation(self):
+        # The cache is not populated from within a transaction (as each test is), so it is seeded directly
+        saved_filter = SavedFilter.objects.get(slug='saved-filter-1')
+        cache_key = SavedFilter.objects.cache_key
+        seeded = {'slugs': {'cached-filter': 0}, 'parameters': {0: {'status': ['active']}}}
+        cache.set(cache_key, seeded, None)
+        self.addCleanup(cache.delete, cache_key)
+        self.assertEqual(SavedFilter.objects.get_cached(), seeded)
+
+        # Saving a SavedFilter clears the cache
+        saved_filter.parameters = {'status': ['retired']}
+        saved_filter.save()
+        self.assertIsNone(cache.get(cache_key))
+        self.assertEqual(SavedFilter.objects.get_cached()['parameters'][saved_filter.pk], {'status': ['retired']})
+
+        # Deleting a SavedFilter clears the cache
+        cache.set(cache_key, seeded, None)
+        saved_filter.delete()
+        self.assertIsNone(cache.get(cache_key))
+        self.assertNotIn('saved-filter-1', SavedFilter.objects.get_cached()['slugs'])
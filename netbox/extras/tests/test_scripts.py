@@ -1,13 +1,22 @@
 import logging
+import os
+import sys
 import tempfile
+import uuid
 from datetime import date, datetime, timezone
+from unittest import mock
 
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
 from netaddr import IPAddress, IPNetwork
 
+from core.choices import ManagedFileRootPathChoices
+from core.models import Job
 from dcim.models import DeviceRole
+from extras.choices import LogLevelChoices
+from extras.models import ScriptModule
 from extras.scripts import *
+from extras.scripts import ScriptLogWriter
 from utilities.testing import disable_logging
 
 CHOICES = (
@@ -371,3 +380,86 @@ class ScriptVariablesTest(TestCase):
         self.assertEqual(form.cleaned_data['var1'], input_datetime)
         # Validate required=False works for this Var type
         self.assertEqual(form.cleaned_data['var2'], None)
+
+
+class ScriptLogTest(TestCase):
+
+    def test_log_writer(self):
+
+        class TestScript(Script):
+
+            def run(self, data, commit):
+                for i in range(1, 6):
+                    self.log_info(f"Message {i}")
+                self.log_warning("Warning", obj=DeviceRole.objects.first())
+
+        DeviceRole.objects.create(name='Device Role 1', slug='device-role-1')
+        job = Job.objects.create(name='Test', job_id=uuid.uuid4())
+        script = TestScript()
+        script.log_writer = ScriptLogWriter(job, batch_size=2)
+        with disable_logging():
+            script.run({}, True)
+        job_data = script.get_job_data()
+        script.log_writer.save()
+
+        # Messages are saved as log entries rather than in the job's data
+        self.assertEqual(job_data['log'], [])
+        self.assertEqual(job_data['log_count'], 6)
+        log_entries = job.script_log_entries.order_by('index')
+        self.assertEqual(list(log_entries.values_list('index', flat=True)), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(log_entries[0].message, 'Message 1')
+        self.assertEqual(log_entries[5].status, LogLevelChoices.LOG_WARNING)
+        self.assertEqual(log_entries[5].object_repr, 'Device Role 1')
+
+
+class ScriptModuleCacheTest(TestCase):
+
+    def test_get_module_cached(self):
+        script_module = ScriptModule(file_root=ManagedFileRootPathChoices.SCRIPTS, file_path='cache_test.py')
+        read_path = 'extras.models.mixins.CustomStoragesLoader.read'
+
+        with mock.patch(read_path, return_value=b'VALUE = 1\n'):
+            module1 = script_module.get_module()
+            module2 = script_module.get_module()
+        self.assertIs(module1, module2)
+        self.assertEqual(module1.VALUE, 1)
+
+        # The module is reloaded once its source code has changed
+        with mock.patch(read_path, return_value=b'VALUE = 2\n'):
+            module3 = script_module.get_module()
+        self.assertIsNot(module3, module1)
+        self.assertEqual(module3.VALUE, 2)
+        script_module.clear_module_cache()
+
+    def test_get_module_dependency_changed(self):
+        script_module = ScriptModule(file_root=ManagedFileRootPathChoices.SCRIPTS, file_path='cache_test.py')
+        read_path = 'extras.models.mixins.CustomStoragesLoader.read'
+
+        with tempfile.TemporaryDirectory() as root_path:
+            helper_path = os.path.join(root_path, 'cache_test_helper.py')
+            with open(helper_path, 'w') as f:
+                f.write('VALUE = 1\n')
+            sys.path.insert(0, root_path)
+            try:
+                with (
+                    mock.patch(read_path, return_value=b'from cache_test_helper import VALUE\n'),
+                    mock.patch.object(ScriptModule, '_resolve_root_path', return_value=root_path),
+                ):
+                    module1 = script_module.get_module()
+                    self.assertIs(script_module.get_module(), module1)
+                    self.assertEqual(module1.VALUE, 1)
+
+                    # The module is reloaded once a module it imports has changed
+                    with open(helper_path, 'w') as f:
+                        f.write('VALUE = 2\n')
+                    os.utime(helper_path, (0, 0))
+                    module2 = script_module.get_module()
+                    self.assertIsNot(module2, module1)
+                    self.assertEqual(module2.VALUE, 2)
+
+                    # Clearing the cache discards the module along with its dependencies
+                    script_module.clear_module_cache()
+                    self.assertNotIn(script_module.python_name, sys.modules)
+                    self.assertNotIn('cache_test_helper', sys.modules)
+            finally:
+                sys.path.remove(root_path)
@@ -35,7 +35,7 @@ from virtualization.models import VirtualMachine
 from . import filtersets, forms, tables
 from .constants import LOG_LEVEL_RANK
 from .models import *
-from .tables import ReportResultsTable, ScriptResultsTable, ScriptJobTable
+from .tables import ReportResultsTable, ScriptJobTable, ScriptLogEntryTable, ScriptResultsTable
 
 
 #
@@ -1429,7 +1429,26 @@ class ScriptResultView(TableMixin, generic.ObjectView):
                 if 'tests' in job.data:
                     tests = job.data['tests']
 
-                for log in job.data['log']:
+                # Retrieve the script's log from its individually stored log entries (if any)
+                log_messages = job.data['log']
+                if not log_messages and job.script_log_entries.exists():
+                    levels = [level for level, rank in LOG_LEVEL_RANK.items() if rank >= log_threshold]
+                    log_entries = job.script_log_entries.filter(status__in=levels)
+                    if not tests:
+                        table = ScriptLogEntryTable(log_entries, user=request.user)
+                        table.configure(request)
+                        return table
+                    log_messages = [
+                        {
+                            'time': entry.time.isoformat(),
+                            'status': entry.status,
+                            'message': entry.message,
+                            'obj': entry.object_repr,
+                            'url': entry.url,
+                        } for entry in log_entries
+                    ]
+
+                for log in log_messages:
                     log_level = LOG_LEVEL_RANK.get(log.get('status'), LogLevelChoices.LOG_INFO)
                     if log_level >= log_threshold:
                         index += 1
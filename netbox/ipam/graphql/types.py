@@ -7,6 +7,7 @@ from circuits.graphql.types import ProviderType
 from dcim.graphql.types import SiteType
 from extras.graphql.mixins import ContactsMixin
 from ipam import models
+from netbox.graphql.loaders import GenericObjectLoader, get_loader
 from netbox.graphql.scalars import BigInt
 from netbox.graphql.types import BaseObjectType, NetBoxObjectType, OrganizationalObjectType
 from .filters import *
@@ -153,12 +154,12 @@ class IPAddressType(NetBoxObjectType, ContactsMixin, BaseIPAddressFamilyType):
     services: List[Annotated["ServiceType", strawberry.lazy('ipam.graphql.types')]]
 
     @strawberry_django.field
-    def assigned_object(self) -> Annotated[Union[
+    def assigned_object(self, info) -> Annotated[Union[
         Annotated["InterfaceType", strawberry.lazy('dcim.graphql.types')],
         Annotated["FHRPGroupType", strawberry.lazy('ipam.graphql.types')],
         Annotated["VMInterfaceType", strawberry.lazy('virtualization.graphql.types')],
     ], strawberry.union("IPAddressAssignmentType")] | None:
-        return self.assigned_object
+        return get_loader(info, GenericObjectLoader, 'assigned_object').load(self)
 
 
 @strawberry_django.type(
@@ -189,13 +190,13 @@ class PrefixType(NetBoxObjectType, ContactsMixin, BaseIPAddressFamilyType):
     role: Annotated["RoleType", strawberry.lazy('ipam.graphql.types')] | None
 
     @strawberry_django.field
-    def scope(self) -> Annotated[Union[
+    def scope(self, info) -> Annotated[Union[
         Annotated["LocationType", strawberry.lazy('dcim.graphql.types')],
         Annotated["RegionType", strawberry.lazy('dcim.graphql.types')],
         Annotated["SiteGroupType", strawberry.lazy('dcim.graphql.types')],
         Annotated["SiteType", strawberry.lazy('dcim.graphql.types')],
     ], strawberry.union("PrefixScopeType")] | None:
-        return self.scope
+        return get_loader(info, GenericObjectLoader, 'scope').load(self)
 
 
 @strawberry_django.type(
@@ -305,7 +306,7 @@ class VLANGroupType(OrganizationalObjectType):
     tenant: Annotated["TenantType", strawberry.lazy('tenancy.graphql.types')] | None
 
     @strawberry_django.field
-    def scope(self) -> Annotated[Union[
+    def scope(self, info) -> Annotated[Union[
         Annotated["ClusterType", strawberry.lazy('virtualization.graphql.types')],
         Annotated["ClusterGroupType", strawberry.lazy('virtualization.graphql.types')],
         Annotated["LocationType", strawberry.lazy('dcim.graphql.types')],
@@ -314,7 +315,7 @@ class VLANGroupType(OrganizationalObjectType):
         Annotated["SiteType", strawberry.lazy('dcim.graphql.types')],
         Annotated["SiteGroupType", strawberry.lazy('dcim.graphql.types')],
     ], strawberry.union("VLANGroupScopeType")] | None:
-        return self.scope
+        return get_loader(info, GenericObjectLoader, 'scope').load(self)
 
 
 @strawberry_django.type(
@@ -79,6 +79,19 @@ class ASNRangeTest(APIViewTestCases.APIViewTestCase):
             },
         ]
 
+    def test_filter_by_start(self):
+        """
+        Test that the `start` query parameter filters ASN ranges by their start value (rather than being interpreted as
+        a pagination parameter).
+        """
+        self.add_permissions('ipam.view_asnrange')
+        url = reverse('ipam-api:asnrange-list')
+
+        response = self.client.get(f'{url}?start=200', **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(response.data['results'][0]['name'], 'ASN Range 2')
+
     def test_list_available_asns(self):
         """
         Test retrieval of all available ASNs within a parent range.
@@ -150,7 +150,7 @@ class SerializedPKRelatedField(PrimaryKeyRelatedField):
 class RelatedObjectCountField(serializers.ReadOnlyField):
     """
     Represents a read-only integer count of related objects (e.g. the number of racks assigned to a site). This field
-    is detected by get_annotations_for_serializer() when determining the annotations to be added to a queryset
+    is detected by get_serialization_plan() when determining the annotations to be added to a queryset
     depending on the serializer fields selected for inclusion in the response.
     """
     def __init__(self, relation, **kwargs):
@@ -1,6 +1,17 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, ImproperlyConfigured
 from django.db.models import QuerySet
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError
 from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.utils.urls import replace_query_param
 
+from netbox.choices import APICountStrategyChoices
 from netbox.config import get_config
 
 
@@ -9,22 +20,56 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
     Override the stock paginator to allow setting limit=0 to disable pagination for a request. This returns all objects
     matching a query, but retains the same format as a paginated request. The limit can only be disabled if
     MAX_PAGE_SIZE has been set to 0 or None.
+
+    Additionally supports keyset (cursor) pagination: If the `cursor` query parameter is passed, objects are ordered by
+    their numeric ID, and the page begins with the first object having an ID equal to or greater than the specified
+    value. This avoids the use of OFFSET, the cost of which grows with the depth of the page, as well as counting all
+    matching objects (the count is returned as null).
+
+    The manner in which the total count of objects is determined is controlled by the API_COUNT_STRATEGY and
+    API_COUNT_STRATEGIES configuration parameters (see APICountStrategyChoices). Clients may also pass `count=false`
+    to omit the count. The strategy employed, and the time taken to determine the count, are conveyed in the
+    X-Count-Strategy and X-Count-Time response headers.
     """
+    cursor_query_param = 'cursor'
+    cursor_query_description = _('The minimum numeric ID of the first object to return (enables keyset pagination).')
+    count_query_param = 'count'
+    count_query_description = _('Set to false to omit the total count of objects from the response.')
+
     def __init__(self):
         self.default_limit = get_config().PAGINATE_COUNT
+        self.cursor = None
+        self.next_cursor = None
+        self.has_next = None
+        self.count_strategy = None
+        self.count_time = None
 
     def paginate_queryset(self, queryset, request, view=None):
+        self.cursor = self.get_cursor(request)
+
+        if self.cursor is not None and isinstance(queryset, QuerySet):
+            return self.paginate_queryset_by_cursor(queryset, request)
 
         if isinstance(queryset, QuerySet):
-            self.count = self.get_queryset_count(queryset)
+            self.count = self.get_count(queryset, request)
         else:
             # We're dealing with an iterable, not a QuerySet
+            self.count_strategy = APICountStrategyChoices.EXACT
             self.count = len(queryset)
 
         self.limit = self.get_limit(request)
         self.offset = self.get_offset(request)
         self.request = request
 
+        # If the count is approximate or absent, retrieve one additional object to determine whether a subsequent
+        # page exists.
+        if self.count_strategy != APICountStrategyChoices.EXACT:
+            if not self.limit:
+                return list(queryset[self.offset:])
+            results = list(queryset[self.offset:self.offset + self.limit + 1])
+            self.has_next = len(results) > self.limit
+            return results[:self.limit]
+
         if self.limit and self.count > self.limit and self.template is not None:
             self.display_page_controls = True
 
@@ -36,6 +81,55 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         else:
             return list(queryset[self.offset:])
 
+    def paginate_queryset_by_cursor(self, queryset, request):
+        """
+        Return a page of objects beginning with the first object having a primary key equal to or greater than the
+        `cursor` value. One additional object is retrieved to determine whether a subsequent page exists.
+        """
+        if request.query_params.get(self.offset_query_param):
+            raise ValidationError({
+                self.cursor_query_param: _("The cursor and offset parameters are mutually exclusive.")
+            })
+        if request.query_params.get('ordering'):
+            raise ValidationError({
+                self.cursor_query_param: _("Custom ordering is not supported in conjunction with the cursor parameter.")
+            })
+
+        self.count = None
+        self.count_strategy = APICountStrategyChoices.OMITTED
+        self.limit = self.get_limit(request)
+        self.offset = 0
+        self.request = request
+
+        queryset = queryset.filter(pk__gte=self.cursor).order_by('pk')
+        if not self.limit:
+            self.next_cursor = None
+            return list(queryset)
+
+        results = list(queryset[:self.limit + 1])
+        if len(results) > self.limit:
+            results = results[:self.limit]
+            self.next_cursor = results[-1].pk + 1
+        else:
+            self.next_cursor = None
+
+        return results
+
+    def get_cursor(self, request):
+        try:
+            cursor = int(request.query_params[self.cursor_query_param])
+        except KeyError:
+            return None
+        except ValueError:
+            raise ValidationError({
+                self.cursor_query_param: _("Must be an integer.")
+            })
+        if cursor < 0:
+            raise ValidationError({
+                self.cursor_query_param: _("Must be a positive integer.")
+            })
+        return cursor
+
     def get_limit(self, request):
         if self.limit_query_param:
             MAX_PAGE_SIZE = get_config().MAX_PAGE_SIZE
@@ -54,15 +148,121 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
 
         return self.default_limit
 
+    def get_count_strategy(self, queryset, request):
+        """
+        Return the strategy to employ for counting the objects in the given QuerySet.
+        """
+        if request.query_params.get(self.count_query_param, '').lower() in ('false', '0'):
+            return APICountStrategyChoices.OMITTED
+
+        strategy = settings.API_COUNT_STRATEGIES.get(queryset.model._meta.label_lower, settings.API_COUNT_STRATEGY)
+        if strategy not in APICountStrategyChoices.values():
+            raise ImproperlyConfigured(f"Invalid API count strategy for {queryset.model._meta.label_lower}: {strategy}")
+
+        return strategy
+
+    def get_count(self, queryset, request):
+        """
+        Determine the total number of objects in the QuerySet per the applicable count strategy. Records the
+        strategy employed and the time taken.
+        """
+        strategy = self.get_count_strategy(queryset, request)
+        start_time = time.perf_counter()
+
+        if strategy == APICountStrategyChoices.OMITTED:
+            count = None
+        elif strategy == APICountStrategyChoices.CACHED:
+            count = self.get_cached_queryset_count(queryset)
+        elif strategy == APICountStrategyChoices.ESTIMATED:
+            count = self.get_estimated_queryset_count(queryset)
+            # Fall back to an exact count where an estimate is not appropriate
+            if count is None:
+                strategy = APICountStrategyChoices.EXACT
+                count = self.get_queryset_count(queryset)
+        else:
+            count = self.get_queryset_count(queryset)
+
+        self.count_strategy = strategy
+        self.count_time = time.perf_counter() - start_time
+
+        return count
+
     def get_queryset_count(self, queryset):
         return queryset.count()
 
+    def get_cached_queryset_count(self, queryset):
+        """
+        Return the count of objects in the QuerySet from the cache, if available. Otherwise, count the objects and
+        cache the result for API_COUNT_CACHE_TIMEOUT seconds. Counts are cached per the compiled SQL query, which
+        reflects both the filters applied and any object-level permissions enforced for the user.
+        """
+        try:
+            sql, params = queryset.query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+        digest = hashlib.sha256(f'{sql}{params}'.encode()).hexdigest()
+        cache_key = f'api_count_{queryset.model._meta.label_lower}_{digest}'
+
+        count = cache.get(cache_key)
+        if count is None:
+            count = self.get_queryset_count(queryset)
+            cache.set(cache_key, count, settings.API_COUNT_CACHE_TIMEOUT)
+
+        return count
+
+    def get_estimated_queryset_count(self, queryset):
+        """
+        Return the query planner's estimate of the number of objects in an unfiltered QuerySet. Returns None if the
+        QuerySet has been filtered (e.g. by the user's permissions), or if the estimate is below
+        API_COUNT_ESTIMATE_THRESHOLD (in which case an exact count is inexpensive).
+        """
+        if queryset.query.where or queryset.query.distinct or queryset.query.combinator:
+            return None
+
+        try:
+            plan = json.loads(queryset.explain(format='json'))
+            estimate = int(plan[0]['Plan']['Plan Rows'])
+        except (EmptyResultSet, IndexError, KeyError, TypeError, ValueError):
+            return None
+
+        if estimate < settings.API_COUNT_ESTIMATE_THRESHOLD:
+            return None
+
+        return estimate
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+
+        # Convey the count strategy employed
+        if self.count_strategy:
+            response['X-Count-Strategy'] = self.count_strategy
+        if self.count_time is not None:
+            response['X-Count-Time'] = f'{self.count_time * 1000:.3f}'
+
+        return response
+
     def get_next_link(self):
 
         # Pagination has been disabled
         if not self.limit:
             return None
 
+        # Keyset pagination
+        if self.cursor is not None:
+            if self.next_cursor is None:
+                return None
+            url = self.request.build_absolute_uri()
+            url = replace_query_param(url, self.limit_query_param, self.limit)
+            return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+        # The count is approximate or absent
+        if self.has_next is not None:
+            if not self.has_next:
+                return None
+            url = self.request.build_absolute_uri()
+            url = replace_query_param(url, self.limit_query_param, self.limit)
+            return replace_query_param(url, self.offset_query_param, self.offset + self.limit)
+
         return super().get_next_link()
 
     def get_previous_link(self):
@@ -71,8 +271,39 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         if not self.limit:
             return None
 
+        # Keyset pagination traverses objects in one direction only
+        if self.cursor is not None:
+            return None
+
         return super().get_previous_link()
 
+    def get_paginated_response_schema(self, schema):
+        schema = super().get_paginated_response_schema(schema)
+        schema['properties']['count']['nullable'] = True
+        return schema
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters.append({
+            'name': self.cursor_query_param,
+            'required': False,
+            'in': 'query',
+            'description': str(self.cursor_query_description),
+            'schema': {
+                'type': 'integer',
+            },
+        })
+        parameters.append({
+            'name': self.count_query_param,
+            'required': False,
+            'in': 'query',
+            'description': str(self.count_query_description),
+            'schema': {
+                'type': 'boolean',
+            },
+        })
+        return parameters
+
 
 class StripCountAnnotationsPaginator(OptionalLimitOffsetPagination):
     """
@@ -10,7 +10,8 @@ from rest_framework import mixins as drf_mixins
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
-from utilities.api import get_annotations_for_serializer, get_prefetches_for_serializer
+from core.deletion import delete_objects
+from utilities.api import get_serialization_plan
 from utilities.exceptions import AbortRequest
 from utilities.query import reapply_model_ordering
 from . import mixins
@@ -56,15 +57,11 @@ class BaseViewSet(GenericViewSet):
         qs = super().get_queryset()
         serializer_class = self.get_serializer_class()
 
-        # Dynamically resolve prefetches for included serializer fields and attach them to the queryset
-        if prefetch := get_prefetches_for_serializer(serializer_class, fields_to_include=self.requested_fields):
-            qs = qs.prefetch_related(*prefetch)
+        # Apply the related objects & annotations required by the included serializer fields (including those of
+        # nested serializers) to the queryset. The plan is computed once per serializer & set of fields.
+        plan = get_serialization_plan(serializer_class, self.requested_fields, brief=self.brief)
 
-        # Dynamically resolve annotations for RelatedObjectCountFields on the serializer and attach them to the queryset
-        if annotations := get_annotations_for_serializer(serializer_class, fields_to_include=self.requested_fields):
-            qs = qs.annotate(**annotations)
-
-        return qs
+        return plan.apply(qs)
 
     def get_serializer(self, *args, **kwargs):
 
@@ -208,7 +205,7 @@ class NetBoxModelViewSet(
         logger = logging.getLogger(f'netbox.api.views.{self.__class__.__name__}')
         logger.info(f"Deleting {model._meta.verbose_name} {instance} (PK: {instance.pk})")
 
-        return super().perform_destroy(instance)
+        return delete_objects([instance])
 
 
 class MPTTLockedMixin:
@@ -1,12 +1,16 @@
+import logging
+
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import router, transaction
 from django.http import Http404
 from rest_framework import status
 from rest_framework.response import Response
 
+from core.deletion import delete_objects
 from core.models import ObjectType
 from extras.models import ExportTemplate
 from netbox.api.serializers import BulkOperationSerializer
+from utilities.counters import batch_counter_updates
 
 __all__ = (
     'BulkDestroyModelMixin',
@@ -45,7 +49,7 @@ class ExportTemplatesMixin:
             if et is None:
                 raise Http404
             queryset = self.filter_queryset(self.get_queryset())
-            return et.render_to_response(queryset=queryset)
+            return et.render_to_response(queryset=queryset, stream=True)
 
         return super().list(request, *args, **kwargs)
 
@@ -57,7 +61,7 @@ class SequentialBulkCreatesMixin:
     appropriately.
     """
     def create(self, request, *args, **kwargs):
-        with transaction.atomic(using=router.db_for_write(self.queryset.model)):
+        with transaction.atomic(using=router.db_for_write(self.queryset.model)), batch_counter_updates():
             if not isinstance(request.data, list):
                 # Creating a single object
                 return super().create(request, *args, **kwargs)
@@ -113,7 +117,7 @@ class BulkUpdateModelMixin:
         return Response(data, status=status.HTTP_200_OK)
 
     def perform_bulk_update(self, objects, update_data, partial):
-        with transaction.atomic(using=router.db_for_write(self.queryset.model)):
+        with transaction.atomic(using=router.db_for_write(self.queryset.model)), batch_counter_updates():
             data_list = []
             for obj in objects:
                 data = update_data.get(obj.id)
@@ -157,11 +161,11 @@ class BulkDestroyModelMixin:
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     def perform_bulk_destroy(self, objects):
-        with transaction.atomic(using=router.db_for_write(self.queryset.model)):
-            for obj in objects:
-                if hasattr(obj, 'snapshot'):
-                    obj.snapshot()
-                self.perform_destroy(obj)
+        model = self.queryset.model
+        logger = logging.getLogger(f'netbox.api.views.{self.__class__.__name__}')
+        logger.info(f"Deleting {len(objects)} {model._meta.verbose_name_plural}")
+
+        delete_objects(objects)
 
 
 class ObjectValidationMixin:
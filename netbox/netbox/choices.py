@@ -4,6 +4,7 @@ from utilities.choices import ChoiceSet
 from utilities.constants import CSV_DELIMITERS
 
 __all__ = (
+    'APICountStrategyChoices',
     'ButtonColorChoices',
     'ColorChoices',
     'CSVDelimiterChoices',
@@ -195,3 +196,24 @@ class WeightUnitChoices(ChoiceSet):
         (UNIT_POUND, _('Pounds')),
         (UNIT_OUNCE, _('Ounces')),
     )
+
+
+#
+# REST API
+#
+
+class APICountStrategyChoices(ChoiceSet):
+    """
+    Strategies for determining the total number of objects returned by a REST API list endpoint.
+    """
+    EXACT = 'exact'
+    CACHED = 'cached'
+    ESTIMATED = 'estimated'
+    OMITTED = 'omitted'
+
+    CHOICES = (
+        (EXACT, _('Exact')),
+        (CACHED, _('Cached')),
+        (ESTIMATED, _('Estimated')),
+        (OMITTED, _('Omitted')),
+    )
@@ -1,8 +1,42 @@
-from contextlib import contextmanager
+import random
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest
 
 from netbox.context import current_request, events_queue
+from netbox.instrumentation import RequestInstrumentation, measure
 from netbox.utils import register_request_processor
 from extras.events import flush_events
+from extras.models import custom_field_registry
+
+
+@register_request_processor
+@contextmanager
+def request_instrumentation(request):
+    """
+    Record the database queries executed and the time spent in each phase of processing a sample of requests (per
+    REQUEST_INSTRUMENTATION_SAMPLE_RATE). The metrics are exported to Prometheus and reported in the Server-Timing
+    header of the response. Only HTTP requests (not those replayed by background jobs) are instrumented. This is
+    registered first, so that the work of all other request processors is included.
+
+    :param request: WSGIRequest object with a unique `id` set
+    """
+    sample_rate = settings.REQUEST_INSTRUMENTATION_SAMPLE_RATE
+    if not isinstance(request, HttpRequest) or not sample_rate or random.random() >= sample_rate:
+        yield
+        return
+
+    request.instrumentation = instrumentation = RequestInstrumentation()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(instrumentation.execute_wrapper))
+        yield
+    instrumentation.finish()
+
+    resolver_match = getattr(request, 'resolver_match', None)
+    instrumentation.report(resolver_match.view_name if resolver_match else 'unresolved')
 
 
 @register_request_processor
@@ -21,8 +55,23 @@ def event_tracking(request):
 
     # Flush queued webhooks to RQ
     if events := list(events_queue.get().values()):
-        flush_events(events)
+        with measure(request, 'events'):
+            flush_events(events)
 
     # Clear context vars
     current_request.set(None)
     events_queue.set({})
+
+
+@register_request_processor
+@contextmanager
+def custom_fields_refresh(request):
+    """
+    Discard the in-memory registry of CustomFields at the start of each request if it has been invalidated (e.g. by a
+    change made within another process).
+
+    :param request: WSGIRequest object with a unique `id` set
+    """
+    custom_field_registry.refresh()
+
+    yield
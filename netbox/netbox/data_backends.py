@@ -16,10 +16,12 @@ class DataBackend:
         is_local: A boolean indicating whether this backend accesses local data
         parameters: A dictionary mapping configuration form field names to their classes
         sensitive_parameters: An iterable of field names for which the values should not be displayed to the user
+        cache_path: A persistent local directory in which data may be retained between synchronizations (if enabled)
     """
     is_local = False
     parameters = {}
     sensitive_parameters = []
+    cache_path = None
 
     # Prevent Django's template engine from calling the backend
     # class when referenced via DataSource.backend_class
@@ -51,3 +53,14 @@ class DataBackend:
         3. Performs any necessary cleanup
         """
         raise NotImplementedError()
+
+    def get_changes(self, local_path, previous_state=None):
+        """
+        Compare the data replicated at `local_path` with that of a previous synchronization. Returns a two-tuple of:
+
+        1. A JSON-serializable object describing the current state of the data (e.g. a commit hash), which will be
+           passed as `previous_state` upon the next synchronization
+        2. A set of paths (relative to `local_path`) which may have been created, modified, or deleted since
+           `previous_state` was recorded, or None if they cannot be determined (in which case all files are checked)
+        """
+        return None, None
@@ -2,9 +2,11 @@ import json
 
 import django_filters
 from copy import deepcopy
+from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
 from django.db.models import Q
+from django.forms.utils import ErrorDict, ErrorList
 from django_filters.exceptions import FieldLookupError
 from django_filters.utils import get_model_field, resolve_field
 from django.utils.translation import gettext as _
@@ -88,31 +90,39 @@ class BaseFilterSet(django_filters.FilterSet):
     })
 
     def __init__(self, data=None, *args, **kwargs):
-        # bit of a hack for #9231 - extras.lookup.Empty is registered in apps.ready
-        # however FilterSet Factory is setup before this which creates the
-        # initial filters.  This recreates the filters so Empty is picked up correctly.
-        self.base_filters = self.__class__.get_filters()
+        self.base_filters = self.get_base_filters()
 
         # Apply any referenced SavedFilters
+        self.saved_filter_errors = []
         if data and ('filter' in data or 'filter_id' in data):
             data = data.copy()  # Get a mutable copy
-            saved_filters = SavedFilter.objects.filter(
-                Q(slug__in=data.pop('filter', [])) |
-                Q(pk__in=data.pop('filter_id', []))
+            parameters, self.saved_filter_errors = SavedFilter.objects.resolve(
+                slugs=data.pop('filter', []),
+                pks=data.pop('filter_id', [])
             )
-            for sf in saved_filters:
-                for key, value in sf.parameters.items():
-                    # QueryDicts are... fun
-                    if type(value) not in (list, tuple):
-                        value = [value]
-                    if key in data:
-                        for v in value:
-                            data.appendlist(key, v)
-                    else:
-                        data.setlist(key, value)
+            for key, value in parameters:
+                if key in data:
+                    for v in value:
+                        data.appendlist(key, v)
+                else:
+                    data.setlist(key, value)
 
         super().__init__(data, *args, **kwargs)
 
+    @property
+    def errors(self):
+        """
+        Include any references to nonexistent SavedFilters among the form errors.
+        """
+        errors = super().errors
+        if self.saved_filter_errors:
+            errors = ErrorDict(errors)
+            errors['filter'] = ErrorList(self.saved_filter_errors)
+        return errors
+
+    def is_valid(self):
+        return not self.saved_filter_errors and super().is_valid()
+
     @staticmethod
     def _get_filter_lookup_dict(existing_filter):
         # Choose the lookup expression map based on the filter type
@@ -237,6 +247,22 @@ class BaseFilterSet(django_filters.FilterSet):
 
         return filters
 
+    @classmethod
+    def get_base_filters(cls):
+        """
+        Return the complete set of filters (including all additional lookups) with which each instance of the
+        FilterSet is initialized.
+
+        Filters are first generated when the class is created, which occurs before extras.lookups.Empty has been
+        registered in apps.ready (see #9231). The filters are thus regenerated once the app registry is ready, and the
+        result is cached on the class.
+        """
+        if '_base_filters' not in cls.__dict__:
+            if not apps.ready:
+                return cls.get_filters()
+            cls._base_filters = cls.get_filters()
+        return cls._base_filters
+
     @classmethod
     def filter_for_lookup(cls, field, lookup_type):
 
@@ -291,28 +317,46 @@ class NetBoxModelFilterSet(ChangeLoggedModelFilterSet):
     tag = TagFilter()
     tag_id = TagIDFilter()
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        # Dynamically add a Filter for each CustomField applicable to the parent model
-        custom_fields = CustomField.objects.filter(
-            object_types=ContentType.objects.get_for_model(self._meta.model)
-        ).exclude(
-            filter_logic=CustomFieldFilterLogicChoices.FILTER_DISABLED
-        )
-
+    @classmethod
+    def get_custom_field_filters(cls, custom_fields):
+        """
+        Return a Filter (along with any additional lookups) for each of the given CustomFields.
+        """
         custom_field_filters = {}
         for custom_field in custom_fields:
+            if custom_field.filter_logic == CustomFieldFilterLogicChoices.FILTER_DISABLED:
+                continue
             filter_name = f'cf_{custom_field.name}'
             filter_instance = custom_field.to_filter()
             if filter_instance:
                 custom_field_filters[filter_name] = filter_instance
 
                 # Add relevant additional lookups
-                additional_lookups = self.get_additional_lookups(filter_name, filter_instance)
+                additional_lookups = cls.get_additional_lookups(filter_name, filter_instance)
                 custom_field_filters.update(additional_lookups)
 
-        self.filters.update(custom_field_filters)
+        return custom_field_filters
+
+    @classmethod
+    def get_base_filters(cls):
+        """
+        Extend the base filters with a Filter for each CustomField applicable to the model. The combined filters are
+        cached on the class for as long as the CustomField registry returns the same set of CustomFields (i.e. until
+        a CustomField is modified).
+        """
+        base_filters = super().get_base_filters()
+        if not cls._meta.model:
+            return base_filters
+
+        custom_fields = CustomField.objects.get_cached_for_model(cls._meta.model)
+        cached = cls.__dict__.get('_custom_field_filters')
+        if cached is None or cached[0] is not custom_fields or cached[1] is not base_filters:
+            cached = (custom_fields, base_filters, {
+                **base_filters,
+                **cls.get_custom_field_filters(custom_fields),
+            })
+            cls._custom_field_filters = cached
+        return cached[2]
 
     def search(self, queryset, name, value):
         """
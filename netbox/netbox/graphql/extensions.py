@@ -0,0 +1,217 @@
+import threading
+
+from django.conf import settings
+from django.db import connection
+from graphql import (
+    FieldNode, FragmentDefinitionNode, FragmentSpreadNode, GraphQLError, GraphQLList, InlineFragmentNode,
+    get_named_type, get_nullable_type, is_leaf_type, value_from_ast_untyped,
+)
+from graphql.execution import ExecutionResult
+from graphql.utilities import get_operation_ast
+from strawberry.extensions import SchemaExtension
+
+__all__ = (
+    'QueryCostEstimator',
+    'QueryCostLimiter',
+    'QueryCostResult',
+    'estimate_query_cost',
+)
+
+
+class QueryCostResult:
+    """
+    The estimated cost of a GraphQL operation.
+
+    Attributes:
+        cost: The estimated number of objects to be resolved
+        depth: The maximum depth of nested objects
+    """
+    def __init__(self, cost=0, depth=0):
+        self.cost = cost
+        self.depth = depth
+
+
+class QueryCostEstimator:
+    """
+    Walk the selections of a GraphQL operation to estimate the number of objects it will resolve. Each list field is
+    assumed to return the number of objects specified by its pagination limit, or `list_size` objects if no limit has
+    been specified.
+    """
+    def __init__(self, schema, document, variables=None, list_size=None):
+        self.schema = schema
+        self.variables = variables or {}
+        self.list_size = settings.GRAPHQL_DEFAULT_LIST_SIZE if list_size is None else list_size
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document.definitions if isinstance(definition, FragmentDefinitionNode)
+        }
+
+    def get_list_size(self, field_node):
+        """
+        Return the number of objects expected from a list field, per its pagination limit (if any).
+        """
+        for argument in field_node.arguments:
+            if argument.name.value == 'pagination':
+                pagination = value_from_ast_untyped(argument.value, self.variables) or {}
+                if limit := pagination.get('limit'):
+                    return max(int(limit), 0)
+        return self.list_size
+
+    def estimate(self, operation):
+        result = QueryCostResult()
+        root_type = self.schema.get_root_type(operation.operation)
+        self.walk(operation.selection_set, root_type, 1, 0, result)
+        return result
+
+    def walk(self, selection_set, parent_type, multiplicity, depth, result):
+        for selection in selection_set.selections:
+
+            # Resolve inline fragments & fragment spreads
+            if isinstance(selection, (InlineFragmentNode, FragmentSpreadNode)):
+                if isinstance(selection, FragmentSpreadNode):
+                    selection = self.fragments.get(selection.name.value)
+                    if selection is None:
+                        continue
+                fragment_type = parent_type
+                if selection.type_condition:
+                    fragment_type = self.schema.get_type(selection.type_condition.name.value) or parent_type
+                self.walk(selection.selection_set, fragment_type, multiplicity, depth, result)
+                continue
+
+            # Ignore introspection fields
+            if not isinstance(selection, FieldNode) or selection.name.value.startswith('__'):
+                continue
+            if selection.name.value not in getattr(parent_type, 'fields', {}):
+                continue
+
+            # Scalar fields do not contribute to the cost
+            field_type = get_nullable_type(parent_type.fields[selection.name.value].type)
+            if is_leaf_type(get_named_type(field_type)) or selection.selection_set is None:
+                continue
+
+            # Each list field multiplies the number of objects resolved beneath it by its (estimated) size
+            field_multiplicity = multiplicity
+            while isinstance(field_type, GraphQLList):
+                field_multiplicity *= self.get_list_size(selection)
+                field_type = get_nullable_type(field_type.of_type)
+
+            result.cost += field_multiplicity
+            result.depth = max(result.depth, depth + 1)
+            self.walk(selection.selection_set, get_named_type(field_type), field_multiplicity, depth + 1, result)
+
+
+def estimate_query_cost(schema, document, operation_name=None, variables=None, list_size=None):
+    """
+    Statically estimate the cost of a GraphQL operation prior to its execution. Returns a QueryCostResult.
+
+    Args:
+        schema: The GraphQLSchema
+        document: The parsed DocumentNode
+        operation_name: The name of the operation to be executed (if the document contains multiple operations)
+        variables: A dictionary of variable values
+        list_size: The number of objects assumed for unpaginated list fields (defaults to GRAPHQL_DEFAULT_LIST_SIZE)
+    """
+    operation = get_operation_ast(document, operation_name)
+    if operation is None:
+        return QueryCostResult()
+    return QueryCostEstimator(schema, document, variables, list_size).estimate(operation)
+
+
+def _count_objects(data):
+    """
+    Return the number of objects within GraphQL result data.
+    """
+    if isinstance(data, dict):
+        return 1 + sum(_count_objects(value) for value in data.values())
+    if isinstance(data, list):
+        return sum(_count_objects(value) for value in data)
+    return 0
+
+
+class QueryCostLimiter(SchemaExtension):
+    """
+    Estimate the cost of each GraphQL operation prior to its execution, and reject any operation which exceeds the
+    maximum depth or cost permitted for the requesting token or user (see GRAPHQL_MAX_DEPTH, GRAPHQL_MAX_COST, and
+    GRAPHQL_QUERY_BUDGETS). The estimated & actual costs, along with the number of database queries executed, are
+    reported under the "cost" key of the response's extensions.
+
+    A single instance of this extension serves all requests, so per-request state is kept on the execution context.
+    The results of the current operation are additionally tracked per thread for retrieval by get_results().
+    """
+    def __init__(self, *, execution_context=None):
+        super().__init__(execution_context=execution_context)
+        self._local = threading.local()
+
+    def get_budget(self, request):
+        """
+        Return the maximum depth and cost permitted for the request. A budget assigned to the authenticating API token
+        (by its numeric ID) takes precedence over one assigned to the user (by username).
+        """
+        max_depth = settings.GRAPHQL_MAX_DEPTH
+        max_cost = settings.GRAPHQL_MAX_COST
+
+        budget = {}
+        token = getattr(request, 'auth', None)
+        user = getattr(request, 'user', None)
+        if token is not None and token.pk in settings.GRAPHQL_QUERY_BUDGETS:
+            budget = settings.GRAPHQL_QUERY_BUDGETS[token.pk]
+        elif user is not None and user.is_authenticated:
+            budget = settings.GRAPHQL_QUERY_BUDGETS.get(user.username, {})
+
+        return budget.get('max_depth', max_depth), budget.get('max_cost', max_cost)
+
+    def on_execute(self):
+        execution_context = self.execution_context
+        self._local.results = None
+        request = getattr(execution_context.context, 'request', None)
+        max_depth, max_cost = self.get_budget(request)
+
+        estimate = estimate_query_cost(
+            execution_context.schema._schema,
+            execution_context.graphql_document,
+            operation_name=execution_context.operation_name,
+            variables=execution_context.variables
+        )
+        results = execution_context.extensions_results['cost'] = {
+            'estimated': estimate.cost,
+            'depth': estimate.depth,
+            'max_cost': max_cost,
+            'max_depth': max_depth,
+        }
+        self._local.results = results
+
+        # Reject the operation if it exceeds the applicable budget
+        error = None
+        if max_depth is not None and estimate.depth > max_depth:
+            error = f"Query depth of {estimate.depth} exceeds the maximum permitted depth of {max_depth}."
+        elif max_cost is not None and estimate.cost > max_cost:
+            error = f"Estimated query cost of {estimate.cost} exceeds the maximum permitted cost of {max_cost}."
+        if error:
+            execution_context.result = ExecutionResult(data=None, errors=[GraphQLError(error)])
+            yield
+            return
+
+        # Count the database queries executed while resolving the operation
+        query_count = 0
+
+        def count_queries(execute, sql, params, many, context):
+            nonlocal query_count
+            query_count += 1
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count_queries):
+            yield
+
+        results['queries'] = query_count
+        if execution_context.result is not None:
+            # Discount the root object
+            results['actual'] = max(_count_objects(execution_context.result.data) - 1, 0)
+
+    def get_results(self):
+        # Operations are executed entirely within a single thread, so the results recorded for this thread belong to
+        # the current operation (unlike self.execution_context, which may since have been replaced by another request).
+        results = getattr(self._local, 'results', None)
+        self._local.results = None
+        if results:
+            return {'cost': results}
+        return {}
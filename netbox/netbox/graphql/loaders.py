@@ -0,0 +1,195 @@
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Model, Prefetch, QuerySet, prefetch_related_objects
+from strawberry.schema.schema import StrawberryGraphQLCoreExecutionContext
+
+__all__ = (
+    'ChangelogLoader',
+    'ConfigContextLoader',
+    'GenericObjectLoader',
+    'LoaderExecutionContext',
+    'LoaderRegistry',
+    'ObjectLoader',
+    'RelatedObjectsLoader',
+    'get_loader',
+    'get_loader_registry',
+)
+
+
+class LoaderRegistry:
+    """
+    A per-request registry of the objects resolved in lists, and of the loaders which batch the retrieval of their
+    related data. When a loader is asked for the data of one object, it retrieves the data for all pending objects of
+    the same model (i.e. the object's siblings) in a single query.
+
+    Note that GraphQL resolves fields depth-first: The siblings of an object comprise the members of the list in which
+    it appears, and any other objects of the same model resolved previously but not yet loaded.
+    """
+    def __init__(self, request):
+        self.request = request
+        self.instances = defaultdict(dict)
+        self.loaders = {}
+
+    def register(self, instances):
+        """
+        Record the model instances contained within a resolved list.
+        """
+        for instance in instances:
+            if isinstance(instance, Model) and instance.pk is not None:
+                self.instances[instance._meta.concrete_model][instance.pk] = instance
+
+    def get_loader(self, loader_class, *args):
+        key = (loader_class, *args)
+        if key not in self.loaders:
+            self.loaders[key] = loader_class(self, *args)
+        return self.loaders[key]
+
+
+def get_loader_registry(info):
+    """
+    Return the LoaderRegistry for the current request, creating it if necessary.
+    """
+    registry = getattr(info.context, 'loaders', None)
+    if registry is None:
+        registry = info.context.loaders = LoaderRegistry(info.context.request)
+    return registry
+
+
+def get_loader(info, loader_class, *args):
+    """
+    Return the loader of the given class (and arguments) for the current request.
+    """
+    return get_loader_registry(info).get_loader(loader_class, *args)
+
+
+class LoaderExecutionContext(StrawberryGraphQLCoreExecutionContext):
+    """
+    Registers the objects of each resolved list with the request's LoaderRegistry, so that loaders may batch the
+    retrieval of related data for all members of the list.
+    """
+    def complete_list_value(self, return_type, field_nodes, info, path, result, *args, **kwargs):
+        if isinstance(result, QuerySet):
+            result = list(result)
+        if isinstance(result, list):
+            get_loader_registry(info).register(result)
+        return super().complete_list_value(return_type, field_nodes, info, path, result, *args, **kwargs)
+
+
+class ObjectLoader:
+    """
+    Base class for loaders. Subclasses must implement batch_load().
+    """
+    def __init__(self, registry):
+        self.registry = registry
+        self.results = {}
+
+    @property
+    def user(self):
+        return self.registry.request.user
+
+    def load(self, obj):
+        """
+        Return the data for the given object, retrieving it (along with that for any siblings) if necessary.
+        """
+        model = obj._meta.concrete_model
+        if (model, obj.pk) not in self.results:
+            instances = {
+                pk: instance for pk, instance in self.registry.instances[model].items()
+                if (model, pk) not in self.results
+            }
+            instances[obj.pk] = obj
+            results = self.batch_load(model, list(instances.values()))
+            for pk in instances:
+                self.results[(model, pk)] = results.get(pk, self.get_default())
+        return self.results[(model, obj.pk)]
+
+    def get_default(self):
+        """
+        The value returned for an object which has no data.
+        """
+        return None
+
+    def batch_load(self, model, instances):
+        """
+        Return a dictionary mapping the primary key of each instance to its data.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} must implement batch_load()")
+
+
+class ChangelogLoader(ObjectLoader):
+    """
+    Retrieve the change records for objects.
+    """
+    def get_default(self):
+        return []
+
+    def batch_load(self, model, instances):
+        from core.models import ObjectChange
+
+        object_changes = ObjectChange.objects.restrict(self.user, 'view').filter(
+            changed_object_type=ContentType.objects.get_for_model(model),
+            changed_object_id__in=[instance.pk for instance in instances]
+        )
+        results = defaultdict(list)
+        for object_change in object_changes:
+            results[object_change.changed_object_id].append(object_change)
+        return results
+
+
+class ConfigContextLoader(ObjectLoader):
+    """
+    Render the configuration context for devices & virtual machines, annotating the applicable config context data
+    for all objects in a single query.
+    """
+    def batch_load(self, model, instances):
+        config_context_data = dict(
+            model.objects.filter(
+                pk__in=[instance.pk for instance in instances]
+            ).annotate_config_context_data().values_list('pk', 'config_context_data')
+        )
+        for instance in instances:
+            instance.config_context_data = config_context_data.get(instance.pk)
+        return {
+            instance.pk: instance.get_config_context() for instance in instances
+        }
+
+
+class RelatedObjectsLoader(ObjectLoader):
+    """
+    Retrieve the objects associated with each object by a (generic) relation, restricted to those which the user has
+    permission to view.
+    """
+    def __init__(self, registry, field_name):
+        super().__init__(registry)
+        self.field_name = field_name
+
+    def get_default(self):
+        return []
+
+    def batch_load(self, model, instances):
+        related_model = model._meta.get_field(self.field_name).related_model
+        to_attr = f'_{self.field_name}_loaded'
+        prefetch_related_objects(instances, Prefetch(
+            self.field_name,
+            queryset=related_model.objects.restrict(self.user, 'view'),
+            to_attr=to_attr
+        ))
+        return {
+            instance.pk: getattr(instance, to_attr) for instance in instances
+        }
+
+
+class GenericObjectLoader(ObjectLoader):
+    """
+    Retrieve the object referenced by a GenericForeignKey. Referenced objects are retrieved with one query per type.
+    """
+    def __init__(self, registry, field_name):
+        super().__init__(registry)
+        self.field_name = field_name
+
+    def batch_load(self, model, instances):
+        prefetch_related_objects(instances, self.field_name)
+        return {
+            instance.pk: getattr(instance, self.field_name) for instance in instances
+        }
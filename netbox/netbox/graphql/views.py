@@ -1,18 +1,33 @@
+import hashlib
+
 from django.conf import settings
 from django.contrib.auth.views import redirect_to_login
+from django.core.cache import cache
 from django.http import HttpResponseNotFound, HttpResponseForbidden
 from django.urls import reverse
 from django.views.decorators.csrf import csrf_exempt
+from graphql import GraphQLError
 from rest_framework.exceptions import AuthenticationFailed
 from strawberry.django.views import GraphQLView
+from strawberry.http.exceptions import HTTPException
+from strawberry.types import ExecutionResult
 
 from netbox.api.authentication import TokenAuthentication
 from netbox.config import get_config
 
 
+class PersistedQueryNotFound(Exception):
+    pass
+
+
 class NetBoxGraphQLView(GraphQLView):
     """
-    Extends strawberry's GraphQLView to support DRF's token-based authentication.
+    Extends strawberry's GraphQLView to support DRF's token-based authentication and persisted queries.
+
+    Persisted queries follow the Automatic Persisted Queries (APQ) protocol: A client may send only the SHA256 hash of
+    a query (in extensions.persistedQuery.sha256Hash). If the query is not known, a PersistedQueryNotFound error is
+    returned, and the client resends the hash along with the full query, which is then persisted for subsequent
+    requests.
     """
 
     @csrf_exempt
@@ -30,6 +45,7 @@ class NetBoxGraphQLView(GraphQLView):
                 auth_info = authenticator.authenticate(request)
                 if auth_info is not None:
                     request.user = auth_info[0]  # User object
+                    request.auth = auth_info[1]  # Token object
             except AuthenticationFailed as exc:
                 return HttpResponseForbidden(exc.detail)
 
@@ -41,3 +57,42 @@ class NetBoxGraphQLView(GraphQLView):
                 return HttpResponseForbidden("No credentials provided.")
 
         return super().dispatch(request, *args, **kwargs)
+
+    def get_persisted_query(self, query, extensions):
+        """
+        Return the GraphQL query for a request specifying a persisted query hash, persisting the query if provided.
+        """
+        persisted_query = extensions.get('persistedQuery')
+        if not isinstance(persisted_query, dict) or persisted_query.get('version') != 1:
+            raise HTTPException(400, "Unsupported persisted query version.")
+        query_hash = persisted_query.get('sha256Hash')
+        if not isinstance(query_hash, str):
+            raise HTTPException(400, "A persisted query must specify its SHA256 hash.")
+        cache_key = f'graphql_query_{query_hash.lower()}'
+
+        # Persist a newly provided query
+        if query:
+            if hashlib.sha256(query.encode()).hexdigest() != query_hash.lower():
+                raise HTTPException(400, "The provided SHA256 hash does not match the query.")
+            cache.set(cache_key, query, settings.GRAPHQL_PERSISTED_QUERY_TIMEOUT)
+            return query
+
+        # Retrieve a previously persisted query
+        if query := cache.get(cache_key):
+            return query
+        raise PersistedQueryNotFound()
+
+    def parse_http_body(self, request):
+        request_data = super().parse_http_body(request)
+        if isinstance(request_data.extensions, dict) and 'persistedQuery' in request_data.extensions:
+            request_data.query = self.get_persisted_query(request_data.query, request_data.extensions)
+        return request_data
+
+    def execute_operation(self, request, context, root_value):
+        try:
+            return super().execute_operation(request, context, root_value)
+        except PersistedQueryNotFound:
+            # Return an error (rather than an HTTP exception) so that the client may resend the complete query
+            return ExecutionResult(data=None, errors=[
+                GraphQLError('PersistedQueryNotFound', extensions={'code': 'PERSISTED_QUERY_NOT_FOUND'})
+            ])
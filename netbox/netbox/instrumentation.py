@@ -0,0 +1,160 @@
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+
+from prometheus_client import Histogram
+
+__all__ = (
+    'RequestInstrumentation',
+    'get_fingerprint',
+    'measure',
+)
+
+logger = logging.getLogger('netbox.instrumentation')
+
+# The number of executions of a single query fingerprint within a request above which a warning is logged (as a likely
+# indication of an N+1 query pattern)
+REPEATED_QUERY_THRESHOLD = 10
+
+# The number of most repeated query fingerprints to report
+TOP_FINGERPRINTS = 5
+
+QUERY_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, float('inf'))
+
+request_queries = Histogram(
+    'netbox_request_queries',
+    'Number of database queries executed per request',
+    ['view'],
+    buckets=QUERY_BUCKETS
+)
+request_repeated_queries = Histogram(
+    'netbox_request_repeated_queries',
+    'Maximum number of executions of a single query fingerprint per request',
+    ['view'],
+    buckets=QUERY_BUCKETS
+)
+request_db_duration = Histogram(
+    'netbox_request_db_duration_seconds',
+    'Time spent executing database queries per request',
+    ['view']
+)
+request_phase_duration = Histogram(
+    'netbox_request_phase_duration_seconds',
+    'Time spent in each phase of processing a request (e.g. rendering or flushing events)',
+    ['view', 'phase']
+)
+
+# Patterns used to normalize SQL statements
+LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+PLACEHOLDER_LIST_PATTERN = re.compile(r'\((?:\s*(?:%s|\?)\s*,)+\s*(?:%s|\?)\s*\)')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def get_fingerprint(sql):
+    """
+    Normalize an SQL statement such that statements differing only in their literal values (or in the number of
+    values within a list) share the same fingerprint.
+    """
+    sql = LITERAL_PATTERN.sub('?', sql)
+    sql = PLACEHOLDER_LIST_PATTERN.sub('(...)', sql)
+    return WHITESPACE_PATTERN.sub(' ', sql).strip()
+
+
+def measure(request, phase):
+    """
+    Return a context manager which records the time spent within it against the given phase of an instrumented request.
+    If the request has not been instrumented, it does nothing.
+    """
+    instrumentation = getattr(request, 'instrumentation', None)
+    if instrumentation is None:
+        return nullcontext()
+    return instrumentation.timer(phase)
+
+
+class RequestInstrumentation:
+    """
+    Record the number & duration of database queries executed while processing a request, along with the time spent
+    in each of its phases. Queries are grouped by fingerprint to detect repeated (N+1) queries.
+    """
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        self.duration = None
+        self.query_count = 0
+        self.db_duration = 0
+        self.fingerprints = Counter()
+        self.phases = {}
+        self._phase_start_times = {}
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        """
+        A database execution wrapper (see connection.execute_wrapper()) which records each query.
+        """
+        start_time = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_duration += time.perf_counter() - start_time
+            self.query_count += 1
+            self.fingerprints[get_fingerprint(sql)] += 1
+
+    def start(self, phase):
+        self._phase_start_times[phase] = time.perf_counter()
+
+    def stop(self, phase):
+        if (start_time := self._phase_start_times.pop(phase, None)) is not None:
+            self.phases[phase] = self.phases.get(phase, 0) + time.perf_counter() - start_time
+
+    @contextmanager
+    def timer(self, phase):
+        self.start(phase)
+        try:
+            yield
+        finally:
+            self.stop(phase)
+
+    def finish(self):
+        self.duration = time.perf_counter() - self.start_time
+
+    @property
+    def max_repeated_queries(self):
+        return max(self.fingerprints.values(), default=0)
+
+    def get_top_fingerprints(self, count=TOP_FINGERPRINTS):
+        """
+        Return a list of the most frequently executed query fingerprints and their execution counts.
+        """
+        return self.fingerprints.most_common(count)
+
+    def get_server_timing(self):
+        """
+        Return the value of the Server-Timing HTTP header reporting the recorded metrics (in milliseconds).
+        """
+        metrics = [
+            f'db;dur={self.db_duration * 1000:.1f};desc="{self.query_count} queries"',
+            *(f'{phase};dur={duration * 1000:.1f}' for phase, duration in self.phases.items()),
+        ]
+        if self.duration is not None:
+            metrics.append(f'total;dur={self.duration * 1000:.1f}')
+        return ', '.join(metrics)
+
+    def report(self, view):
+        """
+        Export the recorded metrics for the given view to Prometheus, and log a warning if a query has been repeated
+        excessively.
+        """
+        request_queries.labels(view=view).observe(self.query_count)
+        request_repeated_queries.labels(view=view).observe(self.max_repeated_queries)
+        request_db_duration.labels(view=view).observe(self.db_duration)
+        for phase, duration in self.phases.items():
+            request_phase_duration.labels(view=view, phase=phase).observe(duration)
+
+        if self.max_repeated_queries > REPEATED_QUERY_THRESHOLD:
+            top_fingerprints = '\n'.join(
+                f'\t{count}x {fingerprint}' for fingerprint, count in self.get_top_fingerprints()
+            )
+            logger.warning(
+                f"{view}: {self.query_count} queries executed ({self.db_duration * 1000:.1f}ms); most repeated:\n"
+                f"{top_fingerprints}"
+            )
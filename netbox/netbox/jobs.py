@@ -2,9 +2,13 @@ import logging
 from abc import ABC, abstractmethod
 from datetime import timedelta
 
+import django_rq
 from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
 from django.utils.functional import classproperty
 from django_pglocks import advisory_lock
+from rq import Callback, Retry, get_current_job
+from rq.job import Dependency
 from rq.timeouts import JobTimeoutException
 
 from core.choices import JobStatusChoices
@@ -14,7 +18,10 @@ from netbox.constants import ADVISORY_LOCK_KEYS
 from netbox.registry import registry
 
 __all__ = (
+    'ChunkedJobRunner',
     'JobRunner',
+    'partition_queryset_by_field',
+    'partition_queryset_by_pk',
     'system_job',
 )
 
@@ -46,6 +53,9 @@ class JobRunner(ABC):
     class Meta:
         pass
 
+    # If True, the job is not terminated upon the return of run(); the runner is then responsible for terminating it
+    defer_termination = False
+
     def __init__(self, job):
         """
         Args:
@@ -75,11 +85,15 @@ class JobRunner(ABC):
         job's metadata and handle errors. For periodic jobs, a new job is automatically scheduled using its `interval`.
         """
         logger = logging.getLogger('netbox.jobs')
+        deferred = False
 
         try:
             job.start()
             cls(job).run(*args, **kwargs)
-            job.terminate()
+            if cls.defer_termination:
+                deferred = True
+            else:
+                job.terminate()
 
         except JobFailed:
             logger.warning(f"Job {job} failed")
@@ -90,20 +104,28 @@ class JobRunner(ABC):
             if type(e) is JobTimeoutException:
                 logger.error(e)
 
-        # If the executed job is a periodic job, schedule its next execution at the specified interval.
+        # If the executed job is a periodic job, schedule its next execution at the specified interval. If termination
+        # of the job has been deferred, the runner is responsible for doing so once the job has been terminated.
         finally:
-            if job.interval:
-                new_scheduled_time = (job.scheduled or job.started) + timedelta(minutes=job.interval)
-                if job.object and getattr(job.object, "python_class", None):
-                    kwargs["job_timeout"] = job.object.python_class.job_timeout
-                cls.enqueue(
-                    instance=job.object,
-                    name=job.name,
-                    user=job.user,
-                    schedule_at=new_scheduled_time,
-                    interval=job.interval,
-                    **kwargs,
-                )
+            if job.interval and not deferred:
+                cls.schedule_next(job, **kwargs)
+
+    @classmethod
+    def schedule_next(cls, job, **kwargs):
+        """
+        Schedule the next execution of a periodic job at its specified interval.
+        """
+        new_scheduled_time = (job.scheduled or job.started) + timedelta(minutes=job.interval)
+        if job.object and getattr(job.object, "python_class", None):
+            kwargs["job_timeout"] = job.object.python_class.job_timeout
+        cls.enqueue(
+            instance=job.object,
+            name=job.name,
+            user=job.user,
+            schedule_at=new_scheduled_time,
+            interval=job.interval,
+            **kwargs,
+        )
 
     @classmethod
     def get_jobs(cls, instance=None):
@@ -161,3 +183,262 @@ class JobRunner(ABC):
             job.delete()
 
         return cls.enqueue(instance=instance, schedule_at=schedule_at, interval=interval, *args, **kwargs)
+
+
+def partition_queryset_by_pk(queryset, chunk_size):
+    """
+    Partition a QuerySet into ranges of consecutive primary keys, each of which matches up to `chunk_size` objects.
+    Returns a list of dictionaries of lookups (e.g. `{'pk__gt': 1000, 'pk__lte': 2000}`), each of which may be passed
+    to `filter()`. The final range is left open-ended, to include any objects created after partitioning.
+    """
+    pks = queryset.order_by('pk').values_list('pk', flat=True)
+    chunks = []
+    lower = None
+
+    while True:
+        batch = pks if lower is None else pks.filter(pk__gt=lower)
+        upper = next(iter(batch[chunk_size - 1:chunk_size]), None)
+        if upper is None:
+            if batch.exists():
+                chunks.append({} if lower is None else {'pk__gt': lower})
+            return chunks
+        chunks.append({'pk__lte': upper} if lower is None else {'pk__gt': lower, 'pk__lte': upper})
+        lower = upper
+
+
+def partition_queryset_by_field(queryset, field_name):
+    """
+    Partition a QuerySet by the distinct values of a field (e.g. `site_id`). Returns a list of dictionaries of lookups,
+    each of which may be passed to `filter()`.
+    """
+    values = queryset.order_by(field_name).values_list(field_name, flat=True).distinct()
+    return [
+        {f'{field_name}__isnull': True} if value is None else {field_name: value}
+        for value in values
+    ]
+
+
+def _handle_chunk_failure(rq_job, connection, exc_type, exc_value, traceback):
+    """
+    RQ failure callback for the chunks of a ChunkedJobRunner. Once a chunk which raised an unhandled exception has
+    exhausted its retries, its parent job is marked as errored.
+    """
+    if rq_job.should_retry:
+        return
+    runner_cls = rq_job.func.__self__
+    job_pk, index = rq_job.args[:2]
+    logging.getLogger('netbox.jobs').error(f"Chunk {index} of job {job_pk} errored: {exc_value!r}")
+    runner_cls.abort(job_pk, error=f"Chunk {index} errored: {exc_value!r}", **rq_job.kwargs)
+
+
+class ChunkedJobRunner(JobRunner):
+    """
+    A JobRunner which divides its work into chunks, each of which is executed as a separate sub-job.
+
+    Sub-jobs are enqueued as individual RQ jobs on the parent job's queue, and may thus be executed in parallel by
+    multiple workers. A failed chunk is retried independently of the others. The number of chunks completed and failed,
+    along with the result of each chunk, is recorded in the parent job's data. The parent job is terminated (and, if
+    periodic, its next execution scheduled) once the last of its chunks has finished: it is marked as failed if any
+    chunk has failed. A chunk which errors unexpectedly marks the parent job as errored. Should a chunk never finish
+    (e.g. if its worker process is killed), the parent job is terminated once all other chunks have finished.
+
+    Subclasses must implement `get_chunks()` and `run_chunk()`, and may implement `aggregate()`.
+    """
+    defer_termination = True
+
+    # The number of times a failed chunk is retried
+    max_retries = 2
+
+    # The number of seconds to wait before retrying a failed chunk
+    retry_interval = 60
+
+    # The maximum execution time of each chunk, in seconds (defaults to that of the queue)
+    chunk_timeout = None
+
+    @abstractmethod
+    def get_chunks(self, *args, **kwargs):
+        """
+        Return an iterable of chunks, each of which must be a JSON-serializable value (e.g. a dictionary of lookups
+        returned by `partition_queryset_by_pk()`).
+        """
+        pass
+
+    @abstractmethod
+    def run_chunk(self, chunk, *args, **kwargs):
+        """
+        Process a single chunk. The return value (which must be JSON-serializable) is recorded as the chunk's result.
+        """
+        pass
+
+    def aggregate(self, results):
+        """
+        Aggregate the results of all completed chunks (ordered by chunk) upon completion of the job. The return value
+        (if any) is recorded as the job's result.
+        """
+        return None
+
+    def run(self, *args, **kwargs):
+        chunks = list(self.get_chunks(*args, **kwargs))
+        self.job.data = {
+            'total': len(chunks),
+            'completed': 0,
+            'failed': 0,
+            'results': {},
+            'errors': {},
+        }
+        self.job.save(update_fields=['data'])
+        if not chunks:
+            self.finalize(**kwargs)
+            return
+
+        # If not running within a worker (e.g. the job was executed immediately), process each chunk in turn
+        rq_job = get_current_job()
+        if rq_job is None:
+            for index, chunk in enumerate(chunks):
+                self.handle_chunk(self.job.pk, index, chunk, *args, **kwargs)
+            self.job.refresh_from_db()
+            return
+
+        queue = django_rq.get_queue(rq_job.origin)
+        chunk_jobs = []
+        for index, chunk in enumerate(chunks):
+            chunk_jobs.append(queue.enqueue_call(
+                self.handle_chunk,
+                args=(self.job.pk, index, chunk, *args),
+                kwargs=kwargs,
+                timeout=self.chunk_timeout,
+                description=f'{self.job.name} (chunk {index + 1} of {len(chunks)})',
+                retry=Retry(max=self.max_retries, interval=self.retry_interval) if self.max_retries else None,
+                on_failure=Callback(_handle_chunk_failure),
+            ))
+
+        # Once all chunks have finished (successfully or otherwise), terminate the job if it has not been already
+        queue.enqueue_call(
+            self.handle_chunks_finished,
+            args=(self.job.pk, *args),
+            kwargs=kwargs,
+            description=f'{self.job.name} (finalize)',
+            depends_on=Dependency(jobs=chunk_jobs, allow_failure=True),
+        )
+
+    @classmethod
+    def handle_chunk(cls, job_pk, index, chunk, *args, **kwargs):
+        """
+        Process a single chunk on behalf of the parent job, and record its outcome. Exceptions are re-raised (causing
+        the chunk to be retried by RQ) until the chunk's retries have been exhausted.
+        """
+        logger = logging.getLogger('netbox.jobs')
+
+        # Skip the chunk if the parent job has since been deleted or terminated
+        job = Job.objects.filter(pk=job_pk).first()
+        if job is None or job.status != JobStatusChoices.STATUS_RUNNING:
+            return
+
+        try:
+            result = cls(job).run_chunk(chunk, *args, **kwargs)
+
+        except JobFailed:
+            logger.warning(f"Chunk {index} of job {job} failed")
+            cls.record_chunk(job_pk, index, error='failed', job_kwargs=kwargs)
+
+        except Exception as e:
+            rq_job = get_current_job()
+            if rq_job is not None and rq_job.retries_left:
+                logger.warning(f"Chunk {index} of job {job} errored; retrying")
+                raise
+            logger.error(f"Chunk {index} of job {job} errored: {e!r}")
+            cls.record_chunk(job_pk, index, error=repr(e), job_kwargs=kwargs)
+
+        else:
+            cls.record_chunk(job_pk, index, result=result, job_kwargs=kwargs)
+
+    @classmethod
+    def record_chunk(cls, job_pk, index, result=None, error=None, job_kwargs=None):
+        """
+        Record the outcome of a chunk on the parent job, and finalize the job if all of its chunks have finished. The
+        job is locked while its data is updated, as its chunks may finish concurrently.
+        """
+        with transaction.atomic():
+            job = Job.objects.select_for_update().filter(pk=job_pk).first()
+            if job is None or job.status != JobStatusChoices.STATUS_RUNNING:
+                return
+            data = job.data
+            key = str(index)
+
+            # Ignore duplicate executions of the same chunk
+            if key in data['results'] or key in data['errors']:
+                return
+            if error is None:
+                data['completed'] += 1
+                data['results'][key] = result
+            else:
+                data['failed'] += 1
+                data['errors'][key] = error
+            job.save(update_fields=['data'])
+
+        if data['completed'] + data['failed'] == data['total']:
+            cls(job).finalize(**(job_kwargs or {}))
+
+    @classmethod
+    def handle_chunks_finished(cls, job_pk, *args, **kwargs):
+        """
+        Called once all chunks of the job have finished. If any chunk did not record its outcome (e.g. because its
+        worker process was killed), it is recorded as errored and the job is finalized.
+        """
+        with transaction.atomic():
+            job = Job.objects.select_for_update().filter(pk=job_pk).first()
+            if job is None or job.status != JobStatusChoices.STATUS_RUNNING:
+                return
+            data = job.data
+            missing = [
+                str(index) for index in range(data['total'])
+                if str(index) not in data['results'] and str(index) not in data['errors']
+            ]
+            if not missing:
+                # The last chunk has already finalized the job
+                return
+            logging.getLogger('netbox.jobs').error(f"Chunks {', '.join(missing)} of job {job} did not complete")
+            for key in missing:
+                data['failed'] += 1
+                data['errors'][key] = 'Chunk did not complete'
+            job.save(update_fields=['data'])
+
+        cls(job).finalize(**kwargs)
+
+    @classmethod
+    def abort(cls, job_pk, error, **kwargs):
+        """
+        Mark the job as errored (if it is still running), and schedule its next execution if it is periodic. Any of
+        its chunks which have yet to be processed are skipped.
+        """
+        with transaction.atomic():
+            job = Job.objects.select_for_update().filter(pk=job_pk).first()
+            if job is None or job.status != JobStatusChoices.STATUS_RUNNING:
+                return
+            job.terminate(status=JobStatusChoices.STATUS_ERRORED, error=error)
+
+        if job.interval:
+            cls.schedule_next(job, **kwargs)
+
+    def finalize(self, **kwargs):
+        """
+        Aggregate the results of all completed chunks and terminate the job. If the job is periodic, its next execution
+        is then scheduled.
+        """
+        data = self.job.data
+        results = [data['results'][key] for key in sorted(data['results'], key=int)]
+        try:
+            data['result'] = self.aggregate(results)
+        except Exception as e:
+            self.job.terminate(status=JobStatusChoices.STATUS_ERRORED, error=repr(e))
+        else:
+            if data['failed']:
+                self.job.terminate(
+                    status=JobStatusChoices.STATUS_FAILED,
+                    error=f"{data['failed']} of {data['total']} chunks failed"
+                )
+            else:
+                self.job.terminate()
+
+        if self.job.interval:
+            self.schedule_next(self.job, **kwargs)
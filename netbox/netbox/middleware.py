@@ -57,6 +57,10 @@ class CoreMiddleware:
         # Attach the unique request ID as an HTTP header.
         response['X-Request-ID'] = request.id
 
+        # If the request has been instrumented, report its timing metrics
+        if instrumentation := getattr(request, 'instrumentation', None):
+            response['Server-Timing'] = instrumentation.get_server_timing()
+
         # Enable the Vary header to help with caching of HTMX responses
         response['Vary'] = 'HX-Request'
 
@@ -69,6 +73,16 @@ class CoreMiddleware:
 
         return response
 
+    def process_template_response(self, request, response):
+        """
+        Measure the time spent rendering a deferred response (e.g. serializing a REST API response) for instrumented
+        requests.
+        """
+        if instrumentation := getattr(request, 'instrumentation', None):
+            instrumentation.start('render')
+            response.add_post_render_callback(lambda response: instrumentation.stop('render'))
+        return response
+
     def process_exception(self, request, exception):
         """
         Implement custom error handling logic for production deployments.
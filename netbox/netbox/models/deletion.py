@@ -73,7 +73,7 @@ class DeleteMixin:
             self._meta.pk.attname,
         )
 
-        collector = CustomCollector(using=using)
+        collector = CustomCollector(using=using, origin=self)
         collector.collect([self], keep_parents=keep_parents)
 
         return collector.delete()
@@ -152,7 +152,8 @@ class CloningMixin(models.Model):
 
         # Include any cloneable custom fields
         if hasattr(self, 'custom_fields'):
-            for field in self.custom_fields:
+            from extras.models import CustomField
+            for field in CustomField.objects.get_cached_for_model(self):
                 if field.is_cloneable:
                     attrs[f'cf_{field.name}'] = self.custom_field_data.get(field.name)
 
@@ -183,9 +184,10 @@ class CustomFieldsMixin(models.Model):
         {'primary_site': <Site: DM-NYC>, 'cust_id': 'DMI01', 'is_active': True}
         ```
         """
+        from extras.models import CustomField
         return {
             cf.name: cf.deserialize(self.custom_field_data.get(cf.name))
-            for cf in self.custom_fields
+            for cf in CustomField.objects.get_cached_for_model(self)
         }
 
     @cached_property
@@ -218,7 +220,7 @@ class CustomFieldsMixin(models.Model):
         from extras.models import CustomField
         data = {}
 
-        for field in CustomField.objects.get_for_model(self):
+        for field in CustomField.objects.get_cached_for_model(self):
             value = self.custom_field_data.get(field.name)
 
             # Skip hidden fields if 'omit_hidden' is True
@@ -246,9 +248,10 @@ class CustomFieldsMixin(models.Model):
         """
         from extras.models import CustomField
         groups = defaultdict(dict)
-        visible_custom_fields = CustomField.objects.get_for_model(self).exclude(
-            ui_visible=CustomFieldUIVisibleChoices.HIDDEN
-        )
+        visible_custom_fields = [
+            cf for cf in CustomField.objects.get_cached_for_model(self)
+            if cf.ui_visible != CustomFieldUIVisibleChoices.HIDDEN
+        ]
 
         for cf in visible_custom_fields:
             value = self.custom_field_data.get(cf.name)
@@ -263,7 +266,8 @@ class CustomFieldsMixin(models.Model):
         """
         Apply the default value for each custom field
         """
-        for cf in self.custom_fields:
+        from extras.models import CustomField
+        for cf in CustomField.objects.get_cached_for_model(self):
             self.custom_field_data[cf.name] = cf.default
     populate_custom_field_defaults.alters_data = True
 
@@ -272,7 +276,7 @@ class CustomFieldsMixin(models.Model):
         from extras.models import CustomField
 
         custom_fields = {
-            cf.name: cf for cf in CustomField.objects.get_for_model(self)
+            cf.name: cf for cf in CustomField.objects.get_cached_for_model(self)
         }
 
         # Validate all field values
@@ -303,10 +307,12 @@ class CustomFieldsMixin(models.Model):
                 raise ValidationError(_("Missing required custom field '{name}'.").format(name=cf.name))
 
     def save(self, *args, **kwargs):
+        from extras.models import CustomField
+
         # Populate default values if omitted
-        for cf in self.custom_fields.filter(default__isnull=False):
-            if cf.name not in self.custom_field_data:
-                self.custom_field_data[cf.name] = cf.default
+        for name, default in CustomField.objects.get_defaults_for_model(self).items():
+            if name not in self.custom_field_data:
+                self.custom_field_data[name] = default
 
         super().save(*args, **kwargs)
 
@@ -518,6 +524,9 @@ class SyncedDataMixin(models.Model):
         editable=False
     )
 
+    # The fields populated by sync_data(). Declaring these enables objects to be synchronized in bulk (see bulk_sync()).
+    sync_fields = ()
+
     class Meta:
         abstract = True
 
@@ -610,6 +619,77 @@ class SyncedDataMixin(models.Model):
             class_name=self.__class__
         ))
 
+    @classmethod
+    def bulk_sync(cls, instances):
+        """
+        Synchronize multiple objects of this model from their assigned DataFiles. Objects for which the synchronized
+        data has changed are written by a single bulk_update(), with their ObjectChanges created in bulk; the remainder
+        have only their data_synced times updated. If the model does not declare its sync_fields, each object is
+        instead synchronized and saved individually. Returns a list of the objects which were updated.
+        """
+        from django_prometheus.models import model_updates
+
+        from core.events import OBJECT_UPDATED
+        from core.models import ObjectChange
+        from extras.events import enqueue_event
+        from netbox.context import current_request, events_queue
+
+        if not cls.sync_fields:
+            instances = list(instances)
+            for instance in instances:
+                instance.sync(save=True)
+            return instances
+
+        now = timezone.now()
+        updated_instances = []
+        unchanged_pks = []
+        for instance in instances:
+            original_values = {name: getattr(instance, name) for name in cls.sync_fields}
+            instance.sync_data()
+            synced_values = {name: getattr(instance, name) for name in cls.sync_fields}
+            instance.data_synced = now
+            if synced_values == original_values:
+                unchanged_pks.append(instance.pk)
+                continue
+
+            # Record the object's original state for change logging
+            if hasattr(instance, 'snapshot'):
+                for name, value in original_values.items():
+                    setattr(instance, name, value)
+                instance.snapshot()
+                for name, value in synced_values.items():
+                    setattr(instance, name, value)
+            if hasattr(instance, 'last_updated'):
+                instance.last_updated = now
+            updated_instances.append(instance)
+
+        cls.objects.filter(pk__in=unchanged_pks).update(data_synced=now)
+        if not updated_instances:
+            return []
+        update_fields = [*cls.sync_fields, 'data_synced']
+        if hasattr(updated_instances[0], 'last_updated'):
+            update_fields.append('last_updated')
+        cls.objects.bulk_update(updated_instances, update_fields, batch_size=100)
+
+        # Record changes & enqueue events
+        if request := current_request.get():
+            objectchanges = []
+            queue = events_queue.get()
+            for instance in updated_instances:
+                if hasattr(instance, 'to_objectchange'):
+                    objectchange = instance.to_objectchange(ObjectChangeActionChoices.ACTION_UPDATE)
+                    if objectchange and objectchange.has_changes:
+                        objectchange.user = request.user
+                        objectchange.user_name = request.user.username
+                        objectchange.request_id = request.id
+                        objectchanges.append(objectchange)
+                enqueue_event(queue, instance, request.user, request.id, OBJECT_UPDATED)
+            events_queue.set(queue)
+            ObjectChange.objects.bulk_create(objectchanges, batch_size=100)
+        model_updates.labels(cls._meta.model_name).inc(len(updated_instances))
+
+        return updated_instances
+
 
 #
 # Feature registration
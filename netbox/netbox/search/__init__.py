@@ -118,7 +118,8 @@ class SearchIndex:
         # Capture custom fields
         if getattr(instance, 'custom_field_data', None):
             if custom_fields is None:
-                custom_fields = instance.custom_fields
+                from extras.models import CustomField
+                custom_fields = CustomField.objects.get_cached_for_model(instance)
             for cf in custom_fields:
                 type_ = cf.search_type
                 value = instance.custom_field_data.get(cf.name)
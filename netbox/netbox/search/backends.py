@@ -207,8 +207,9 @@ class CachedValueSearchBackend(SearchBackend):
                         break
 
                 # Prefetch any associated custom fields
-                object_type = ObjectType.objects.get_for_model(indexer.model)
-                custom_fields = CustomField.objects.filter(object_types=object_type).exclude(search_weight=0)
+                custom_fields = [
+                    cf for cf in CustomField.objects.get_cached_for_model(indexer.model) if cf.search_weight
+                ]
 
             # Wipe out any previously cached values for the object
             if remove_existing:
@@ -66,6 +66,10 @@ elif hasattr(configuration, 'DATABASE') and hasattr(configuration, 'DATABASES'):
 ADMINS = getattr(configuration, 'ADMINS', [])
 ALLOW_TOKEN_RETRIEVAL = getattr(configuration, 'ALLOW_TOKEN_RETRIEVAL', False)
 ALLOWED_HOSTS = getattr(configuration, 'ALLOWED_HOSTS')  # Required
+API_COUNT_CACHE_TIMEOUT = getattr(configuration, 'API_COUNT_CACHE_TIMEOUT', 60)
+API_COUNT_ESTIMATE_THRESHOLD = getattr(configuration, 'API_COUNT_ESTIMATE_THRESHOLD', 100000)
+API_COUNT_STRATEGIES = getattr(configuration, 'API_COUNT_STRATEGIES', {})
+API_COUNT_STRATEGY = getattr(configuration, 'API_COUNT_STRATEGY', 'exact')
 AUTH_PASSWORD_VALIDATORS = getattr(configuration, 'AUTH_PASSWORD_VALIDATORS', [
     {
         "NAME": "django.contrib.auth.password_validation.MinimumLengthValidator",
@@ -78,6 +82,7 @@ AUTH_PASSWORD_VALIDATORS = getattr(configuration, 'AUTH_PASSWORD_VALIDATORS', [
     },
 ])
 BASE_PATH = trailing_slash(getattr(configuration, 'BASE_PATH', ''))
+CHANGELOG_PARTITIONING = getattr(configuration, 'CHANGELOG_PARTITIONING', False)
 CHANGELOG_SKIP_EMPTY_CHANGES = getattr(configuration, 'CHANGELOG_SKIP_EMPTY_CHANGES', True)
 CENSUS_REPORTING_ENABLED = getattr(configuration, 'CENSUS_REPORTING_ENABLED', True)
 CORS_ORIGIN_ALLOW_ALL = getattr(configuration, 'CORS_ORIGIN_ALLOW_ALL', False)
@@ -87,6 +92,7 @@ CSRF_COOKIE_NAME = getattr(configuration, 'CSRF_COOKIE_NAME', 'csrftoken')
 CSRF_COOKIE_PATH = f'/{BASE_PATH.rstrip("/")}'
 CSRF_COOKIE_SECURE = getattr(configuration, 'CSRF_COOKIE_SECURE', False)
 CSRF_TRUSTED_ORIGINS = getattr(configuration, 'CSRF_TRUSTED_ORIGINS', [])
+DATA_SOURCE_CACHE_PATH = getattr(configuration, 'DATA_SOURCE_CACHE_PATH', None)
 DATA_UPLOAD_MAX_MEMORY_SIZE = getattr(configuration, 'DATA_UPLOAD_MAX_MEMORY_SIZE', 2621440)
 DATABASE = getattr(configuration, 'DATABASE', None)  # Legacy DB definition
 DATABASE_ROUTERS = getattr(configuration, 'DATABASE_ROUTERS', [])
@@ -124,7 +130,13 @@ EVENTS_PIPELINE = getattr(configuration, 'EVENTS_PIPELINE', [
 EXEMPT_VIEW_PERMISSIONS = getattr(configuration, 'EXEMPT_VIEW_PERMISSIONS', [])
 FIELD_CHOICES = getattr(configuration, 'FIELD_CHOICES', {})
 FILE_UPLOAD_MAX_MEMORY_SIZE = getattr(configuration, 'FILE_UPLOAD_MAX_MEMORY_SIZE', 2621440)
+GRAPHQL_DEFAULT_LIST_SIZE = getattr(configuration, 'GRAPHQL_DEFAULT_LIST_SIZE', 100)
+GRAPHQL_DOCUMENT_CACHE_SIZE = getattr(configuration, 'GRAPHQL_DOCUMENT_CACHE_SIZE', 256)
 GRAPHQL_MAX_ALIASES = getattr(configuration, 'GRAPHQL_MAX_ALIASES', 10)
+GRAPHQL_MAX_COST = getattr(configuration, 'GRAPHQL_MAX_COST', None)
+GRAPHQL_MAX_DEPTH = getattr(configuration, 'GRAPHQL_MAX_DEPTH', None)
+GRAPHQL_PERSISTED_QUERY_TIMEOUT = getattr(configuration, 'GRAPHQL_PERSISTED_QUERY_TIMEOUT', 86400)
+GRAPHQL_QUERY_BUDGETS = getattr(configuration, 'GRAPHQL_QUERY_BUDGETS', {})
 HTTP_PROXIES = getattr(configuration, 'HTTP_PROXIES', {})
 INTERNAL_IPS = getattr(configuration, 'INTERNAL_IPS', ('127.0.0.1', '::1'))
 ISOLATED_DEPLOYMENT = getattr(configuration, 'ISOLATED_DEPLOYMENT', False)
@@ -165,6 +177,7 @@ REMOTE_AUTH_STAFF_GROUPS = getattr(configuration, 'REMOTE_AUTH_STAFF_GROUPS', []
 REMOTE_AUTH_STAFF_USERS = getattr(configuration, 'REMOTE_AUTH_STAFF_USERS', [])
 # Required by extras/migrations/0109_script_models.py
 REPORTS_ROOT = getattr(configuration, 'REPORTS_ROOT', os.path.join(BASE_DIR, 'reports')).rstrip('/')
+REQUEST_INSTRUMENTATION_SAMPLE_RATE = getattr(configuration, 'REQUEST_INSTRUMENTATION_SAMPLE_RATE', 0)
 RQ_DEFAULT_TIMEOUT = getattr(configuration, 'RQ_DEFAULT_TIMEOUT', 300)
 RQ_RETRY_INTERVAL = getattr(configuration, 'RQ_RETRY_INTERVAL', 60)
 RQ_RETRY_MAX = getattr(configuration, 'RQ_RETRY_MAX', 0)
@@ -0,0 +1,86 @@
+import json
+import os
+from unittest import skipUnless
+
+from django.test import tag
+from django.urls import NoReverseMatch, reverse
+
+from dcim.models import Device, Site
+from ipam.models import IPAddress, Prefix
+from utilities.testing import QueryCountBenchmarkTestCase
+
+GRAPHQL_QUERIES = {
+    'device_list': (
+        '{device_list(pagination: {limit: %d}) '
+        '{id name role {name} site {name} rack {name} interfaces {name ip_addresses {address}}}}'
+    ),
+    'site_list': '{site_list(pagination: {limit: %d}) {id name region {name} tenant {name} racks {name}}}',
+    'prefix_list': '{prefix_list(pagination: {limit: %d}) {id prefix scope {... on SiteType {name}} vlan {vid}}}',
+    'ip_address_list': '{ip_address_list(pagination: {limit: %d}) {id address tenant {name}}}',
+}
+
+
+@tag('benchmark')
+@skipUnless(os.environ.get('NETBOX_BENCHMARKS'), "Set NETBOX_BENCHMARKS to run query count benchmarks")
+class QueryCountBenchmarkTest(QueryCountBenchmarkTestCase):
+
+    def test_list_views(self):
+
+        def get_requests():
+            for model in self.get_models():
+                if url := self.get_url(model, 'list'):
+                    yield (
+                        f'{model._meta.label_lower} list',
+                        model.objects.count(),
+                        lambda page_size, url=url: (url, {'data': {'per_page': page_size}})
+                    )
+
+        self.run_benchmarks(get_requests)
+
+    def test_detail_views(self):
+
+        def get_requests():
+            for model in self.get_models():
+                instance = model.objects.first()
+                try:
+                    url = instance.get_absolute_url()
+                except (AttributeError, NoReverseMatch):
+                    continue
+                yield f'{model._meta.label_lower} detail', None, lambda page_size, url=url: (url, {})
+
+        self.run_benchmarks(get_requests)
+
+    def test_api_list_endpoints(self):
+
+        def get_requests():
+            for model in self.get_models():
+                if url := self.get_url(model, 'list', rest_api=True):
+                    yield (
+                        f'{model._meta.label_lower} API list',
+                        model.objects.count(),
+                        lambda page_size, url=url: (url, {'data': {'limit': page_size}})
+                    )
+
+        self.run_benchmarks(get_requests)
+
+    def test_graphql_queries(self):
+        url = reverse('graphql')
+
+        def get_request(query):
+            return lambda page_size: (url, {
+                'method': 'post',
+                'data': json.dumps({'query': query % page_size}),
+                'content_type': 'application/json',
+            })
+
+        def get_requests():
+            object_counts = {
+                'device_list': Device.objects.count(),
+                'site_list': Site.objects.count(),
+                'prefix_list': Prefix.objects.count(),
+                'ip_address_list': IPAddress.objects.count(),
+            }
+            for name, query in GRAPHQL_QUERIES.items():
+                yield f'GraphQL {name}', object_counts[name], get_request(query)
+
+        self.run_benchmarks(get_requests)
@@ -1,5 +1,7 @@
+import hashlib
 import json
 
+from django.core.cache import cache
 from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
@@ -126,3 +128,110 @@ class GraphQLAPITestCase(APITestCase):
         data = json.loads(response.content)
         self.assertNotIn('errors', data)
         self.assertEqual(len(data['data']['site']['locations']), 0)
+
+    def test_graphql_query_cost(self):
+        """
+        Test the estimation & enforcement of GraphQL query costs.
+        """
+        self.add_permissions('dcim.view_site', 'dcim.view_location')
+        url = reverse('graphql')
+        query = '{site_list(pagination: {limit: 5}) {id locations {id}}}'
+
+        # The estimated cost is reported in the response's extensions
+        with override_settings(GRAPHQL_DEFAULT_LIST_SIZE=10):
+            response = self.client.post(url, data={'query': query}, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        data = json.loads(response.content)
+        self.assertNotIn('errors', data)
+        self.assertEqual(data['extensions']['cost']['estimated'], 55)
+        self.assertEqual(data['extensions']['cost']['depth'], 2)
+        self.assertIn('queries', data['extensions']['cost'])
+
+        # Queries exceeding the maximum depth or cost are rejected
+        for params in ({'GRAPHQL_MAX_DEPTH': 1}, {'GRAPHQL_MAX_COST': 50, 'GRAPHQL_DEFAULT_LIST_SIZE': 10}):
+            with override_settings(**params):
+                response = self.client.post(url, data={'query': query}, format="json", **self.header)
+            data = json.loads(response.content)
+            self.assertIn('errors', data)
+            self.assertIsNone(data['data'])
+
+        # A per-user budget overrides the global maximum
+        with override_settings(GRAPHQL_MAX_DEPTH=1, GRAPHQL_QUERY_BUDGETS={self.user.username: {'max_depth': 2}}):
+            response = self.client.post(url, data={'query': query}, format="json", **self.header)
+        data = json.loads(response.content)
+        self.assertNotIn('errors', data)
+
+        # A per-token budget takes precedence over the user's budget
+        budgets = {
+            self.user.username: {'max_depth': 2},
+            self.token.pk: {'max_depth': 1},
+        }
+        with override_settings(GRAPHQL_MAX_DEPTH=None, GRAPHQL_QUERY_BUDGETS=budgets):
+            response = self.client.post(url, data={'query': query}, format="json", **self.header)
+        data = json.loads(response.content)
+        self.assertIn('errors', data)
+        self.assertIsNone(data['data'])
+
+    def test_graphql_batched_resolvers(self):
+        """
+        Test that custom resolvers are batched across all objects in a list.
+        """
+        self.add_permissions('dcim.view_site', 'core.view_objectchange', 'extras.view_journalentry')
+        Site.objects.bulk_create([
+            Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 9)
+        ])
+        url = reverse('graphql')
+
+        query_counts = []
+        for limit in (2, 8):
+            query = '{site_list(pagination: {limit: %d}) {id changelog {id} journal_entries {id}}}' % limit
+            response = self.client.post(url, data={'query': query}, format="json", **self.header)
+            self.assertHttpStatus(response, status.HTTP_200_OK)
+            data = json.loads(response.content)
+            self.assertNotIn('errors', data)
+            self.assertEqual(len(data['data']['site_list']), limit)
+            query_counts.append(data['extensions']['cost']['queries'])
+
+        # The number of queries should not increase with the number of objects
+        self.assertEqual(query_counts[0], query_counts[1])
+
+    def test_graphql_persisted_query(self):
+        """
+        Test the registration and execution of persisted queries.
+        """
+        self.add_permissions('dcim.view_site')
+        Site.objects.create(name='Site 1', slug='site-1')
+        url = reverse('graphql')
+        query = '{site_list {id name}}'
+        extensions = {
+            'persistedQuery': {
+                'version': 1,
+                'sha256Hash': hashlib.sha256(query.encode()).hexdigest(),
+            },
+        }
+        cache.delete(f"graphql_query_{extensions['persistedQuery']['sha256Hash']}")
+
+        # An unrecognized hash should return an error
+        response = self.client.post(url, data={'extensions': extensions}, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        data = json.loads(response.content)
+        self.assertEqual(data['errors'][0]['message'], 'PersistedQueryNotFound')
+
+        # Register the query
+        response = self.client.post(url, data={'query': query, 'extensions': extensions}, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        data = json.loads(response.content)
+        self.assertNotIn('errors', data)
+
+        # The hash alone now suffices
+        response = self.client.post(url, data={'extensions': extensions}, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        data = json.loads(response.content)
+        self.assertNotIn('errors', data)
+        self.assertEqual(data['data']['site_list'][0]['name'], 'Site 1')
+
+        # A hash which does not match the query is rejected
+        response = self.client.post(
+            url, data={'query': '{site_list {id}}', 'extensions': extensions}, format="json", **self.header
+        )
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
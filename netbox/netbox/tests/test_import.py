@@ -1,10 +1,16 @@
+import uuid
+
 from django.test import override_settings
 
+from core.choices import JobStatusChoices
+from core.jobs import BulkImportJob
 from core.models import ObjectType
 from dcim.models import *
+from dcim.views import RegionBulkImportView
 from extras.models import CustomField
 from netbox.choices import CSVDelimiterChoices, ImportFormatChoices
 from users.models import ObjectPermission
+from utilities.request import NetBoxFakeRequest
 from utilities.testing import ModelViewTestCase, create_tags
 
 
@@ -141,3 +147,55 @@ class CSVImportTestCase(ModelViewTestCase):
         self.assertHttpStatus(self.client.post(self._get_url('bulk_import'), data), 302)
         region = Region.objects.get(slug='region-1')
         self.assertEqual(region.cf['tcf'], 'def-cf-text')
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=['*'])
+    def test_related_object_references(self):
+        self.add_permissions('dcim.add_region')
+        Region.objects.create(name='Region 0', slug='region-0')
+
+        # Region 3 references a parent created earlier within the same import
+        csv_data = [
+            'name,slug,parent',
+            'Region 1,region-1,Region 0',
+            'Region 2,region-2,',
+            'Region 3,region-3,Region 2',
+        ]
+        data = {
+            'format': ImportFormatChoices.CSV,
+            'data': self._get_csv_data(csv_data),
+            'csv_delimiter': CSVDelimiterChoices.AUTO,
+        }
+
+        self.assertHttpStatus(self.client.post(self._get_url('bulk_import'), data), 302)
+        self.assertEqual(Region.objects.get(slug='region-1').parent.slug, 'region-0')
+        self.assertIsNone(Region.objects.get(slug='region-2').parent)
+        self.assertEqual(Region.objects.get(slug='region-3').parent.slug, 'region-2')
+
+    def test_background_job(self):
+        self.add_permissions('dcim.add_region')
+        records = [
+            {'name': f'Region {i}', 'slug': f'region-{i}'} for i in range(1, 6)
+        ]
+        request = NetBoxFakeRequest({
+            'META': {},
+            'COOKIES': {},
+            'POST': {},
+            'GET': {},
+            'FILES': {},
+            'user': self.user,
+            'path': '',
+            'id': uuid.uuid4(),
+        })
+
+        job = BulkImportJob.enqueue(
+            immediate=True,
+            view_cls=RegionBulkImportView,
+            records=records,
+            request=request,
+            chunk_size=2
+        )
+
+        self.assertEqual(job.status, JobStatusChoices.STATUS_COMPLETED)
+        self.assertEqual(job.data['completed'], 5)
+        self.assertEqual(job.data['created'], 5)
+        self.assertEqual(Region.objects.count(), 5)
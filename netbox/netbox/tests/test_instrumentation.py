@@ -0,0 +1,35 @@
+from django.test import override_settings
+from django.urls import reverse
+
+from netbox.instrumentation import get_fingerprint
+from utilities.testing import TestCase
+
+
+class RequestInstrumentationTestCase(TestCase):
+
+    def test_get_fingerprint(self):
+        self.assertEqual(
+            get_fingerprint('SELECT * FROM "dcim_site" WHERE "dcim_site"."id" IN (%s, %s, %s)'),
+            'SELECT * FROM "dcim_site" WHERE "dcim_site"."id" IN (...)'
+        )
+        self.assertEqual(
+            get_fingerprint("SELECT *\n  FROM dcim_site WHERE name = 'Site 1' LIMIT 21"),
+            get_fingerprint("SELECT * FROM dcim_site WHERE name = 'Site 2' LIMIT 21")
+        )
+
+    @override_settings(REQUEST_INSTRUMENTATION_SAMPLE_RATE=1, LOGIN_REQUIRED=False)
+    def test_server_timing_header(self):
+        response = self.client.get(reverse('api-root'))
+
+        self.assertHttpStatus(response, 200)
+        self.assertIn('Server-Timing', response)
+        self.assertRegex(response['Server-Timing'], r'^db;dur=[\d.]+;desc="\d+ queries"')
+        self.assertIn('render;dur=', response['Server-Timing'])
+        self.assertIn('total;dur=', response['Server-Timing'])
+
+    @override_settings(REQUEST_INSTRUMENTATION_SAMPLE_RATE=0, LOGIN_REQUIRED=False)
+    def test_sampling_disabled(self):
+        response = self.client.get(reverse('api-root'))
+
+        self.assertHttpStatus(response, 200)
+        self.assertNotIn('Server-Timing', response)
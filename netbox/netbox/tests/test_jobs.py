@@ -1,14 +1,16 @@
 from datetime import timedelta
+from unittest import mock
 
 from django.test import TestCase
 from django.utils import timezone
 from django_rq import get_queue
 
 from ..jobs import *
+from ..jobs import _handle_chunk_failure
 from core.models import DataSource, Job
 from core.choices import JobStatusChoices
 from core.exceptions import JobFailed
-from utilities.testing import disable_warnings
+from utilities.testing import disable_logging, disable_warnings
 
 
 class TestJobRunner(JobRunner):
@@ -173,3 +175,113 @@ class SystemJobTest(JobRunnerTestCase):
 
         self.assertEqual(job1, job2)
         self.assertEqual(TestJobRunner.get_jobs().count(), 1)
+
+
+class TestChunkedJobRunner(ChunkedJobRunner):
+
+    def get_chunks(self, *args, **kwargs):
+        return partition_queryset_by_pk(DataSource.objects.all(), chunk_size=2)
+
+    def run_chunk(self, chunk, *args, **kwargs):
+        if kwargs.get('make_fail', False) and 'pk__lte' not in chunk:
+            raise JobFailed()
+        return DataSource.objects.filter(**chunk).count()
+
+    def aggregate(self, results):
+        return sum(results)
+
+
+class ChunkedJobRunnerTest(JobRunnerTestCase):
+    """
+    Test the execution of chunked jobs.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        DataSource.objects.bulk_create([
+            DataSource(name=f'Data Source {i}', type='local', source_url=f'file:///tmp/{i}/')
+            for i in range(1, 6)
+        ])
+
+    def test_partition_queryset_by_pk(self):
+        queryset = DataSource.objects.all()
+        chunks = partition_queryset_by_pk(queryset, chunk_size=2)
+
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual([queryset.filter(**chunk).count() for chunk in chunks], [2, 2, 1])
+        self.assertEqual(partition_queryset_by_pk(queryset.none(), chunk_size=2), [])
+
+    def test_partition_queryset_by_field(self):
+        chunks = partition_queryset_by_field(DataSource.objects.all(), 'type')
+
+        self.assertEqual(chunks, [{'type': 'local'}])
+
+    def test_handle(self):
+        job = TestChunkedJobRunner.enqueue(immediate=True)
+
+        self.assertEqual(job.status, JobStatusChoices.STATUS_COMPLETED)
+        self.assertEqual(job.data['total'], 3)
+        self.assertEqual(job.data['completed'], 3)
+        self.assertEqual(job.data['failed'], 0)
+        self.assertEqual(job.data['result'], 5)
+
+    def test_handle_failed_chunk(self):
+        with disable_warnings('netbox.jobs'):
+            job = TestChunkedJobRunner.enqueue(immediate=True, make_fail=True)
+
+        self.assertEqual(job.status, JobStatusChoices.STATUS_FAILED)
+        self.assertEqual(job.data['completed'], 2)
+        self.assertEqual(job.data['failed'], 1)
+        self.assertEqual(job.data['result'], 4)
+
+    def test_handle_interval(self):
+        job = TestChunkedJobRunner.enqueue(immediate=True, interval=60)
+
+        # The next execution is scheduled once upon completion of the job
+        self.assertEqual(job.status, JobStatusChoices.STATUS_COMPLETED)
+        self.assertEqual(TestChunkedJobRunner.get_jobs().count(), 2)
+        self.assertEqual(TestChunkedJobRunner.get_jobs().filter(status=JobStatusChoices.STATUS_SCHEDULED).count(), 1)
+
+    def get_running_job(self, total=3):
+        job = TestChunkedJobRunner.enqueue(schedule_at=self.get_schedule_at())
+        job.start()
+        job.data = {'total': total, 'completed': 0, 'failed': 0, 'results': {}, 'errors': {}}
+        job.save()
+        return job
+
+    def test_handle_chunk_failure(self):
+        job = self.get_running_job()
+        rq_job = mock.Mock(
+            func=TestChunkedJobRunner.handle_chunk,
+            args=(job.pk, 0, {}),
+            kwargs={},
+            should_retry=True
+        )
+
+        # A chunk which will be retried does not affect the parent job
+        _handle_chunk_failure(rq_job, None, RuntimeError, RuntimeError('Error'), None)
+        job.refresh_from_db()
+        self.assertEqual(job.status, JobStatusChoices.STATUS_RUNNING)
+
+        # Once its retries have been exhausted, the parent job is marked as errored
+        rq_job.should_retry = False
+        with disable_logging():
+            _handle_chunk_failure(rq_job, None, RuntimeError, RuntimeError('Error'), None)
+        job.refresh_from_db()
+        self.assertEqual(job.status, JobStatusChoices.STATUS_ERRORED)
+
+    def test_handle_chunks_finished(self):
+        job = self.get_running_job(total=2)
+        TestChunkedJobRunner.record_chunk(job.pk, 0, result=2)
+        job.refresh_from_db()
+        self.assertEqual(job.status, JobStatusChoices.STATUS_RUNNING)
+
+        # A chunk which never recorded its outcome (e.g. if its worker was killed) is recorded as errored
+        with disable_logging():
+            TestChunkedJobRunner.handle_chunks_finished(job.pk)
+        job.refresh_from_db()
+        self.assertEqual(job.status, JobStatusChoices.STATUS_FAILED)
+        self.assertEqual(job.data['completed'], 1)
+        self.assertEqual(job.data['failed'], 1)
+        self.assertIn('1', job.data['errors'])
+        self.assertEqual(job.data['result'], 2)
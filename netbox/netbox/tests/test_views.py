@@ -1,11 +1,22 @@
+import csv
 import urllib.parse
+import uuid
 
+from django.core.files.storage import default_storage
+from django.http import QueryDict
 from django.urls import reverse
 from django.test import Client, override_settings
 
+from core.choices import JobStatusChoices
+from core.jobs import ExportJob
+from core.models import Job, ObjectType
 from dcim.models import Site
+from dcim.views import SiteListView
+from extras.models import ExportTemplate
 from netbox.constants import EMPTY_TABLE_TEXT
 from netbox.search.backends import search_backend
+from users.models import User
+from utilities.request import NetBoxFakeRequest
 from utilities.testing import TestCase
 
 
@@ -76,6 +87,73 @@ class SearchViewTestCase(TestCase):
         self.assertIn(EMPTY_TABLE_TEXT, content)
 
 
+class ExportViewTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.bulk_create([
+            Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 4)
+        ])
+
+    def test_export_table(self):
+        self.add_permissions('dcim.view_site')
+
+        response = self.client.get(f"{reverse('dcim:site_list')}?export=table")
+        self.assertHttpStatus(response, 200)
+        self.assertTrue(response.streaming)
+        rows = list(csv.reader(response.getvalue().decode().splitlines()))
+        self.assertEqual(len(rows), 4)
+        self.assertIn('Site 1', rows[1])
+
+    def test_export_template(self):
+        self.add_permissions('dcim.view_site')
+        export_template = ExportTemplate.objects.create(
+            name='Site names',
+            template_code='{{ queryset|length }}\n{% for site in queryset %}{{ site.name }}\n{% endfor %}'
+        )
+        export_template.object_types.set([ObjectType.objects.get_for_model(Site)])
+
+        response = self.client.get(f"{reverse('dcim:site_list')}?export={export_template.name}")
+        self.assertHttpStatus(response, 200)
+        self.assertTrue(response.streaming)
+        lines = response.getvalue().decode().splitlines()
+        self.assertEqual(lines, ['3', 'Site 1', 'Site 2', 'Site 3'])
+
+    def test_export_job(self):
+        self.add_permissions('dcim.view_site')
+        request = NetBoxFakeRequest({
+            'META': {},
+            'COOKIES': {},
+            'POST': QueryDict(),
+            'GET': QueryDict('export=table'),
+            'FILES': {},
+            'user': self.user,
+            'path': reverse('dcim:site_list'),
+            'id': uuid.uuid4(),
+        })
+
+        job = ExportJob.enqueue(immediate=True, user=self.user, view_cls=SiteListView, request=request)
+        self.assertEqual(job.status, JobStatusChoices.STATUS_COMPLETED)
+        self.assertEqual(job.data['filename'], 'netbox_sites.csv')
+        with default_storage.open(job.output_file) as f:
+            rows = list(csv.reader(f.read().decode().splitlines()))
+        self.assertEqual(len(rows), 4)
+
+        # The output file may be downloaded only by the job's user
+        self.add_permissions('core.view_job')
+        url = reverse('core:job_download', kwargs={'pk': job.pk})
+        response = self.client.get(url)
+        self.assertHttpStatus(response, 200)
+        other_user = User.objects.create_user(username='other_user')
+        Job.objects.filter(pk=job.pk).update(user=other_user)
+        response = self.client.get(url)
+        self.assertHttpStatus(response, 403)
+
+        # Deleting the job should delete its output file
+        job.delete()
+        self.assertFalse(default_storage.exists(job.output_file))
+
+
 class MediaViewTestCase(TestCase):
 
     def test_media_login_required(self):
@@ -4,32 +4,35 @@ from copy import deepcopy
 
 from django.contrib import messages
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRel
-from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist, ValidationError
 from django.db import IntegrityError, router, transaction
 from django.db.models import ManyToManyField, ProtectedError, RestrictedError
 from django.db.models.fields.reverse_related import ManyToManyRel
-from django.forms import ModelMultipleChoiceField, MultipleHiddenInput
-from django.http import HttpResponse
+from django.forms import BooleanField, ModelMultipleChoiceField, MultipleHiddenInput
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext as _
-from django_tables2.export import TableExport
 from mptt.models import MPTTModel
 
+from core.deletion import delete_objects
+from core.jobs import BulkDeleteJob, BulkImportJob, ExportJob
 from core.models import ObjectType
 from core.signals import clear_events
 from extras.choices import CustomFieldUIEditableChoices
 from extras.models import CustomField, ExportTemplate
+from utilities.counters import batch_counter_updates
 from utilities.error_handlers import handle_protectederror
 from utilities.exceptions import AbortRequest, AbortTransaction, PermissionsViolation
+from utilities.export import buffer_content, stream_table_csv, stream_yaml
 from utilities.forms import BulkRenameForm, ConfirmationForm, restrict_form_fields
 from utilities.forms.bulk_import import BulkImportForm
+from utilities.forms.fields import CSVObjectResolver
 from utilities.htmx import htmx_partial
 from utilities.permissions import get_permission_for_model
 from utilities.query import reapply_model_ordering
-from utilities.request import safe_for_redirect
+from utilities.request import copy_safe_request, safe_for_redirect
 from utilities.tables import get_table_configs
 from utilities.views import GetReturnURLMixin, get_viewname
 from .base import BaseMultiObjectView
@@ -70,15 +73,14 @@ class ObjectListView(BaseMultiObjectView, ActionsMixin, TableMixin):
 
     def export_yaml(self):
         """
-        Export the queryset of objects as concatenated YAML documents.
+        Export the queryset of objects as concatenated YAML documents. Returns a generator which yields the rendered
+        YAML incrementally.
         """
-        yaml_data = [obj.to_yaml() for obj in self.queryset]
-
-        return '---\n'.join(yaml_data)
+        return buffer_content(stream_yaml(self.queryset))
 
     def export_table(self, table, columns=None, filename=None):
         """
-        Export all table data in CSV format.
+        Export all table data in CSV format. The response is streamed to the client as the table data is rendered.
 
         Args:
             table: The Table instance to export
@@ -92,14 +94,14 @@ class ObjectListView(BaseMultiObjectView, ActionsMixin, TableMixin):
             exclude_columns.update({
                 col for col in all_columns if col not in columns
             })
-        exporter = TableExport(
-            export_format=TableExport.CSV,
-            table=table,
-            exclude_columns=exclude_columns
-        )
-        return exporter.response(
-            filename=filename or f'netbox_{self.queryset.model._meta.verbose_name_plural}.csv'
+        response = StreamingHttpResponse(
+            buffer_content(stream_table_csv(table, exclude_columns=exclude_columns)),
+            content_type='text/csv; charset=utf-8'
         )
+        filename = filename or f'netbox_{self.queryset.model._meta.verbose_name_plural}.csv'
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+
+        return response
 
     def export_template(self, template, request):
         """
@@ -110,7 +112,7 @@ class ObjectListView(BaseMultiObjectView, ActionsMixin, TableMixin):
             request: The current request
         """
         try:
-            return template.render_to_response(queryset=self.queryset)
+            return template.render_to_response(queryset=self.queryset, stream=True)
         except Exception as e:
             messages.error(
                 request,
@@ -127,6 +129,30 @@ class ObjectListView(BaseMultiObjectView, ActionsMixin, TableMixin):
                 return redirect(redirect_url)
             return redirect(get_viewname(self.queryset.model, 'list'))
 
+    def export_as_job(self, request):
+        """
+        Enqueue a background job to render the requested export to a file, and redirect the user to the job.
+
+        Args:
+            request: The current request
+        """
+        model = self.queryset.model
+        request_copy = copy_safe_request(request)
+        request_copy.GET = request.GET.copy()
+        request_copy.GET.pop('background_job')
+        job = ExportJob.enqueue(
+            name=_("Export ({model})").format(model=model._meta.label_lower),
+            user=request.user,
+            view_cls=self.__class__,
+            request=request_copy,
+        )
+        messages.info(request, _("Enqueued background job {id} to export {model}.").format(
+            id=job.pk,
+            model=model._meta.verbose_name_plural
+        ))
+
+        return redirect('core:job', pk=job.pk)
+
     #
     # Request handlers
     #
@@ -145,8 +171,11 @@ class ObjectListView(BaseMultiObjectView, ActionsMixin, TableMixin):
         model = self.queryset.model
         object_type = ObjectType.objects.get_for_model(model)
 
+        saved_filter_errors = []
         if self.filterset:
-            self.queryset = self.filterset(request.GET, self.queryset, request=request).qs
+            filterset = self.filterset(request.GET, self.queryset, request=request)
+            saved_filter_errors = getattr(filterset, 'saved_filter_errors', [])
+            self.queryset = filterset.qs
 
         # Determine the available actions
         actions = self.get_permitted_actions(request.user)
@@ -154,6 +183,10 @@ class ObjectListView(BaseMultiObjectView, ActionsMixin, TableMixin):
 
         if 'export' in request.GET:
 
+            # Offload the export to a background job, if requested
+            if request.GET.get('background_job'):
+                return self.export_as_job(request)
+
             # Export the current table view
             if request.GET['export'] == 'table':
                 table = self.get_table(self.queryset, request, has_bulk_actions)
@@ -167,7 +200,7 @@ class ObjectListView(BaseMultiObjectView, ActionsMixin, TableMixin):
 
             # Check for YAML export support on the model
             elif hasattr(model, 'to_yaml'):
-                response = HttpResponse(self.export_yaml(), content_type='text/yaml')
+                response = StreamingHttpResponse(self.export_yaml(), content_type='text/yaml')
                 filename = 'netbox_{}.yaml'.format(self.queryset.model._meta.verbose_name_plural)
                 response['Content-Disposition'] = 'attachment; filename="{}"'.format(filename)
                 return response
@@ -177,6 +210,12 @@ class ObjectListView(BaseMultiObjectView, ActionsMixin, TableMixin):
                 table = self.get_table(self.queryset, request, has_bulk_actions)
                 return self.export_table(table)
 
+        # Report any saved filters which could not be applied (exports may be rendered for a background job, without
+        # a real request to which messages can be attached)
+        if not htmx_partial(request):
+            for error in saved_filter_errors:
+                messages.warning(request, error)
+
         # Render the objects table
         table = self.get_table(self.queryset, request, has_bulk_actions)
 
@@ -278,7 +317,7 @@ class BulkCreateView(GetReturnURLMixin, BaseMultiObjectView):
             logger.debug("Form validation was successful")
 
             try:
-                with transaction.atomic(using=router.db_for_write(model)):
+                with transaction.atomic(using=router.db_for_write(model)), batch_counter_updates():
                     new_objs = self._create_objects(form, request)
 
                     # Enforce object-level permissions
@@ -351,15 +390,11 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
 
         return {**required_fields, **optional_fields}
 
-    def _save_object(self, import_form, model_form, request):
+    def _save_object(self, model_form, request):
 
         # Save the primary object
         obj = self.save_object(model_form, request)
 
-        # Enforce object-level permissions
-        if not self.queryset.filter(pk=obj.pk).first():
-            raise PermissionsViolation()
-
         # Iterate through the related object forms (if any), validating and saving each instance.
         for field_name, related_object_form in self.related_object_forms.items():
 
@@ -377,14 +412,14 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
                     related_obj_pks.append(related_obj.pk)
                 else:
                     # Replicate errors on the related object form to the import form for display and abort
-                    for subfield_name, errors in f.errors.items():
-                        for err in errors:
+                    errors = []
+                    for subfield_name, subfield_errors in f.errors.items():
+                        for err in subfield_errors:
                             if subfield_name == '__all__':
-                                err_msg = f"{field_name}[{i}]: {err}"
+                                errors.append(f"{field_name}[{i}]: {err}")
                             else:
-                                err_msg = f"{field_name}[{i}] {subfield_name}: {err}"
-                            import_form.add_error(None, err_msg)
-                    raise AbortTransaction()
+                                errors.append(f"{field_name}[{i}] {subfield_name}: {err}")
+                    raise ValidationError(errors)
 
             # Enforce object-level permissions on related objects
             model = related_object_form.Meta.model
@@ -403,10 +438,19 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
         """
         return object_form.save()
 
-    def create_and_update_objects(self, form, request):
-        saved_objects = []
+    def import_records(self, records, request, headers=None, start=1):
+        """
+        Create or update objects from a batch of import records. Related objects referenced by the records are
+        resolved in bulk, and object-level permissions are enforced once for the entire batch. Raises a
+        ValidationError describing the first invalid record encountered.
 
-        records = list(form.cleaned_data['data'])
+        Args:
+            records: A list of dictionaries, each mapping field names to values for a single object
+            request: The current request
+            headers: A dictionary mapping CSV column headers to related object accessors (if any)
+            start: The number of the first record in the batch (for error reporting)
+        """
+        saved_objects = []
 
         # Prefetch objects to be updated, if any
         prefetch_ids = [int(record['id']) for record in records if record.get('id')]
@@ -415,7 +459,17 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
             for obj in self.queryset.model.objects.filter(id__in=prefetch_ids)
         } if prefetch_ids else {}
 
-        for i, record in enumerate(records, start=1):
+        # Determine the default custom field values to apply to newly created objects
+        custom_field_defaults = {
+            f'cf_{cf.name}': cf.default
+            for cf in CustomField.objects.get_cached_for_model(self.queryset.model)
+            if cf.ui_editable == CustomFieldUIEditableChoices.YES
+        }
+
+        # Resolve references to related objects for the entire batch
+        resolver = CSVObjectResolver(records)
+
+        for i, record in enumerate(records, start=start):
             instance = None
             object_id = int(record.pop('id')) if record.get('id') else None
 
@@ -424,8 +478,9 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
                 try:
                     instance = prefetched_objects[object_id]
                 except KeyError:
-                    form.add_error('data', _("Row {i}: Object with ID {id} does not exist").format(i=i, id=object_id))
-                    raise ValidationError('')
+                    raise ValidationError({
+                        'data': _("Row {i}: Object with ID {id} does not exist").format(i=i, id=object_id)
+                    })
 
                 # Take a snapshot for change logging
                 if instance.pk and hasattr(instance, 'snapshot'):
@@ -433,22 +488,16 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
 
             else:
                 # For newly created objects, apply any default custom field values
-                custom_fields = CustomField.objects.filter(
-                    object_types=ContentType.objects.get_for_model(self.queryset.model),
-                    ui_editable=CustomFieldUIEditableChoices.YES
-                )
-                for cf in custom_fields:
-                    field_name = f'cf_{cf.name}'
-                    if field_name not in record:
-                        record[field_name] = cf.default
+                for field_name, default in custom_field_defaults.items():
+                    record.setdefault(field_name, default)
 
             # Instantiate the model form for the object
             model_form_kwargs = {
                 'data': record,
                 'instance': instance,
             }
-            if hasattr(form, '_csv_headers'):
-                model_form_kwargs['headers'] = form._csv_headers  # Add CSV headers
+            if headers is not None:
+                model_form_kwargs['headers'] = headers  # Add CSV headers
             model_form = self.model_form(**model_form_kwargs)
 
             # When updating, omit all form fields other than those specified in the record. (No
@@ -459,23 +508,39 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
                     del model_form.fields[field_name]
 
             restrict_form_fields(model_form, request.user)
+            resolver.bind(model_form)
 
             if model_form.is_valid():
-                obj = self._save_object(form, model_form, request)
+                obj = self._save_object(model_form, request)
                 saved_objects.append(obj)
             else:
                 # Replicate model form errors for display
-                for field, errors in model_form.errors.items():
-                    for err in errors:
+                errors = []
+                for field, field_errors in model_form.errors.items():
+                    for err in field_errors:
                         if field == '__all__':
-                            form.add_error(None, f'Record {i}: {err}')
+                            errors.append(f'Record {i}: {err}')
                         else:
-                            form.add_error(None, f'Record {i} {field}: {err}')
+                            errors.append(f'Record {i} {field}: {err}')
+                raise ValidationError(errors)
 
-                raise ValidationError("")
+        # Enforce object-level permissions
+        if self.queryset.filter(pk__in=[obj.pk for obj in saved_objects]).count() != len(saved_objects):
+            raise PermissionsViolation
 
         return saved_objects
 
+    def create_and_update_objects(self, form, request):
+        records = list(form.cleaned_data['data'])
+        headers = getattr(form, '_csv_headers', None)
+
+        try:
+            return self.import_records(records, request, headers=headers)
+        except ValidationError as e:
+            # Replicate any errors on the import form for display
+            form.add_error(None, e)
+            raise ValidationError("")
+
     #
     # Request handlers
     #
@@ -499,15 +564,30 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
         if form.is_valid():
             logger.debug("Import form validation was successful")
 
+            # Offload the import to a background job, if requested
+            if form.cleaned_data.get('background_job'):
+                # The records have already been parsed, so omit any uploaded file (which may not be serializable)
+                request_copy = copy_safe_request(request)
+                request_copy.FILES = {}
+                job = BulkImportJob.enqueue(
+                    name=_("Bulk import ({model})").format(model=model._meta.label_lower),
+                    user=request.user,
+                    view_cls=self.__class__,
+                    records=list(form.cleaned_data['data']),
+                    headers=getattr(form, '_csv_headers', None),
+                    request=request_copy,
+                )
+                messages.info(request, _("Enqueued background job {id} to import {count} records.").format(
+                    id=job.pk,
+                    count=len(form.cleaned_data['data'])
+                ))
+                return redirect('core:job', pk=job.pk)
+
             try:
                 # Iterate through data and bind each record to a new model form instance.
-                with transaction.atomic(using=router.db_for_write(model)):
+                with transaction.atomic(using=router.db_for_write(model)), batch_counter_updates():
                     new_objs = self.create_and_update_objects(form, request)
 
-                    # Enforce object-level permissions
-                    if self.queryset.filter(pk__in=[obj.pk for obj in new_objs]).count() != len(new_objs):
-                        raise PermissionsViolation
-
                 if new_objs:
                     msg = f"Imported {len(new_objs)} {model._meta.verbose_name_plural}"
                     logger.info(msg)
@@ -681,7 +761,7 @@ class BulkEditView(GetReturnURLMixin, BaseMultiObjectView):
             if form.is_valid():
                 logger.debug("Form validation was successful")
                 try:
-                    with transaction.atomic(using=router.db_for_write(model)):
+                    with transaction.atomic(using=router.db_for_write(model)), batch_counter_updates():
                         updated_objects = self._update_objects(form, request)
 
                         # Enforce object-level permissions
@@ -841,6 +921,11 @@ class BulkDeleteView(GetReturnURLMixin, BaseMultiObjectView):
         """
         class BulkDeleteForm(ConfirmationForm):
             pk = ModelMultipleChoiceField(queryset=self.queryset, widget=MultipleHiddenInput)
+            background_job = BooleanField(
+                label=_('Background job'),
+                help_text=_("Enqueue a background job to complete the deletion. Recommended for large data sets."),
+                required=False
+            )
 
         return BulkDeleteForm
 
@@ -871,16 +956,28 @@ class BulkDeleteView(GetReturnURLMixin, BaseMultiObjectView):
             if form.is_valid():
                 logger.debug("Form validation was successful")
 
+                # Offload the deletion to a background job, if requested
+                if form.cleaned_data.get('background_job'):
+                    pk_list = list(pk_list)
+                    job = BulkDeleteJob.enqueue(
+                        name=_("Bulk delete ({model})").format(model=model._meta.label_lower),
+                        user=request.user,
+                        view_cls=self.__class__,
+                        pk_list=pk_list,
+                        request=copy_safe_request(request),
+                    )
+                    messages.info(request, _("Enqueued background job {id} to delete {count} {object_type}.").format(
+                        id=job.pk,
+                        count=len(pk_list),
+                        object_type=model._meta.verbose_name_plural
+                    ))
+                    return redirect('core:job', pk=job.pk)
+
                 # Delete objects
                 queryset = self.queryset.filter(pk__in=pk_list)
                 deleted_count = queryset.count()
                 try:
-                    with transaction.atomic(using=router.db_for_write(model)):
-                        for obj in queryset:
-                            # Take a snapshot of change-logged models
-                            if hasattr(obj, 'snapshot'):
-                                obj.snapshot()
-                            obj.delete()
+                    delete_objects(queryset)
 
                 except (ProtectedError, RestrictedError) as e:
                     logger.info(f"Caught {type(e)} while attempting to delete objects")
@@ -980,7 +1077,7 @@ class BulkComponentCreateView(GetReturnURLMixin, BaseMultiObjectView):
                 }
 
                 try:
-                    with transaction.atomic(using=router.db_for_write(self.queryset.model)):
+                    with transaction.atomic(using=router.db_for_write(self.queryset.model)), batch_counter_updates():
 
                         for obj in data['pk']:
 
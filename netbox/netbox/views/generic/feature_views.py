@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.contenttypes.models import ContentType
 from django.contrib import messages
@@ -64,6 +65,11 @@ class ObjectChangeLogView(ConditionalLoginRequiredMixin, View):
             Q(changed_object_type=content_type, changed_object_id=obj.pk) |
             Q(related_object_type=content_type, related_object_id=obj.pk)
         )
+
+        # If the changelog is partitioned by time, limit the query to partitions covering the object's lifetime
+        if settings.CHANGELOG_PARTITIONING and getattr(obj, 'created', None):
+            objectchanges = objectchanges.filter(time__gte=obj.created)
+
         objectchanges_table = ObjectChangeTable(
             data=objectchanges,
             orderable=False,
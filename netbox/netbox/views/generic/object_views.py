@@ -13,7 +13,9 @@ from django.utils.html import escape
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext as _
 
+from core.deletion import delete_objects
 from core.signals import clear_events
+from utilities.counters import batch_counter_updates
 from utilities.error_handlers import handle_protectederror
 from utilities.exceptions import AbortRequest, PermissionsViolation
 from utilities.forms import ConfirmationForm, restrict_form_fields
@@ -464,7 +466,7 @@ class ObjectDeleteView(GetReturnURLMixin, BaseObjectView):
             logger.debug("Form validation was successful")
 
             try:
-                obj.delete()
+                delete_objects([obj])
 
             except (ProtectedError, RestrictedError) as e:
                 logger.info(f"Caught {type(e)} while attempting to delete objects")
@@ -570,7 +572,7 @@ class ComponentCreateView(GetReturnURLMixin, BaseObjectView):
 
             if not form.errors and not component_form.errors:
                 try:
-                    with transaction.atomic(using=router.db_for_write(self.queryset.model)):
+                    with transaction.atomic(using=router.db_for_write(self.queryset.model)), batch_counter_updates():
                         # Create the new components
                         new_objs = []
                         for component_form in new_components:
@@ -1,8 +1,10 @@
+from functools import lru_cache
+
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.core.exceptions import (
     FieldDoesNotExist, FieldError, MultipleObjectsReturned, ObjectDoesNotExist, ValidationError,
 )
-from django.db.models.fields.related import ManyToOneRel, RelatedField
+from django.db.models.fields.related import ForeignKey, ManyToOneRel, RelatedField
 from django.urls import reverse
 from django.utils.module_loading import import_string
 from django.utils.translation import gettext_lazy as _
@@ -16,15 +18,18 @@ from .query import count_related, dict_to_filter_params
 from .string import title
 
 __all__ = (
-    'get_annotations_for_serializer',
+    'SerializationPlan',
     'get_graphql_type_for_model',
-    'get_prefetches_for_serializer',
     'get_related_object_by_attrs',
+    'get_serialization_plan',
     'get_serializer_for_model',
     'get_view_name',
     'is_api_request',
 )
 
+# The maximum number of serialization plans to cache (the set of requested fields is client-controlled)
+SERIALIZATION_PLAN_CACHE_SIZE = 1024
+
 
 def get_serializer_for_model(model, prefix=''):
     """
@@ -76,63 +81,111 @@ def get_view_name(view):
     return drf_get_view_name(view)
 
 
-def get_prefetches_for_serializer(serializer_class, fields_to_include=None):
+class SerializationPlan:
     """
-    Compile and return a list of fields which should be prefetched on the queryset for a serializer.
+    The QuerySet optimizations required to serialize a list of objects with a particular serializer and set of
+    fields, including those of any nested serializers.
+
+    Attributes:
+        select_related: Chains of forward one-to-one & many-to-one relations, which can be retrieved by JOIN
+        prefetch_related: Many-to-many, reverse, and generic relations (or relations thereof), which must be
+            retrieved by separate queries
+        annotations: A tuple of (field name, related model, related field name) for each RelatedObjectCountField
     """
-    model = serializer_class.Meta.model
+    def __init__(self, select_related=(), prefetch_related=(), annotations=()):
+        self.select_related = tuple(select_related)
+        self.prefetch_related = tuple(prefetch_related)
+        self.annotations = tuple(annotations)
+
+    def __repr__(self):
+        return (
+            f'<{self.__class__.__name__} select_related={self.select_related} '
+            f'prefetch_related={self.prefetch_related} annotations={[a[0] for a in self.annotations]}>'
+        )
 
-    # If fields are not specified, default to all
-    if not fields_to_include:
-        fields_to_include = serializer_class.Meta.fields
+    def apply(self, queryset):
+        """
+        Return the given QuerySet with the plan's optimizations applied.
+        """
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        if self.annotations:
+            queryset = queryset.annotate(**{
+                field_name: count_related(model, related_field_name)
+                for field_name, model, related_field_name in self.annotations
+            })
+        return queryset
+
+
+def _resolve_relations(serializer_class, fields_to_include, prefix='', can_join=True):
+    """
+    Walk the fields of a serializer (recursing into nested serializers) and return a two-tuple of lookups to be
+    passed to select_related() and prefetch_related(), respectively. Relations nested beneath a relation which must
+    be prefetched are themselves prefetched.
+    """
+    model = serializer_class.Meta.model
+    select_related = []
+    prefetch_related = []
 
-    prefetch_fields = []
-    for field_name in fields_to_include:
+    for field_name in fields_to_include or serializer_class.Meta.fields:
         serializer_field = serializer_class._declared_fields.get(field_name)
+        model_field_name = serializer_field.source if serializer_field and serializer_field.source else field_name
 
-        # Determine the name of the model field referenced by the serializer field
-        model_field_name = field_name
-        if serializer_field and serializer_field.source:
-            model_field_name = serializer_field.source
-
-        # If the serializer field does not map to a discrete model field, skip it.
+        # If the serializer field does not map to a discrete related model field, skip it.
         try:
             field = model._meta.get_field(model_field_name)
-            if isinstance(field, (RelatedField, ManyToOneRel, GenericForeignKey)):
-                prefetch_fields.append(field.name)
         except FieldDoesNotExist:
             continue
+        if not isinstance(field, (RelatedField, ManyToOneRel, GenericForeignKey)):
+            continue
 
-        # If this field is represented by a nested serializer, recurse to resolve prefetches
-        # for the related object.
-        if serializer_field:
-            if issubclass(type(serializer_field), Serializer):
-                # Determine which fields to prefetch for the nested object
-                subfields = serializer_field.Meta.brief_fields if serializer_field.nested else None
-                for subfield in get_prefetches_for_serializer(type(serializer_field), subfields):
-                    prefetch_fields.append(f'{field_name}__{subfield}')
-
-    return prefetch_fields
-
+        # Forward one-to-one and many-to-one relations can be retrieved by JOIN, provided that any parent relation
+        # has also been joined
+        lookup = f'{prefix}{field.name}'
+        joined = can_join and isinstance(field, ForeignKey)
+        if joined:
+            select_related.append(lookup)
+        else:
+            prefetch_related.append(lookup)
+
+        # If this field is represented by a nested serializer, recurse to resolve its relations
+        if serializer_field and isinstance(serializer_field, Serializer):
+            subfields = serializer_field.Meta.brief_fields if getattr(serializer_field, 'nested', False) else None
+            nested_select, nested_prefetch = _resolve_relations(
+                type(serializer_field), subfields, prefix=f'{lookup}__', can_join=joined
+            )
+            select_related.extend(nested_select)
+            prefetch_related.extend(nested_prefetch)
 
-def get_annotations_for_serializer(serializer_class, fields_to_include=None):
-    """
-    Return a mapping of field names to annotations to be applied to the queryset for a serializer.
-    """
-    annotations = {}
+    return select_related, prefetch_related
 
-    # If specific fields are not specified, default to all
-    if not fields_to_include:
-        fields_to_include = serializer_class.Meta.fields
 
+@lru_cache(maxsize=SERIALIZATION_PLAN_CACHE_SIZE)
+def _get_serialization_plan(serializer_class, fields_to_include):
+    select_related, prefetch_related = _resolve_relations(serializer_class, fields_to_include)
+    annotations = []
     model = serializer_class.Meta.model
-
     for field_name, field in serializer_class._declared_fields.items():
-        if field_name in fields_to_include and type(field) is RelatedObjectCountField:
+        if type(field) is RelatedObjectCountField and (not fields_to_include or field_name in fields_to_include):
             related_field = getattr(model, field.relation).field
-            annotations[field_name] = count_related(related_field.model, related_field.name)
+            annotations.append((field_name, related_field.model, related_field.name))
 
-    return annotations
+    return SerializationPlan(select_related, prefetch_related, annotations)
+
+
+def get_serialization_plan(serializer_class, fields_to_include=None, brief=False):
+    """
+    Return the SerializationPlan for a serializer and (optional) set of fields to be included. If brief mode is
+    enabled and no fields have been specified, the serializer's brief fields are included. Plans are computed once per
+    combination of serializer and fields, and cached for the life of the process.
+    """
+    if brief and not fields_to_include:
+        fields_to_include = getattr(serializer_class.Meta, 'brief_fields', None)
+    if fields_to_include:
+        fields_to_include = tuple(fields_to_include)
+    return _get_serialization_plan(serializer_class, fields_to_include or None)
 
 
 def get_related_object_by_attrs(queryset, attrs):
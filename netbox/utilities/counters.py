@@ -1,10 +1,18 @@
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 from django.apps import apps
-from django.db.models import F, Count, OuterRef, Subquery
+from django.db.models import Case, Count, F, OuterRef, Subquery, Value, When
 from django.db.models.signals import post_delete, post_save, pre_delete
 
+from netbox.context import pending_deletions
 from netbox.registry import registry
 from .fields import CounterCacheField
 
+# Counter updates pending within a batch, mapping (model, counter_name) to a Counter of changes by PK
+_pending_updates = ContextVar('pending_counter_updates', default=None)
+
 
 def get_counters_for_model(model):
     """
@@ -16,13 +24,60 @@ def get_counters_for_model(model):
 def update_counter(model, pk, counter_name, value):
     """
     Increment or decrement a counter field on an object identified by its model and primary key (PK). Positive values
-    will increment; negative values will decrement.
+    will increment; negative values will decrement. If called within batch_counter_updates(), the change is deferred
+    until the batch is complete.
     """
+    if (pending_updates := _pending_updates.get()) is not None:
+        pending_updates[(model, counter_name)][pk] += value
+        return
     model.objects.filter(pk=pk).update(
         **{counter_name: F(counter_name) + value}
     )
 
 
+def apply_counter_updates(pending_updates):
+    """
+    Apply a set of accumulated counter changes, updating all counters for each model in a single query.
+    """
+    updates_by_model = defaultdict(dict)
+    for (model, counter_name), changes in pending_updates.items():
+        if changes := {pk: value for pk, value in changes.items() if value}:
+            updates_by_model[model][counter_name] = changes
+
+    for model, counters in updates_by_model.items():
+        pks = set().union(*counters.values())
+        model.objects.filter(pk__in=pks).update(**{
+            counter_name: F(counter_name) + Case(
+                *(When(pk=pk, then=Value(value)) for pk, value in changes.items()),
+                default=Value(0)
+            )
+            for counter_name, changes in counters.items()
+        })
+
+
+@contextmanager
+def batch_counter_updates():
+    """
+    Accumulate all counter changes made within the context, and apply them upon exit with a single UPDATE query per
+    model. (For example, creating 48 interfaces on a device results in one update to the device rather than 48.)
+    Nested batches are merged into the outermost batch. Pending changes are discarded if an exception is raised.
+
+    This should be used within the transaction in which the counted objects are modified, as counter values read
+    within the batch will not reflect pending changes.
+    """
+    if _pending_updates.get() is not None:
+        yield
+        return
+
+    token = _pending_updates.set(defaultdict(Counter))
+    try:
+        yield
+        pending_updates = _pending_updates.get()
+    finally:
+        _pending_updates.reset(token)
+    apply_counter_updates(pending_updates)
+
+
 def update_counts(model, field_name, related_query):
     """
     Perform a bulk update for the given model and counter field. For example,
@@ -41,6 +96,34 @@ def update_counts(model, field_name, related_query):
     })
 
 
+def update_model_counts(model, counters, **lookups):
+    """
+    Recalculate multiple counter fields for a model with a single bulk update. `counters` maps the name of each counter
+    field to the related query name of the objects it counts. For example,
+
+        update_model_counts(Device, {'_interface_count': 'interfaces', '_console_port_count': 'consoleports'})
+
+    Additional lookups may be specified to limit the update to a subset of objects (e.g. `pk__lte=1000`). Returns the
+    number of objects updated.
+    """
+    return model.objects.filter(**lookups).update(**{
+        field_name: Subquery(
+            model.objects.filter(pk=OuterRef('pk')).annotate(_count=Count(related_query)).values('_count')
+        )
+        for field_name, related_query in counters.items()
+    })
+
+
+def _is_deleted_with_parent(parent_model, parent_pk, origin):
+    """
+    Return True if the parent object is the origin of the deletion (e.g. a Device whose deletion has cascaded to its
+    interfaces) or is otherwise being deleted along with it, in which case its counters need not be updated.
+    """
+    if isinstance(origin, parent_model) and origin.pk == parent_pk:
+        return True
+    return (parent_model._meta.label_lower, parent_pk) in (pending_deletions.get() or ())
+
+
 #
 # Signal handlers
 #
@@ -63,6 +146,17 @@ def post_save_receiver(sender, instance, created, **kwargs):
 
 
 def pre_delete_receiver(sender, instance, origin, **kwargs):
+    # Skip the check if the object is known to exist (having just been collected by delete_objects()), or if the
+    # parents of all counters are being deleted as well
+    if (instance._meta.label_lower, instance.pk) in (pending_deletions.get() or ()):
+        return
+    if all(
+        _is_deleted_with_parent(
+            sender._meta.get_field(field_name).related_model, getattr(instance, field_name, None), origin
+        )
+        for field_name, counter_name in get_counters_for_model(sender)
+    ):
+        return
     model = instance._meta.model
     if not model.objects.filter(pk=instance.pk).exists():
         instance._previously_removed = True
@@ -76,8 +170,10 @@ def post_delete_receiver(sender, instance, origin, **kwargs):
         parent_model = sender._meta.get_field(field_name).related_model
         parent_pk = getattr(instance, field_name, None)
 
-        # Decrement the parent's counter by one
-        if parent_pk is not None and not hasattr(instance, "_previously_removed"):
+        # Decrement the parent's counter by one (unless the parent itself is being deleted)
+        if parent_pk is None or _is_deleted_with_parent(parent_model, parent_pk, origin):
+            continue
+        if not hasattr(instance, "_previously_removed"):
             update_counter(parent_model, parent_pk, counter_name, -1)
 
 
@@ -0,0 +1,497 @@
+import time
+from collections import Counter
+
+from django.core.management import call_command
+from django.db import transaction
+from django.db.models import CharField, F, Func, Value
+from django.utils.text import slugify
+from netaddr import IPNetwork
+
+from circuits.models import Circuit, CircuitTermination, CircuitType, Provider
+from dcim.choices import ConsolePortTypeChoices, InterfaceTypeChoices, PortTypeChoices, PowerPortTypeChoices
+from dcim.models import (
+    Cable, CableTermination, ConsolePort, ConsolePortTemplate, Device, DeviceRole, DeviceType, FrontPort,
+    FrontPortTemplate, Interface, InterfaceTemplate, Manufacturer, PowerPort, PowerPortTemplate, Rack, RearPort,
+    RearPortTemplate, Region, Site,
+)
+from extras.models import CustomField
+from ipam.choices import PrefixStatusChoices
+from ipam.models import IPAddress, Prefix, VLAN
+from tenancy.models import Tenant
+from virtualization.models import Cluster, ClusterType, VirtualDisk, VirtualMachine, VMInterface
+
+__all__ = (
+    'DatasetGenerator',
+)
+
+# The IP space from which all generated prefixes are allocated. Each site is allocated a /20: its lower half is divided
+# into a /26 per rack, and its upper half is allocated to virtual machines.
+SUPERNET = IPNetwork('10.0.0.0/8')
+SITE_PREFIX_LENGTH = 20
+RACK_PREFIX_LENGTH = 26
+
+# The device types from which all devices are instantiated, along with their component templates
+SERVER_INTERFACES = 4
+SWITCH_ACCESS_PORTS = 24
+SWITCH_UPLINK_PORTS = 2
+PATCH_PANEL_PORTS = 24
+
+# Component models which are instantiated from templates without reference to another component
+TEMPLATED_COMPONENTS = (
+    (ConsolePortTemplate, ConsolePort),
+    (PowerPortTemplate, PowerPort),
+    (InterfaceTemplate, Interface),
+    (RearPortTemplate, RearPort),
+)
+
+# Models for which the search cache is rebuilt upon completion
+INDEXED_MODELS = (
+    'circuits.circuit',
+    'circuits.circuittermination',
+    'dcim.cable',
+    'dcim.consoleport',
+    'dcim.device',
+    'dcim.frontport',
+    'dcim.interface',
+    'dcim.powerport',
+    'dcim.rack',
+    'dcim.rearport',
+    'dcim.site',
+    'ipam.ipaddress',
+    'ipam.prefix',
+    'ipam.vlan',
+    'virtualization.cluster',
+    'virtualization.virtualdisk',
+    'virtualization.virtualmachine',
+    'virtualization.vminterface',
+)
+
+
+class DatasetGenerator:
+    """
+    Generate a synthetic dataset of arbitrary size, comprising a hierarchy of regions, sites, and racks. Each rack
+    holds an access switch, a patch panel, and a number of servers (all with components instantiated from their device
+    types), which are cabled to one another. The access switch in each rack is patched through to a core switch at the
+    site, which in turn connects to the site's circuits. Each site is also assigned VLANs, a hierarchy of prefixes and
+    IP addresses, and a cluster of virtual machines.
+
+    Objects are written using bulk_create(), which bypasses model save() methods and signals. Cached counters, cable
+    paths, the prefix hierarchy, and the search cache are rebuilt once all objects have been created. Note that no
+    changelog records are created for generated objects.
+
+    Args:
+        regions: The number of regions to create
+        sites_per_region: The number of sites to create within each region
+        racks_per_site: The number of racks to create at each site
+        servers_per_rack: The number of servers to create within each rack
+        circuits_per_site: The number of circuits to terminate at each site
+        vms_per_site: The number of virtual machines to create at each site
+        name_prefix: A string with which the names of all generated objects are prefixed
+        batch_size: The maximum number of objects created per query
+        stdout: The stream to which progress is written (if any)
+    """
+    def __init__(self, regions=1, sites_per_region=1, racks_per_site=1, servers_per_rack=1, circuits_per_site=1,
+                 vms_per_site=1, name_prefix='synthetic', batch_size=1000, stdout=None):
+        max_sites = 2 ** (SITE_PREFIX_LENGTH - SUPERNET.prefixlen)
+        max_vms = 2 ** (32 - SITE_PREFIX_LENGTH - 1) - 2
+        if regions * sites_per_region > max_sites:
+            raise ValueError(f"Cannot allocate prefixes for more than {max_sites} sites.")
+        if racks_per_site > PATCH_PANEL_PORTS:
+            raise ValueError(f"Cannot connect more than {PATCH_PANEL_PORTS} racks per site.")
+        if servers_per_rack > SWITCH_ACCESS_PORTS:
+            raise ValueError(f"Cannot connect more than {SWITCH_ACCESS_PORTS} servers per rack.")
+        if circuits_per_site > SWITCH_UPLINK_PORTS:
+            raise ValueError(f"Cannot connect more than {SWITCH_UPLINK_PORTS} circuits per site.")
+        if vms_per_site > max_vms:
+            raise ValueError(f"Cannot allocate IP addresses for more than {max_vms} virtual machines per site.")
+
+        self.regions = regions
+        self.sites_per_region = sites_per_region
+        self.racks_per_site = racks_per_site
+        self.servers_per_rack = servers_per_rack
+        self.circuits_per_site = circuits_per_site
+        self.vms_per_site = vms_per_site
+        self.name_prefix = name_prefix
+        self.batch_size = batch_size
+        self.stdout = stdout
+
+        # The number of objects created, by model
+        self.counts = Counter()
+
+    def log(self, message):
+        if self.stdout is not None:
+            self.stdout.write(message)
+
+    def create(self, model, objects):
+        """
+        Create the given objects in bulk, applying the default values of any custom fields.
+        """
+        if not objects:
+            return objects
+        if cf_defaults := CustomField.objects.get_defaults_for_model(model):
+            for obj in objects:
+                obj.custom_field_data = dict(cf_defaults)
+        model.objects.bulk_create(objects, batch_size=self.batch_size)
+        self.counts[model._meta.label] += len(objects)
+        return objects
+
+    def update(self, model, objects, fields):
+        model.objects.bulk_update(objects, fields, batch_size=self.batch_size)
+
+    def generate(self):
+        """
+        Generate the dataset and rebuild all derived data. Returns a Counter of the objects created by model.
+        """
+        start_time = time.monotonic()
+        site_networks = iter(self.get_site_networks(self.regions * self.sites_per_region))
+        self.create_shared_objects()
+
+        site_number = 0
+        for region_number in range(1, self.regions + 1):
+            # Regions are few in number, and are saved individually to maintain their tree structure
+            region = Region(name=f'{self.name_prefix}-region-{region_number}')
+            region.slug = slugify(region.name)
+            region.save()
+            self.counts[Region._meta.label] += 1
+
+            for _ in range(self.sites_per_region):
+                site_number += 1
+                with transaction.atomic():
+                    self.create_site(region, site_number, next(site_networks))
+            self.log(f"Created region {region} ({site_number} sites, {sum(self.counts.values())} objects)")
+
+        self.log(f"Created {sum(self.counts.values())} objects in {time.monotonic() - start_time:.1f}s")
+        self.rebuild()
+        return self.counts
+
+    def get_site_networks(self, count):
+        """
+        Return a list of `count` site networks within SUPERNET which do not contain any existing prefix of at least the
+        site prefix length or any IP address in the global table (e.g. those of a previously generated dataset). Raises
+        ValueError if insufficient space remains.
+        """
+        used_networks = set()
+
+        # Determine the site network containing each prefix & IP address within the database. Prefixes shorter than a
+        # site network (e.g. a container for SUPERNET itself) are disregarded, as site networks may nest within them.
+        prefixes = Prefix.objects.filter(vrf__isnull=True, prefix__net_contained=SUPERNET)
+        for queryset, field_name in (
+            (prefixes.filter(prefix__net_mask_length__gte=SITE_PREFIX_LENGTH), 'prefix'),
+            (IPAddress.objects.filter(vrf__isnull=True, address__net_host_contained=SUPERNET), 'address'),
+        ):
+            site_network = Func(
+                Func(F(field_name), Value(SITE_PREFIX_LENGTH), function='SET_MASKLEN'),
+                function='NETWORK',
+                output_field=CharField()
+            )
+            networks = queryset.annotate(site_network=site_network).values_list('site_network', flat=True).distinct()
+            used_networks.update(IPNetwork(network) for network in networks)
+
+        site_networks = []
+        for network in SUPERNET.subnet(SITE_PREFIX_LENGTH):
+            if network not in used_networks:
+                site_networks.append(network)
+                if len(site_networks) == count:
+                    return site_networks
+        raise ValueError(f"Insufficient free space remains within {SUPERNET} to allocate prefixes for {count} sites.")
+
+    def create_shared_objects(self):
+        """
+        Create (or retrieve) the objects shared by all sites: device types and their component templates, roles,
+        tenant, circuit provider & type, and cluster type.
+        """
+        name = self.name_prefix
+        self.manufacturer, _ = Manufacturer.objects.get_or_create(slug=slugify(name), defaults={'name': name})
+        self.tenant, _ = Tenant.objects.get_or_create(slug=slugify(name), defaults={'name': name})
+        self.provider, _ = Provider.objects.get_or_create(slug=slugify(name), defaults={'name': name})
+        self.circuit_type, _ = CircuitType.objects.get_or_create(slug=slugify(name), defaults={'name': name})
+        self.cluster_type, _ = ClusterType.objects.get_or_create(slug=slugify(name), defaults={'name': name})
+        self.roles = {
+            role: DeviceRole.objects.get_or_create(
+                slug=slugify(f'{name}-{role}'),
+                defaults={'name': f'{name}-{role}', 'vm_role': role == 'server'}
+            )[0]
+            for role in ('server', 'switch', 'patch-panel')
+        }
+        self.server_type = self.get_device_type('server', {
+            ConsolePortTemplate: [{'name': 'Console', 'type': ConsolePortTypeChoices.TYPE_RJ45}],
+            PowerPortTemplate: [
+                {'name': f'PSU{i}', 'type': PowerPortTypeChoices.TYPE_IEC_C14} for i in range(1, 3)
+            ],
+            InterfaceTemplate: [
+                {'name': f'eth{i}', 'type': InterfaceTypeChoices.TYPE_1GE_FIXED} for i in range(SERVER_INTERFACES)
+            ],
+        })
+        self.switch_type = self.get_device_type('switch', {
+            ConsolePortTemplate: [{'name': 'Console', 'type': ConsolePortTypeChoices.TYPE_RJ45}],
+            PowerPortTemplate: [
+                {'name': f'PSU{i}', 'type': PowerPortTypeChoices.TYPE_IEC_C14} for i in range(1, 3)
+            ],
+            InterfaceTemplate: [
+                *({'name': f'ge-0/0/{i}', 'type': InterfaceTypeChoices.TYPE_1GE_FIXED}
+                  for i in range(SWITCH_ACCESS_PORTS)),
+                *({'name': f'xe-0/1/{i}', 'type': InterfaceTypeChoices.TYPE_10GE_SFP_PLUS}
+                  for i in range(SWITCH_UPLINK_PORTS)),
+            ],
+        })
+        self.patch_panel_type = self.get_device_type('patch-panel', {
+            RearPortTemplate: [
+                {'name': f'Rear {i}', 'type': PortTypeChoices.TYPE_LC, 'positions': 1}
+                for i in range(1, PATCH_PANEL_PORTS + 1)
+            ],
+            FrontPortTemplate: [
+                {'name': f'Front {i}', 'type': PortTypeChoices.TYPE_LC, 'rear_port': f'Rear {i}'}
+                for i in range(1, PATCH_PANEL_PORTS + 1)
+            ],
+        })
+        Prefix.objects.get_or_create(
+            prefix=SUPERNET,
+            vrf=None,
+            defaults={'status': PrefixStatusChoices.STATUS_CONTAINER}
+        )
+
+        # Cache the component templates of each device type
+        self.templates = {}
+        for device_type in (self.server_type, self.switch_type, self.patch_panel_type):
+            self.templates[device_type.pk] = {
+                template_model: list(template_model.objects.filter(device_type=device_type))
+                for template_model, _ in TEMPLATED_COMPONENTS
+            }
+            self.templates[device_type.pk][FrontPortTemplate] = list(
+                FrontPortTemplate.objects.filter(device_type=device_type).select_related('rear_port')
+            )
+
+    def get_device_type(self, name, templates):
+        """
+        Create (or retrieve) a device type along with the given component templates.
+        """
+        model = f'{self.name_prefix}-{name}'
+        device_type, created = DeviceType.objects.get_or_create(
+            manufacturer=self.manufacturer,
+            slug=slugify(model),
+            defaults={'model': model}
+        )
+        if created:
+            rear_ports = {}
+            for template_model, attrs_list in templates.items():
+                objects = []
+                for attrs in attrs_list:
+                    if 'rear_port' in attrs:
+                        attrs = {**attrs, 'rear_port': rear_ports[attrs['rear_port']]}
+                    objects.append(template_model(device_type=device_type, **attrs))
+                self.create(template_model, objects)
+                if template_model is RearPortTemplate:
+                    rear_ports = {obj.name: obj for obj in objects}
+        return device_type
+
+    def create_components(self, devices):
+        """
+        Instantiate all components for the given devices from their device types' component templates.
+        """
+        components = {}
+        for template_model, component_model in TEMPLATED_COMPONENTS:
+            components[component_model] = self.create(component_model, [
+                template.instantiate(device=device)
+                for device in devices
+                for template in self.templates[device.device_type_id][template_model]
+            ])
+
+        # Front ports are mapped to their rear ports by name
+        rear_ports = {(port.device_id, port.name): port for port in components[RearPort]}
+        components[FrontPort] = self.create(FrontPort, [
+            FrontPort(
+                device=device,
+                name=template.name,
+                label=template.label,
+                type=template.type,
+                color=template.color,
+                rear_port=rear_ports[(device.pk, template.rear_port.name)],
+                rear_port_position=template.rear_port_position
+            )
+            for device in devices
+            for template in self.templates[device.device_type_id][FrontPortTemplate]
+        ])
+
+        # Index all components by device and name
+        return {
+            (component.device_id, component.name): component
+            for objects in components.values()
+            for component in objects
+        }
+
+    def create_cables(self, connections):
+        """
+        Create a cable between each pair of termination objects, setting the cable on each termination.
+        """
+        cables = self.create(Cable, [Cable(tenant=self.tenant) for _ in connections])
+        cable_terminations = []
+        terminations = {}
+        for cable, (a_termination, b_termination) in zip(cables, connections):
+            for cable_end, termination in (('A', a_termination), ('B', b_termination)):
+                cable_termination = CableTermination(cable=cable, cable_end=cable_end, termination=termination)
+                cable_termination.cache_related_objects()
+                cable_terminations.append(cable_termination)
+                termination.cable = cable
+                termination.cable_end = cable_end
+                terminations.setdefault(type(termination), []).append(termination)
+        self.create(CableTermination, cable_terminations)
+        for model, objects in terminations.items():
+            self.update(model, objects, ['cable', 'cable_end'])
+
+    def create_site(self, region, site_number, network):
+        """
+        Create a site within the given region, along with all of its racks, devices, cables, circuits, IPAM
+        objects, and virtual machines.
+        """
+        name = f'{self.name_prefix}-site-{site_number}'
+        site = self.create(Site, [Site(name=name, slug=slugify(name), region=region, tenant=self.tenant)])[0]
+
+        # Prefixes & VLANs
+        rack_network, vm_network = network.subnet(network.prefixlen + 1)
+        rack_networks = list(rack_network.subnet(RACK_PREFIX_LENGTH, count=self.racks_per_site))
+        vlans = self.create(VLAN, [
+            VLAN(vid=100 + i, name=f'{name}-vlan-{100 + i}', site=site, tenant=self.tenant)
+            for i in range(1, self.racks_per_site + 1)
+        ])
+        prefixes = [
+            Prefix(prefix=network, scope=site, tenant=self.tenant, status=PrefixStatusChoices.STATUS_CONTAINER),
+            Prefix(prefix=vm_network, scope=site, tenant=self.tenant),
+            *(
+                Prefix(prefix=rack_network, scope=site, vlan=vlan, tenant=self.tenant)
+                for rack_network, vlan in zip(rack_networks, vlans)
+            ),
+        ]
+        for prefix in prefixes:
+            prefix.cache_related_objects()
+        self.create(Prefix, prefixes)
+
+        # Racks & devices
+        racks = self.create(Rack, [
+            Rack(site=site, name=f'{name}-rack-{i}', tenant=self.tenant)
+            for i in range(1, self.racks_per_site + 1)
+        ])
+        devices = []
+        rack_devices = []
+        for rack in racks:
+            switch = Device(
+                name=f'{rack.name}-switch', device_type=self.switch_type, role=self.roles['switch'],
+                site=site, rack=rack, position=42, face='front', tenant=self.tenant
+            )
+            patch_panel = Device(
+                name=f'{rack.name}-patch-panel', device_type=self.patch_panel_type, role=self.roles['patch-panel'],
+                site=site, rack=rack, position=41, face='front', tenant=self.tenant
+            )
+            servers = [
+                Device(
+                    name=f'{rack.name}-server-{i}', device_type=self.server_type, role=self.roles['server'],
+                    site=site, rack=rack, position=i, face='front', tenant=self.tenant
+                )
+                for i in range(1, self.servers_per_rack + 1)
+            ]
+            rack_devices.append((switch, patch_panel, servers))
+            devices.extend((switch, patch_panel, *servers))
+        core_switch = Device(
+            name=f'{name}-core', device_type=self.switch_type, role=self.roles['switch'],
+            site=site, rack=racks[0], position=40, face='front', tenant=self.tenant
+        )
+        core_patch_panel = Device(
+            name=f'{name}-core-patch-panel', device_type=self.patch_panel_type, role=self.roles['patch-panel'],
+            site=site, rack=racks[0], position=39, face='front', tenant=self.tenant
+        )
+        devices.extend((core_switch, core_patch_panel))
+        self.create(Device, devices)
+        components = self.create_components(devices)
+
+        # Server IP addresses
+        ip_addresses = []
+        for rack_network, (switch, patch_panel, servers) in zip(rack_networks, rack_devices):
+            hosts = rack_network.iter_hosts()
+            for server in servers:
+                ip_address = IPAddress(
+                    address=IPNetwork(f'{next(hosts)}/{RACK_PREFIX_LENGTH}'),
+                    assigned_object=components[(server.pk, 'eth0')],
+                    tenant=self.tenant
+                )
+                ip_addresses.append(ip_address)
+                server.primary_ip4 = ip_address
+        self.create(IPAddress, ip_addresses)
+        self.update(Device, [server for _, _, servers in rack_devices for server in servers], ['primary_ip4'])
+
+        # Circuits
+        circuits = self.create(Circuit, [
+            Circuit(
+                cid=f'{name}-circuit-{i}', provider=self.provider, type=self.circuit_type, tenant=self.tenant
+            )
+            for i in range(1, self.circuits_per_site + 1)
+        ])
+        circuit_terminations = []
+        for circuit in circuits:
+            circuit.termination_a = CircuitTermination(circuit=circuit, term_side='A', termination=site)
+            circuit.termination_a.cache_related_objects()
+            circuit_terminations.append(circuit.termination_a)
+        self.create(CircuitTermination, circuit_terminations)
+        self.update(Circuit, circuits, ['termination_a'])
+
+        # Cables: each server connects to its rack's access switch, which is patched through to the core switch.
+        # The core switch connects to each circuit.
+        connections = []
+        for i, (switch, patch_panel, servers) in enumerate(rack_devices):
+            connections.extend(
+                (components[(server.pk, 'eth0')], components[(switch.pk, f'ge-0/0/{j}')])
+                for j, server in enumerate(servers)
+            )
+            connections.extend((
+                (components[(switch.pk, 'xe-0/1/0')], components[(patch_panel.pk, 'Front 1')]),
+                (components[(patch_panel.pk, 'Rear 1')], components[(core_patch_panel.pk, f'Rear {i + 1}')]),
+                (components[(core_patch_panel.pk, f'Front {i + 1}')], components[(core_switch.pk, f'ge-0/0/{i}')]),
+            ))
+        connections.extend(
+            (components[(core_switch.pk, f'xe-0/1/{i}')], termination)
+            for i, termination in enumerate(circuit_terminations)
+        )
+        self.create_cables(connections)
+
+        # Virtual machines
+        if self.vms_per_site:
+            cluster = Cluster(name=f'{name}-cluster', type=self.cluster_type, scope=site, tenant=self.tenant)
+            cluster.cache_related_objects()
+            self.create(Cluster, [cluster])
+            virtual_machines = self.create(VirtualMachine, [
+                VirtualMachine(
+                    name=f'{name}-vm-{i}', cluster=cluster, site=site, role=self.roles['server'],
+                    tenant=self.tenant, vcpus=2, memory=4096, disk=65536
+                )
+                for i in range(1, self.vms_per_site + 1)
+            ])
+            vm_interfaces = self.create(VMInterface, [
+                VMInterface(virtual_machine=vm, name='eth0') for vm in virtual_machines
+            ])
+            self.create(VirtualDisk, [
+                VirtualDisk(virtual_machine=vm, name='disk0', size=65536) for vm in virtual_machines
+            ])
+            hosts = vm_network.iter_hosts()
+            ip_addresses = []
+            for vm, vm_interface in zip(virtual_machines, vm_interfaces):
+                vm.primary_ip4 = IPAddress(
+                    address=IPNetwork(f'{next(hosts)}/{vm_network.prefixlen}'),
+                    assigned_object=vm_interface,
+                    tenant=self.tenant
+                )
+                ip_addresses.append(vm.primary_ip4)
+            self.create(IPAddress, ip_addresses)
+            self.update(VirtualMachine, virtual_machines, ['primary_ip4'])
+
+    def rebuild(self):
+        """
+        Rebuild all data derived from the generated objects, which would otherwise be maintained by signal handlers:
+        cached counters, cable paths, the prefix hierarchy, and the search cache.
+        """
+        for command, args, kwargs in (
+            ('calculate_cached_counts', (), {}),
+            ('trace_paths', (), {'no_input': True}),
+            ('rebuild_prefixes', (), {}),
+            ('reindex', INDEXED_MODELS, {}),
+        ):
+            start_time = time.monotonic()
+            call_command(command, *args, stdout=self.stdout, **kwargs)
+            self.log(f"Completed {command} in {time.monotonic() - start_time:.1f}s")
@@ -0,0 +1,115 @@
+import csv
+
+from django.db.models import QuerySet
+from django.utils.encoding import force_str
+from django_tables2.rows import BoundRow
+
+__all__ = (
+    'EXPORT_CHUNK_SIZE',
+    'StreamingQuerySet',
+    'buffer_content',
+    'iterate_queryset',
+    'stream_table_csv',
+    'stream_yaml',
+)
+
+# The number of objects to retrieve from the database per query while streaming an export
+EXPORT_CHUNK_SIZE = 2000
+
+# The minimum amount of rendered content (in characters) to accumulate before yielding it to the response
+EXPORT_BUFFER_SIZE = 65536
+
+
+class EchoBuffer:
+    """
+    A file-like object which returns the value written to it, enabling a csv.writer to emit rows one at a time.
+    """
+    def write(self, value):
+        return value
+
+
+def iterate_queryset(data, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Iterate over a QuerySet in chunks without caching its results. Any other iterable is returned unaltered.
+    """
+    if isinstance(data, QuerySet):
+        return data.iterator(chunk_size=chunk_size)
+    return data
+
+
+class StreamingQuerySet:
+    """
+    Wrap a QuerySet for rendering within a template, such that iterating over it retrieves objects from the database in
+    chunks rather than caching all of them in memory. Its length is determined by a COUNT query, and all other
+    attributes (e.g. count() or filter()) are those of the QuerySet.
+    """
+    def __init__(self, queryset, chunk_size=EXPORT_CHUNK_SIZE):
+        self.queryset = queryset
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        return self.queryset.iterator(chunk_size=self.chunk_size)
+
+    def __len__(self):
+        return self.queryset.count()
+
+    def __bool__(self):
+        return self.queryset.exists()
+
+    def __getattr__(self, name):
+        return getattr(self.queryset, name)
+
+
+def buffer_content(iterable, size=EXPORT_BUFFER_SIZE):
+    """
+    Coalesce the strings yielded by an iterable into chunks of at least the specified size.
+    """
+    buffer = []
+    length = 0
+    for value in iterable:
+        buffer.append(value)
+        length += len(value)
+        if length >= size:
+            yield ''.join(buffer)
+            buffer = []
+            length = 0
+    if buffer:
+        yield ''.join(buffer)
+
+
+def stream_table_csv(table, exclude_columns=None):
+    """
+    Render the data of a django-tables2 Table as CSV, yielding one row at a time. Unlike the Table's own export
+    functionality, the underlying QuerySet is iterated in chunks rather than being loaded into memory all at once.
+
+    Args:
+        table: The Table instance to export
+        exclude_columns: An iterable of column names to omit from the export
+    """
+    exclude_columns = exclude_columns or ()
+    columns = [
+        column for column in table.columns.iterall()
+        if not (column.column.exclude_from_export or column.name in exclude_columns)
+    ]
+    writer = csv.writer(EchoBuffer())
+
+    # Header row
+    yield writer.writerow([force_str(column.header, strings_only=True) for column in columns])
+
+    # Data rows
+    data = getattr(table.data, 'data', table.data)
+    for record in iterate_queryset(data):
+        row = BoundRow(record, table=table)
+        yield writer.writerow([
+            force_str(row.get_cell_value(column.name), strings_only=True) for column in columns
+        ])
+
+
+def stream_yaml(queryset):
+    """
+    Render a QuerySet of objects as concatenated YAML documents, yielding one object at a time.
+    """
+    for i, obj in enumerate(iterate_queryset(queryset)):
+        if i:
+            yield '---\n'
+        yield obj.to_yaml()
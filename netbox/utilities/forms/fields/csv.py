@@ -1,8 +1,14 @@
+from copy import copy
+
 from django import forms
 from django.utils.translation import gettext_lazy as _
 from django.contrib.contenttypes.models import ContentType
-from django.core.exceptions import MultipleObjectsReturned, ObjectDoesNotExist, FieldError
+from django.core.exceptions import (
+    EmptyResultSet, FieldError, MultipleObjectsReturned, ObjectDoesNotExist, ValidationError,
+)
 from django.db.models import Q
+from django.db.models.lookups import Lookup
+from django.db.models.sql.where import WhereNode
 
 from utilities.choices import unpack_grouped_choices
 from utilities.object_types import object_type_identifier
@@ -14,6 +20,7 @@ __all__ = (
     'CSVModelMultipleChoiceField',
     'CSVMultipleChoiceField',
     'CSVMultipleContentTypeField',
+    'CSVObjectResolver',
     'CSVTypedChoiceField',
 )
 
@@ -56,9 +63,14 @@ class CSVModelChoiceField(forms.ModelChoiceField):
     default_error_messages = {
         'invalid_choice': _('Object not found: %(value)s'),
     }
+    resolver = None
 
     def to_python(self, value):
         try:
+            # Consult the bulk resolver (if one has been attached) before querying for the individual object
+            if self.resolver is not None and value not in self.empty_values:
+                if obj := self.resolver(self, value):
+                    return obj
             return super().to_python(value)
         except MultipleObjectsReturned:
             raise forms.ValidationError(
@@ -121,3 +133,90 @@ class CSVMultipleContentTypeField(forms.ModelMultipleChoiceField):
                 ct_filter |= Q(app_label=app_label, model=model)
             return list(ContentType.objects.filter(ct_filter).values_list('pk', flat=True))
         return object_type_identifier(value)
+
+
+class CSVObjectResolver:
+    """
+    Resolves the related objects referenced by a batch of import records using one query per field (and distinct
+    field queryset), rather than one query per record. Model forms are bound to the resolver by calling `bind()`
+    after any restrictions have been applied to their field querysets.
+
+    Values which cannot be resolved from the batch (for example, references to objects created earlier within the
+    same import) fall back to the field's default per-object lookup.
+
+    Args:
+        records: An iterable of dictionaries mapping field names to raw values
+    """
+    def __init__(self, records):
+        self.values = {}
+        self._cache = {}
+
+        for record in records:
+            for field_name, value in record.items():
+                if type(value) in (str, int) and value != '':
+                    self.values.setdefault(field_name, set()).add(str(value))
+
+    def bind(self, form):
+        """
+        Attach the resolver to all CSVModelChoiceFields on the given form instance.
+        """
+        for field_name, field in form.fields.items():
+            if isinstance(field, CSVModelChoiceField) and field_name in self.values:
+                field.resolver = lambda field, value, field_name=field_name: self.resolve(field_name, field, value)
+
+    @classmethod
+    def _has_simple_filters(cls, node):
+        """
+        Return True if the given WhereNode consists solely of lookups against plain (hashable) values. Subqueries and
+        other expressions do not reliably compare as equal, so queries employing them are keyed by their SQL instead.
+        """
+        for child in node.children:
+            if isinstance(child, WhereNode):
+                if not cls._has_simple_filters(child):
+                    return False
+            elif not isinstance(child, Lookup) or hasattr(child.rhs, 'resolve_expression'):
+                return False
+        try:
+            hash(node)
+        except TypeError:
+            return False
+        return True
+
+    def resolve(self, field_name, field, value):
+        """
+        Return the object referenced by the given value, or None if it cannot be resolved from the batch.
+        """
+        to_field = field.to_field_name or 'pk'
+        if '__' in to_field:
+            return None
+
+        # A field's queryset may be narrowed per record (e.g. to the parent device), so cache results per set of query
+        # filters. Filters comparing fields to plain values are compared directly, to avoid compiling the query to SQL
+        # for each record.
+        where = field.queryset.query.where
+        if self._has_simple_filters(where):
+            key = (field_name, to_field, field.queryset.model, where)
+        else:
+            try:
+                key = (field_name, to_field, str(field.queryset.query))
+            except EmptyResultSet:
+                return None
+
+        if key not in self._cache:
+            lookup = {}
+            try:
+                for obj in field.queryset.filter(**{f'{to_field}__in': self.values[field_name]}):
+                    lookup.setdefault(str(getattr(obj, to_field)), []).append(obj)
+            except (FieldError, TypeError, ValueError, ValidationError):
+                # Invalid values are reported by the per-object lookup
+                lookup = {}
+            self._cache[key] = lookup
+
+        objects = self._cache[key].get(str(value))
+        if not objects:
+            return None
+        if len(objects) > 1:
+            raise MultipleObjectsReturned()
+
+        # Return a copy to avoid sharing a single instance among all of the records referencing it
+        return copy(objects[0])
@@ -8,4 +8,5 @@ def htmx_partial(request):
     Determines whether to render partial (versus complete) HTML content
     in response to an HTMX request, based on the target element.
     """
-    return request.htmx and not request.htmx.boosted
+    htmx = getattr(request, 'htmx', None)
+    return bool(htmx) and not htmx.boosted
@@ -8,6 +8,7 @@ from netbox.config import get_config
 __all__ = (
     'DataFileLoader',
     'render_jinja2',
+    'stream_jinja2',
 )
 
 
@@ -49,9 +50,9 @@ class DataFileLoader(BaseLoader):
 # Utility functions
 #
 
-def render_jinja2(template_code, context, environment_params=None, data_file=None):
+def get_jinja2_template(template_code, environment_params=None, data_file=None):
     """
-    Render a Jinja2 template with the provided context. Return the rendered content.
+    Compile and return a sandboxed Jinja2 Template from the provided template code (or DataFile).
     """
     environment_params = environment_params or {}
 
@@ -69,7 +70,22 @@ def render_jinja2(template_code, context, environment_params=None, data_file=Non
     environment.filters.update(get_config().JINJA2_FILTERS)
 
     if data_file:
-        template = environment.get_template(data_file.path)
-    else:
-        template = environment.from_string(source=template_code)
+        return environment.get_template(data_file.path)
+    return environment.from_string(source=template_code)
+
+
+def render_jinja2(template_code, context, environment_params=None, data_file=None):
+    """
+    Render a Jinja2 template with the provided context. Return the rendered content.
+    """
+    template = get_jinja2_template(template_code, environment_params, data_file)
     return template.render(**context)
+
+
+def stream_jinja2(template_code, context, environment_params=None, data_file=None):
+    """
+    Render a Jinja2 template with the provided context, returning a generator which yields the rendered content
+    incrementally.
+    """
+    template = get_jinja2_template(template_code, environment_params, data_file)
+    return template.generate(**context)
@@ -0,0 +1,79 @@
+import time
+from importlib import import_module
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.http import QueryDict
+
+DEFAULT_MODELS = ('dcim.device', 'dcim.interface', 'ipam.prefix', 'ipam.ipaddress')
+
+
+class Command(BaseCommand):
+    help = "Measure the cost of constructing model FilterSets, with and without their filters cached"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'models',
+            metavar='app_label.ModelName',
+            nargs='*',
+            help=f'The models for which FilterSets are constructed (default: {", ".join(DEFAULT_MODELS)})'
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=100,
+            help='Number of FilterSets to construct per model in each mode (default: 100)'
+        )
+
+    @staticmethod
+    def _get_filterset(model):
+        try:
+            module = import_module(f'{model._meta.app_label}.filtersets')
+            return getattr(module, f'{model.__name__}FilterSet')
+        except (ImportError, AttributeError):
+            raise CommandError(f"No FilterSet found for {model._meta.label}")
+
+    @staticmethod
+    def _clear_cache(filterset_class):
+        for attr in ('_base_filters', '_custom_field_filters'):
+            if attr in filterset_class.__dict__:
+                delattr(filterset_class, attr)
+
+    def _construct(self, filterset_class, iterations, cached):
+        """
+        Construct and bind the FilterSet the specified number of times. Returns the mean duration per FilterSet.
+        """
+        data = QueryDict('q=foo')
+        queryset = filterset_class._meta.model.objects.all()
+        filterset_class(data, queryset)  # Warm up
+
+        duration = 0
+        for _ in range(iterations):
+            if not cached:
+                self._clear_cache(filterset_class)
+            start_time = time.perf_counter()
+            filterset_class(data, queryset).form
+            duration += time.perf_counter() - start_time
+        return duration / iterations
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        if iterations < 1:
+            raise CommandError("Iterations must be a positive integer.")
+
+        for model_label in options['models'] or DEFAULT_MODELS:
+            try:
+                model = apps.get_model(model_label)
+            except (LookupError, ValueError):
+                raise CommandError(f"Invalid model: {model_label}")
+            filterset_class = self._get_filterset(model)
+
+            uncached = self._construct(filterset_class, iterations, cached=False)
+            cached = self._construct(filterset_class, iterations, cached=True)
+            self.stdout.write(
+                f"{filterset_class.__name__}: {len(filterset_class.get_base_filters())} filters, "
+                f"{uncached * 1000:.2f}ms uncached, {cached * 1000:.2f}ms cached per FilterSet "
+                f"({uncached / cached:.1f}x)"
+            )
+
+        self.stdout.write(self.style.SUCCESS('Finished.'))
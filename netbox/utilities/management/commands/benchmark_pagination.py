@@ -0,0 +1,83 @@
+import time
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from netbox.api.pagination import OptionalLimitOffsetPagination
+
+
+class Command(BaseCommand):
+    help = "Compare the cost of walking all objects of a model using offset and keyset (cursor) pagination"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'model',
+            metavar='app_label.ModelName',
+            help='The model to paginate (e.g. dcim.interface)'
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=1000,
+            help='Number of objects per page (default: 1000)'
+        )
+        parser.add_argument(
+            '--pages',
+            type=int,
+            default=None,
+            help='Maximum number of pages to retrieve in each mode (default: all)'
+        )
+
+    def _walk(self, queryset, limit, max_pages, keyset):
+        """
+        Retrieve successive pages of objects until the final page (or the maximum number of pages) is reached. Returns
+        a list of (duration, query count) tuples, one per page.
+        """
+        factory = APIRequestFactory()
+        params = {'limit': limit, 'cursor': 0} if keyset else {'limit': limit, 'offset': 0}
+        pages = []
+
+        while max_pages is None or len(pages) < max_pages:
+            paginator = OptionalLimitOffsetPagination()
+            request = Request(factory.get('/', params))
+            with CaptureQueriesContext(connection) as context:
+                start_time = time.perf_counter()
+                results = paginator.paginate_queryset(queryset, request)
+                pages.append((time.perf_counter() - start_time, len(context.captured_queries)))
+
+            if not results or paginator.get_next_link() is None:
+                break
+            if keyset:
+                params['cursor'] = paginator.next_cursor
+            else:
+                params['offset'] += limit
+
+        return pages
+
+    def _report(self, label, pages):
+        durations = [duration for duration, _ in pages]
+        self.stdout.write(
+            f"{label}: {len(pages)} pages, {sum(durations):.2f}s total, "
+            f"{durations[0] * 1000:.1f}ms first page, {durations[-1] * 1000:.1f}ms last page, "
+            f"{max(durations) * 1000:.1f}ms slowest page, {sum(q for _, q in pages)} queries"
+        )
+
+    def handle(self, *args, **options):
+        try:
+            model = apps.get_model(options['model'])
+        except (LookupError, ValueError):
+            raise CommandError(f"Invalid model: {options['model']}")
+        queryset = model.objects.all()
+        limit = options['limit']
+        if limit < 1:
+            raise CommandError("Limit must be a positive integer.")
+
+        self.stdout.write(f"Walking {model._meta.verbose_name_plural} ({limit} per page)...")
+        self._report('Offset pagination', self._walk(queryset, limit, options['pages'], keyset=False))
+        self._report('Keyset pagination', self._walk(queryset, limit, options['pages'], keyset=True))
+
+        self.stdout.write(self.style.SUCCESS('Finished.'))
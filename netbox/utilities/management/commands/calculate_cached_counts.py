@@ -1,14 +1,30 @@
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
 
+from netbox.jobs import partition_queryset_by_pk
 from netbox.registry import registry
-from utilities.counters import update_counts
+from utilities.counters import update_counts, update_model_counts
 
 
 class Command(BaseCommand):
     help = "Force a recalculation of all cached counter fields"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            help="Recalculate counters for up to this many objects per query (default: all objects at once)"
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help="Number of chunks to recalculate concurrently, each using its own database connection (default: 1)"
+        )
+
     @staticmethod
     def collect_models():
         """
@@ -26,9 +42,45 @@ class Command(BaseCommand):
 
         return models
 
+    @staticmethod
+    def update_chunk(model, mappings, lookups):
+        """
+        Recalculate all counters for a chunk of objects within a worker thread, closing the thread's database connection
+        upon completion.
+        """
+        try:
+            return update_model_counts(model, mappings, **lookups)
+        finally:
+            connection.close()
+
     def handle(self, *model_names, **options):
-        for model, mappings in self.collect_models().items():
-            for field_name, related_query in mappings.items():
-                update_counts(model, field_name, related_query)
+        chunk_size = options['chunk_size']
+        workers = options['workers']
+        if chunk_size is not None and chunk_size < 1:
+            raise CommandError("Chunk size must be a positive integer.")
+        if workers < 1:
+            raise CommandError("Workers must be a positive integer.")
+
+        models = self.collect_models()
+
+        # Recalculate each counter for all objects at once
+        if chunk_size is None and workers == 1:
+            for model, mappings in models.items():
+                for field_name, related_query in mappings.items():
+                    update_counts(model, field_name, related_query)
+
+        # Recalculate all counters of a model together for chunks of objects, concurrently if more than one worker has
+        # been specified. Each object is updated by a single query, so concurrent workers never contend for its row.
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for model, mappings in models.items():
+                    chunks = partition_queryset_by_pk(model.objects.all(), chunk_size) if chunk_size else [{}]
+                    self.stdout.write(f'{model._meta.verbose_name_plural}: {len(chunks)} chunks')
+                    futures = [
+                        executor.submit(self.update_chunk, model, mappings, lookups)
+                        for lookups in chunks
+                    ]
+                    updated = sum(future.result() for future in futures)
+                    self.stdout.write(f'  Recalculated {len(mappings)} counters for {updated} objects')
 
         self.stdout.write(self.style.SUCCESS('Finished.'))
@@ -0,0 +1,73 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.text import slugify
+
+from dcim.models import Region
+from utilities.datasets import DatasetGenerator
+
+
+class Command(BaseCommand):
+    help = "Generate a synthetic dataset of the specified size for benchmarking and capacity planning"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--regions', type=int, default=2,
+            help='Number of regions to create (default: 2)'
+        )
+        parser.add_argument(
+            '--sites-per-region', type=int, default=10,
+            help='Number of sites to create within each region (default: 10)'
+        )
+        parser.add_argument(
+            '--racks-per-site', type=int, default=4,
+            help='Number of racks to create at each site (default: 4)'
+        )
+        parser.add_argument(
+            '--servers-per-rack', type=int, default=10,
+            help='Number of servers to create within each rack (default: 10)'
+        )
+        parser.add_argument(
+            '--circuits-per-site', type=int, default=2,
+            help='Number of circuits to terminate at each site (default: 2)'
+        )
+        parser.add_argument(
+            '--vms-per-site', type=int, default=20,
+            help='Number of virtual machines to create at each site (default: 20)'
+        )
+        parser.add_argument(
+            '--name-prefix', default='synthetic',
+            help='String with which the names of all generated objects are prefixed (default: synthetic)'
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Maximum number of objects to create per query (default: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        name_prefix = options['name_prefix']
+        if Region.objects.filter(slug=slugify(f'{name_prefix}-region-1')).exists():
+            raise CommandError(
+                f"A dataset with the name prefix \"{name_prefix}\" already exists. Specify a different name prefix."
+            )
+        if options['batch_size'] < 1:
+            raise CommandError("Batch size must be a positive integer.")
+
+        try:
+            generator = DatasetGenerator(
+                regions=options['regions'],
+                sites_per_region=options['sites_per_region'],
+                racks_per_site=options['racks_per_site'],
+                servers_per_rack=options['servers_per_rack'],
+                circuits_per_site=options['circuits_per_site'],
+                vms_per_site=options['vms_per_site'],
+                name_prefix=name_prefix,
+                batch_size=options['batch_size'],
+                stdout=self.stdout
+            )
+            counts = generator.generate()
+        except ValueError as e:
+            raise CommandError(e)
+
+        for label, count in sorted(counts.items()):
+            self.stdout.write(f'  {label}: {count}')
+
+        self.stdout.write(self.style.SUCCESS('Finished.'))
@@ -0,0 +1,78 @@
+import json
+import time
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, router, transaction
+
+__all__ = (
+    'PURGE_BATCH_SIZE',
+    'archive_queryset',
+    'purge_queryset',
+)
+
+# The default number of objects to delete per batch
+PURGE_BATCH_SIZE = 10000
+
+
+def archive_queryset(queryset, archive, batch_size=PURGE_BATCH_SIZE):
+    """
+    Write each object matching a QuerySet to a file-like object (in text mode) as a line of JSON, in order of primary
+    key. Returns the number of objects written.
+    """
+    count = 0
+    for record in queryset.order_by('pk').values().iterator(chunk_size=batch_size):
+        archive.write(json.dumps(record, cls=DjangoJSONEncoder) + '\n')
+        count += 1
+    archive.flush()
+    return count
+
+
+def purge_queryset(queryset, batch_size=PURGE_BATCH_SIZE, delay=0, archive=None, callback=None):
+    """
+    Delete all objects matching a QuerySet in batches. Each batch of primary keys is retrieved in ascending order and
+    deleted by a raw DELETE statement within its own short transaction. Unlike QuerySet.delete(), objects are never
+    loaded into memory, and neither cascades nor signals are processed. This should be used only for models which are
+    not referenced by other objects (e.g. ObjectChange or Job).
+
+    Args:
+        queryset: The QuerySet of objects to delete
+        batch_size: The maximum number of objects to delete per transaction
+        delay: The number of seconds to pause between batches (to throttle the load placed on the database)
+        archive: A writable file-like object (in text mode). If specified, each object is written to it as a line of
+            JSON prior to being deleted.
+        callback: A callable to be invoked with the cumulative number of deleted objects after each batch
+
+    Returns:
+        The total number of objects deleted
+    """
+    model = queryset.model
+    using = router.db_for_write(model)
+    connection = connections[using]
+    table = connection.ops.quote_name(model._meta.db_table)
+    pk_column = connection.ops.quote_name(model._meta.pk.column)
+    queryset = queryset.order_by('pk')
+    last_pk = None
+    deleted = 0
+
+    while True:
+        batch = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        pks = list(batch.values_list('pk', flat=True)[:batch_size])
+        if not pks:
+            break
+
+        # Archive the objects prior to their deletion
+        if archive is not None:
+            archive_queryset(model.objects.filter(pk__in=pks), archive, batch_size=batch_size)
+
+        with transaction.atomic(using=using):
+            with connection.cursor() as cursor:
+                cursor.execute(f'DELETE FROM {table} WHERE {pk_column} = ANY(%s)', [pks])
+                deleted += cursor.rowcount
+
+        last_pk = pks[-1]
+        if callback is not None:
+            callback(deleted)
+        if delay and len(pks) == batch_size:
+            time.sleep(delay)
+
+    return deleted
@@ -1,5 +1,6 @@
 from .api import *
 from .base import *
+from .benchmarks import *
 from .filtersets import *
 from .utils import *
 from .views import *
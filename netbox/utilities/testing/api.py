@@ -4,7 +4,9 @@ import json
 import strawberry_django
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -15,8 +17,9 @@ from strawberry.types.union import StrawberryUnion
 from core.choices import ObjectChangeActionChoices
 from core.models import ObjectChange, ObjectType
 from ipam.graphql.types import IPAddressFamilyType
+from netbox.api.exceptions import SerializerNotFound
 from users.models import ObjectPermission, Token, User
-from utilities.api import get_graphql_type_for_model
+from utilities.api import get_graphql_type_for_model, get_serialization_plan, get_serializer_for_model
 from .base import ModelTestCase
 from .utils import disable_logging, disable_warnings
 
@@ -127,6 +130,10 @@ class APIViewTestCases:
 
     class ListObjectsViewTestCase(APITestCase):
         brief_fields = []
+        # The number of additional queries permitted when listing many objects versus one object. If None, this
+        # defaults to the number of relations prefetched for the model's serializer, as a prefetch may be skipped
+        # when no objects are related (or issue one query per type of generic relation).
+        list_query_tolerance = None
 
         @override_settings(EXEMPT_VIEW_PERMISSIONS=['*'], LOGIN_REQUIRED=False)
         def test_list_objects_anonymous(self):
@@ -187,6 +194,48 @@ class APIViewTestCases:
             self.assertHttpStatus(response, status.HTTP_200_OK)
             self.assertEqual(len(response.data['results']), 2)
 
+        def test_list_objects_query_count(self):
+            """
+            GET lists of objects with different page sizes and verify that the number of database queries executed does
+            not grow with the number of objects returned.
+            """
+            self.add_permissions(f'{self.model._meta.app_label}.view_{self.model._meta.model_name}')
+            url = self._get_list_url()
+            object_count = self._get_queryset().count()
+            if object_count < 2:
+                self.skipTest("Test requires the creation of at least two objects")
+
+            # Make an initial request to populate any caches
+            self.assertHttpStatus(self.client.get(url, **self.header), status.HTTP_200_OK)
+
+            with CaptureQueriesContext(connection) as single_page:
+                response = self.client.get(f'{url}?limit=1', **self.header)
+            self.assertHttpStatus(response, status.HTTP_200_OK)
+            self.assertEqual(len(response.data['results']), 1)
+
+            with CaptureQueriesContext(connection) as full_page:
+                response = self.client.get(f'{url}?limit={object_count}', **self.header)
+            self.assertHttpStatus(response, status.HTTP_200_OK)
+            self.assertEqual(len(response.data['results']), object_count)
+
+            tolerance = self.list_query_tolerance
+            if tolerance is None:
+                try:
+                    plan = get_serialization_plan(get_serializer_for_model(self.model))
+                    tolerance = len(plan.prefetch_related)
+                except SerializerNotFound:
+                    tolerance = 0
+            self.assertLessEqual(
+                len(full_page),
+                len(single_page) + tolerance,
+                "Listing {} objects executed {} queries versus {} for a single object:\n{}".format(
+                    object_count,
+                    len(full_page),
+                    len(single_page),
+                    '\n'.join(query['sql'] for query in full_page.captured_queries)
+                )
+            )
+
         @override_settings(EXEMPT_VIEW_PERMISSIONS=['*'])
         def test_options_objects(self):
             """
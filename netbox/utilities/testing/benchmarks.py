@@ -0,0 +1,166 @@
+import json
+import os
+import time
+from collections import defaultdict
+from io import StringIO
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import NoReverseMatch, reverse
+
+from core.models import ObjectType
+from utilities.datasets import DatasetGenerator
+from utilities.views import get_viewname
+from .base import TestCase
+
+__all__ = (
+    'QueryCountBenchmarkTestCase',
+    'seed_dataset',
+)
+
+
+def seed_dataset(scale=1):
+    """
+    Populate the database with a synthetic dataset (see DatasetGenerator) whose size is proportional to `scale`.
+    """
+    generator = DatasetGenerator(
+        sites_per_region=2 * scale,
+        racks_per_site=2,
+        servers_per_rack=3,
+        circuits_per_site=1,
+        vms_per_site=3,
+        name_prefix='benchmark',
+        stdout=StringIO()
+    )
+    generator.generate()
+
+
+class QueryCountBenchmarkTestCase(TestCase):
+    """
+    Base test case for query count benchmarks. Each benchmark is run against a dataset seeded at each scale in
+    `scales`, and at each page size in `page_sizes`. The number of queries executed and the wall time of each request
+    are recorded. A benchmark fails if its query count grows with either the page size or the size of the dataset,
+    which indicates an N+1 query pattern.
+
+    Scales may be overridden by setting the NETBOX_BENCHMARK_SCALES environment variable (e.g. "1,4,16"). If the
+    NETBOX_BENCHMARK_REPORT environment variable is set, the results are appended to the file it specifies as lines of
+    JSON.
+    """
+    scales = (1, 2)
+    page_sizes = (2, 10)  # In ascending order
+
+    def setUp(self):
+        super().setUp()
+        self.user.is_superuser = True
+        self.user.save()
+        self.client.force_login(self.user)
+
+        if scales := os.environ.get('NETBOX_BENCHMARK_SCALES'):
+            self.scales = tuple(int(scale) for scale in scales.split(','))
+
+    @staticmethod
+    def get_models():
+        """
+        Return all public models.
+        """
+        for object_type in ObjectType.objects.public().order_by('app_label', 'model'):
+            if model := object_type.model_class():
+                yield model
+
+    @staticmethod
+    def get_url(model, action, rest_api=False):
+        """
+        Return the URL of a model's view for the given action, or None if no such view exists.
+        """
+        try:
+            return reverse(get_viewname(model, action, rest_api=rest_api))
+        except NoReverseMatch:
+            return None
+
+    def measure(self, url, method='get', **kwargs):
+        """
+        Request the given URL, returning the number of queries executed and the wall time taken. An initial request is
+        made to warm any caches.
+        """
+        getattr(self.client, method)(url, **kwargs)
+        with CaptureQueriesContext(connection) as context:
+            start_time = time.perf_counter()
+            response = getattr(self.client, method)(url, **kwargs)
+            duration = time.perf_counter() - start_time
+        self.assertHttpStatus(response, 200)
+        if method == 'post' and url == reverse('graphql'):
+            self.assertNotIn('errors', response.json(), msg=f"GraphQL errors for {kwargs}")
+        return len(context.captured_queries), duration
+
+    def run_benchmarks(self, get_requests):
+        """
+        Seed the dataset at each scale (within a savepoint, which is rolled back afterward) and measure each request
+        returned by `get_requests`.
+
+        Args:
+            get_requests: A callable which returns an iterable of (name, object_count, request_factory) tuples, where
+                object_count is the number of objects listed (None for single-object views), and request_factory is a
+                callable which accepts a page size and returns a tuple of a URL and keyword arguments for measure()
+        """
+        results = []
+
+        for scale in self.scales:
+            savepoint = transaction.savepoint()
+            seed_dataset(scale)
+            for name, object_count, request_factory in get_requests():
+                # Single-object views are requested only once
+                page_sizes = self.page_sizes if object_count is not None else self.page_sizes[:1]
+                for page_size in page_sizes:
+                    url, kwargs = request_factory(page_size)
+                    query_count, duration = self.measure(url, **kwargs)
+                    results.append({
+                        'name': name,
+                        'scale': scale,
+                        'page_size': page_size,
+                        'object_count': object_count,
+                        'queries': query_count,
+                        'duration': round(duration, 4),
+                    })
+            transaction.savepoint_rollback(savepoint)
+
+        self.write_report(results)
+        self.assertQueryCountsConstant(results)
+
+    def write_report(self, results):
+        if path := os.environ.get('NETBOX_BENCHMARK_REPORT'):
+            with open(path, 'a') as f:
+                for result in results:
+                    f.write(json.dumps({'benchmark': self.id(), **result}) + '\n')
+
+    def assertQueryCountsConstant(self, results):
+        """
+        Fail if the number of queries executed by any request grows with the page size or the size of the dataset.
+        """
+        queries = defaultdict(dict)
+        object_counts = {}
+        for result in results:
+            queries[result['name']][(result['scale'], result['page_size'])] = result['queries']
+            object_counts[(result['name'], result['scale'])] = result['object_count']
+
+        min_scale, max_scale = min(self.scales), max(self.scales)
+        min_page_size, max_page_size = self.page_sizes[0], self.page_sizes[-1]
+        failures = []
+        for name, counts in queries.items():
+            for scale in self.scales:
+                object_count = object_counts[(name, scale)]
+                # Growth with page size can be detected only if the larger page lists additional objects
+                if object_count is None or object_count <= min_page_size:
+                    continue
+                if counts[(scale, max_page_size)] > counts[(scale, min_page_size)]:
+                    failures.append(
+                        f"{name}: {counts[(scale, min_page_size)]} queries for {min_page_size} objects, "
+                        f"{counts[(scale, max_page_size)]} queries for {max_page_size} objects (scale {scale})"
+                    )
+            if counts[(max_scale, min_page_size)] > counts[(min_scale, min_page_size)]:
+                failures.append(
+                    f"{name}: {counts[(min_scale, min_page_size)]} queries at scale {min_scale}, "
+                    f"{counts[(max_scale, min_page_size)]} queries at scale {max_scale}"
+                )
+
+        if failures:
+            self.fail("Query counts grow with the number of objects:\n" + '\n'.join(failures))
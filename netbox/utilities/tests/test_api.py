@@ -4,11 +4,13 @@ from drf_spectacular.drainage import GENERATOR_STATS
 from rest_framework import status
 
 from core.models import ObjectType
+from dcim.api.serializers import SiteSerializer
 from dcim.models import Region, Site
 from extras.choices import CustomFieldTypeChoices
 from extras.models import CustomField
 from ipam.models import VLAN
 from netbox.config import get_config
+from utilities.api import get_serialization_plan
 from utilities.testing import APITestCase, disable_warnings
 
 
@@ -122,6 +124,45 @@ class WritableNestedSerializerTest(APITestCase):
         self.assertEqual(VLAN.objects.count(), 0)
 
 
+class SerializationPlanTestCase(TestCase):
+
+    def test_serialization_plan(self):
+        plan = get_serialization_plan(SiteSerializer)
+
+        # Forward relations are joined; many-to-many relations are prefetched
+        self.assertIn('region', plan.select_related)
+        self.assertIn('tenant', plan.select_related)
+        self.assertIn('tags', plan.prefetch_related)
+        self.assertNotIn('tags', plan.select_related)
+        self.assertIn('circuit_count', [annotation[0] for annotation in plan.annotations])
+
+        # Plans are cached per serializer and set of fields
+        self.assertIs(get_serialization_plan(SiteSerializer), plan)
+        self.assertIsNot(get_serialization_plan(SiteSerializer, ['id', 'name']), plan)
+        self.assertIs(
+            get_serialization_plan(SiteSerializer, ['id', 'name']),
+            get_serialization_plan(SiteSerializer, ('id', 'name'))
+        )
+
+    def test_serialization_plan_fields(self):
+        plan = get_serialization_plan(SiteSerializer, ['id', 'name', 'region'])
+        self.assertEqual(plan.select_related, ('region',))
+        self.assertEqual(plan.prefetch_related, ())
+        self.assertEqual(plan.annotations, ())
+
+    def test_serialization_plan_brief(self):
+        plan = get_serialization_plan(SiteSerializer, brief=True)
+        self.assertIs(plan, get_serialization_plan(SiteSerializer, SiteSerializer.Meta.brief_fields))
+        self.assertEqual(plan.select_related, ())
+        self.assertEqual(plan.prefetch_related, ())
+
+        # Explicitly requested fields take precedence over brief mode
+        self.assertIs(
+            get_serialization_plan(SiteSerializer, ['id', 'region'], brief=True),
+            get_serialization_plan(SiteSerializer, ['id', 'region'])
+        )
+
+
 class APIPaginationTestCase(APITestCase):
     user_permissions = ('dcim.view_site',)
 
@@ -187,6 +228,61 @@ class APIPaginationTestCase(APITestCase):
         self.assertIsNone(response.data['previous'])
         self.assertEqual(len(response.data['results']), 100)
 
+    def test_cursor(self):
+        sites = list(Site.objects.order_by('pk'))
+        cursor = sites[10].pk
+
+        # First page
+        response = self.client.get(f'{self.url}?cursor={cursor}&limit=20', format='json', **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertIsNone(response.data['count'])
+        self.assertIsNone(response.data['previous'])
+        self.assertEqual([s['id'] for s in response.data['results']], [s.pk for s in sites[10:30]])
+        self.assertTrue(response.data['next'].endswith(f'?limit=20&cursor={sites[29].pk + 1}'))
+
+        # Final page
+        response = self.client.get(f'{self.url}?cursor={sites[90].pk}&limit=20', format='json', **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual([s['id'] for s in response.data['results']], [s.pk for s in sites[90:]])
+        self.assertIsNone(response.data['next'])
+
+    def test_cursor_invalid(self):
+        for query in ('cursor=abc', 'cursor=-1', 'cursor=1&offset=10', 'cursor=1&ordering=name'):
+            response = self.client.get(f'{self.url}?{query}', format='json', **self.header)
+            self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+
+    def test_count_strategy_exact(self):
+        response = self.client.get(f'{self.url}?limit=20', format='json', **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 100)
+        self.assertEqual(response['X-Count-Strategy'], 'exact')
+        self.assertIn('X-Count-Time', response)
+
+    def test_count_omitted(self):
+        response = self.client.get(f'{self.url}?limit=20&offset=60&count=false', format='json', **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertIsNone(response.data['count'])
+        self.assertEqual(response['X-Count-Strategy'], 'omitted')
+        self.assertEqual(len(response.data['results']), 20)
+        self.assertTrue(response.data['next'].endswith('?count=false&limit=20&offset=80'))
+
+        # Final page
+        response = self.client.get(f'{self.url}?limit=20&offset=80&count=false', format='json', **self.header)
+        self.assertEqual(len(response.data['results']), 20)
+        self.assertIsNone(response.data['next'])
+
+    @override_settings(API_COUNT_STRATEGIES={'dcim.site': 'cached'})
+    def test_count_strategy_cached(self):
+        response = self.client.get(f'{self.url}?limit=20', format='json', **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 100)
+        self.assertEqual(response['X-Count-Strategy'], 'cached')
+
+        # The cached count is returned for the same query
+        Site.objects.filter(pk__in=Site.objects.values_list('pk', flat=True)[:10]).delete()
+        response = self.client.get(f'{self.url}?limit=20', format='json', **self.header)
+        self.assertEqual(response.data['count'], 100)
+
 
 class APIOrderingTestCase(APITestCase):
     user_permissions = ('dcim.view_site',)
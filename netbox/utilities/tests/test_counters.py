@@ -1,7 +1,10 @@
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from dcim.models import *
+from utilities.counters import batch_counter_updates
 from utilities.testing.base import TestCase
 from utilities.testing.utils import create_test_device
 
@@ -81,6 +84,48 @@ class CountersTest(TestCase):
         self.assertEqual(device1.interface_count, 1)
         self.assertEqual(device2.interface_count, 3)
 
+    def test_interface_count_batch(self):
+        """
+        Counter changes made within a batch should be applied collectively once the batch is complete.
+        """
+        device1, device2 = Device.objects.all()
+
+        with CaptureQueriesContext(connection) as context:
+            with batch_counter_updates():
+                for i in range(5, 9):
+                    Interface.objects.create(device=device1, name=f'Interface {i}')
+                Interface.objects.create(device=device2, name='Interface 9')
+                Interface.objects.get(name='Interface 3').delete()
+
+                # Counters are not updated until the batch is complete
+                device1.refresh_from_db()
+                self.assertEqual(device1.interface_count, 2)
+
+        # A single query should have updated the counter (the net change for device2 is zero)
+        counter_updates = [
+            query for query in context.captured_queries
+            if query['sql'].startswith('UPDATE "dcim_device"') and '"interface_count"' in query['sql']
+        ]
+        self.assertEqual(len(counter_updates), 1)
+        device1.refresh_from_db()
+        device2.refresh_from_db()
+        self.assertEqual(device1.interface_count, 6)
+        self.assertEqual(device2.interface_count, 2)
+
+    def test_parent_deletion(self):
+        """
+        The counters of a deleted object should not be updated as its tracked objects are deleted.
+        """
+        device1 = Device.objects.first()
+
+        with CaptureQueriesContext(connection) as context:
+            device1.delete()
+        self.assertFalse([
+            query for query in context.captured_queries
+            if query['sql'].startswith('UPDATE') and '"interface_count"' in query['sql']
+        ])
+        self.assertFalse(Interface.objects.filter(device_id=device1.pk).exists())
+
     @override_settings(EXEMPT_VIEW_PERMISSIONS=['*'])
     def test_mptt_child_delete(self):
         device1 = Device.objects.first()
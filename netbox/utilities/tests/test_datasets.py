@@ -0,0 +1,70 @@
+from io import StringIO
+
+from django.db.models import Count
+from django.test import TestCase
+from netaddr import IPNetwork
+
+from circuits.models import Circuit
+from dcim.models import Device, Interface, Site
+from ipam.choices import PrefixStatusChoices
+from ipam.models import IPAddress, Prefix
+from utilities.datasets import DatasetGenerator
+from virtualization.models import VirtualMachine
+
+
+class DatasetGeneratorTest(TestCase):
+
+    def test_generate_dataset(self):
+        generator = DatasetGenerator(
+            regions=2,
+            sites_per_region=2,
+            racks_per_site=2,
+            servers_per_rack=3,
+            circuits_per_site=1,
+            vms_per_site=2,
+            stdout=StringIO()
+        )
+        counts = generator.generate()
+
+        self.assertEqual(Site.objects.count(), 4)
+        # Each rack holds a switch, a patch panel, and three servers; each site has a core switch & patch panel
+        self.assertEqual(Device.objects.count(), 4 * (2 * 5 + 2))
+        self.assertEqual(counts['dcim.Device'], Device.objects.count())
+        self.assertEqual(Circuit.objects.filter(termination_a__isnull=False).count(), 4)
+        self.assertEqual(VirtualMachine.objects.filter(primary_ip4__isnull=False).count(), 8)
+
+        # Counters, cable paths, and the prefix hierarchy have been rebuilt
+        server = Device.objects.filter(role__slug='synthetic-server').first()
+        self.assertEqual(server.interface_count, 4)
+        self.assertIsNotNone(server.primary_ip4)
+        interface = Interface.objects.get(device=server, name='eth0')
+        self.assertTrue(interface._path.is_complete)
+        self.assertEqual(interface.connected_endpoints[0].device.role.slug, 'synthetic-switch')
+        uplink = Interface.objects.get(device__name='synthetic-site-1-rack-2-switch', name='xe-0/1/0')
+        self.assertTrue(uplink._path.is_complete)
+        self.assertEqual(uplink.connected_endpoints[0].device.name, 'synthetic-site-1-core')
+        self.assertEqual(Prefix.objects.get(prefix='10.0.0.0/20')._depth, 1)
+
+    def test_generate_multiple_datasets(self):
+        for name_prefix in ('dataset1', 'dataset2'):
+            DatasetGenerator(name_prefix=name_prefix, stdout=StringIO()).generate()
+
+        # Each dataset is allocated distinct prefixes & IP addresses
+        self.assertTrue(Prefix.objects.filter(prefix='10.0.0.0/20', scope_id__isnull=False).exists())
+        self.assertTrue(Prefix.objects.filter(prefix='10.0.16.0/20', scope_id__isnull=False).exists())
+        self.assertFalse(Prefix.objects.order_by().values('prefix').annotate(count=Count('pk')).filter(count__gt=1).exists())
+        self.assertFalse(IPAddress.objects.order_by().values('address').annotate(count=Count('pk')).filter(count__gt=1).exists())
+
+    def test_invalid_topology(self):
+        with self.assertRaises(ValueError):
+            DatasetGenerator(servers_per_rack=100)
+
+    def test_site_networks_within_containers(self):
+        # Shorter prefixes enclosing site networks do not occupy them
+        Prefix.objects.create(prefix='10.0.0.0/8', status=PrefixStatusChoices.STATUS_CONTAINER)
+        Prefix.objects.create(prefix='10.0.0.0/16', status=PrefixStatusChoices.STATUS_CONTAINER)
+        Prefix.objects.create(prefix='10.0.16.0/24')
+        IPAddress.objects.create(address='10.0.32.1/32')
+
+        site_networks = DatasetGenerator(stdout=StringIO()).get_site_networks(2)
+        self.assertEqual(site_networks, [IPNetwork('10.0.0.0/20'), IPNetwork('10.0.48.0/20')])
@@ -5,14 +5,16 @@ from django.test import TestCase
 from mptt.fields import TreeForeignKey
 from taggit.managers import TaggableManager
 
+from core.models import ObjectType
 from dcim.choices import *
 from dcim.fields import MACAddressField
 from dcim.filtersets import DeviceFilterSet, SiteFilterSet, InterfaceFilterSet
 from dcim.models import (
     Device, DeviceRole, DeviceType, Interface, MACAddress, Manufacturer, Platform, Rack, Region, Site
 )
+from extras.choices import CustomFieldTypeChoices
 from extras.filters import TagFilter
-from extras.models import TaggedItem
+from extras.models import CustomField, TaggedItem
 from ipam.filtersets import ASNFilterSet
 from ipam.models import RIR, ASN
 from netbox.filtersets import BaseFilterSet
@@ -623,3 +625,29 @@ class DynamicFilterLookupExpressionTest(TestCase):
         self.assertEqual(InterfaceFilterSet(params, Interface.objects.all()).qs.count(), 5)
         params = {'rf_role__empty': 'false'}
         self.assertEqual(InterfaceFilterSet(params, Interface.objects.all()).qs.count(), 1)
+
+
+class FilterSetCacheTest(TestCase):
+
+    def test_base_filters_cached(self):
+        filterset1 = SiteFilterSet({})
+        filterset2 = SiteFilterSet({})
+        self.assertIs(filterset1.base_filters, filterset2.base_filters)
+        self.assertIn('name__empty', filterset1.filters)
+
+        # Each instance must receive its own copy of each filter
+        self.assertIsNot(filterset1.filters['name'], filterset2.filters['name'])
+        self.assertIs(filterset1.filters['name'].parent, filterset1)
+
+    def test_custom_field_filters(self):
+        self.assertNotIn('cf_cf1', SiteFilterSet({}).filters)
+
+        custom_field = CustomField.objects.create(name='cf1', type=CustomFieldTypeChoices.TYPE_TEXT)
+        custom_field.object_types.set([ObjectType.objects.get_for_model(Site)])
+        filterset = SiteFilterSet({'cf_cf1': 'foo'})
+        self.assertIn('cf_cf1', filterset.filters)
+        self.assertIn('cf_cf1__ic', filterset.filters)
+        self.assertIs(filterset.filters['cf_cf1'].parent, filterset)
+
+        custom_field.delete()
+        self.assertNotIn('cf_cf1', SiteFilterSet({}).filters)
@@ -0,0 +1,35 @@
+import io
+import json
+import uuid
+
+from django.test import TestCase
+
+from core.models import Job
+from utilities.purge import purge_queryset
+
+
+class PurgeQuerySetTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(5):
+            Job.objects.create(name=f'Job {i}', job_id=uuid.uuid4())
+
+    def test_purge_queryset(self):
+        keep = Job.objects.order_by('pk').last()
+        progress = []
+
+        deleted = purge_queryset(Job.objects.exclude(pk=keep.pk), batch_size=2, callback=progress.append)
+        self.assertEqual(deleted, 4)
+        self.assertEqual(progress, [2, 4])
+        self.assertQuerySetEqual(Job.objects.all(), [keep])
+
+    def test_purge_queryset_archive(self):
+        archive = io.StringIO()
+
+        deleted = purge_queryset(Job.objects.all(), batch_size=3, archive=archive)
+        self.assertEqual(deleted, 5)
+        self.assertFalse(Job.objects.exists())
+
+        records = [json.loads(line) for line in archive.getvalue().splitlines()]
+        self.assertEqual([record['name'] for record in records], [f'Job {i}' for i in range(5)])
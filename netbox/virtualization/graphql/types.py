@@ -5,6 +5,7 @@ import strawberry_django
 
 from extras.graphql.mixins import ConfigContextMixin, ContactsMixin
 from ipam.graphql.mixins import IPAddressesMixin, VLANGroupsMixin
+from netbox.graphql.loaders import GenericObjectLoader, get_loader
 from netbox.graphql.scalars import BigInt
 from netbox.graphql.types import OrganizationalObjectType, NetBoxObjectType
 from virtualization import models
@@ -57,13 +58,13 @@ class ClusterType(ContactsMixin, VLANGroupsMixin, NetBoxObjectType):
     devices: List[Annotated["DeviceType", strawberry.lazy('dcim.graphql.types')]]
 
     @strawberry_django.field
-    def scope(self) -> Annotated[Union[
+    def scope(self, info) -> Annotated[Union[
         Annotated["LocationType", strawberry.lazy('dcim.graphql.types')],
         Annotated["RegionType", strawberry.lazy('dcim.graphql.types')],
         Annotated["SiteGroupType", strawberry.lazy('dcim.graphql.types')],
         Annotated["SiteType", strawberry.lazy('dcim.graphql.types')],
     ], strawberry.union("ClusterScopeType")] | None:
-        return self.scope
+        return get_loader(info, GenericObjectLoader, 'scope').load(self)
 
 
 @strawberry_django.type(
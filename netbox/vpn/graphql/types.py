@@ -4,6 +4,7 @@ import strawberry
 import strawberry_django
 
 from extras.graphql.mixins import ContactsMixin, CustomFieldsMixin, TagsMixin
+from netbox.graphql.loaders import GenericObjectLoader, get_loader
 from netbox.graphql.types import ObjectType, OrganizationalObjectType, NetBoxObjectType
 from vpn import models
 from .filters import *
@@ -149,9 +150,9 @@ class L2VPNTerminationType(NetBoxObjectType):
     l2vpn: Annotated["L2VPNType", strawberry.lazy('vpn.graphql.types')]
 
     @strawberry_django.field
-    def assigned_object(self) -> Annotated[Union[
+    def assigned_object(self, info) -> Annotated[Union[
         Annotated["InterfaceType", strawberry.lazy('dcim.graphql.types')],
         Annotated["VLANType", strawberry.lazy('ipam.graphql.types')],
         Annotated["VMInterfaceType", strawberry.lazy('virtualization.graphql.types')],
     ], strawberry.union("L2VPNAssignmentType")]:
-        return self.assigned_object
+        return get_loader(info, GenericObjectLoader, 'assigned_object').load(self)
@@ -3,6 +3,7 @@ from typing import Annotated, List, TYPE_CHECKING, Union
 import strawberry
 import strawberry_django
 
+from netbox.graphql.loaders import GenericObjectLoader, get_loader
 from netbox.graphql.types import OrganizationalObjectType, NetBoxObjectType
 from wireless import models
 from .filters import *
@@ -46,13 +47,13 @@ class WirelessLANType(NetBoxObjectType):
     interfaces: List[Annotated["InterfaceType", strawberry.lazy('dcim.graphql.types')]]
 
     @strawberry_django.field
-    def scope(self) -> Annotated[Union[
+    def scope(self, info) -> Annotated[Union[
         Annotated["LocationType", strawberry.lazy('dcim.graphql.types')],
         Annotated["RegionType", strawberry.lazy('dcim.graphql.types')],
         Annotated["SiteGroupType", strawberry.lazy('dcim.graphql.types')],
         Annotated["SiteType", strawberry.lazy('dcim.graphql.types')],
     ], strawberry.union("WirelessLANScopeType")] | None:
-        return self.scope
+        return get_loader(info, GenericObjectLoader, 'scope').load(self)
 
 
 @strawberry_django.type(